@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Tue Oct 20 10:12:33 2026
+
+@Description: Multi-threaded read/write benchmark for ConfigManager.
+
+    N reader threads read two settings in a hot loop while one writer thread
+    keeps changing both of them together (they always hold the same value).
+    A reader that sees two different values has caught a torn read.
+
+    Three strategies, same workload:
+
+        in-place   the old ConfigManager.set(): mutate the nested dicts
+        locked     in-place, but every read and write takes one global lock
+        snapshot   ConfigManager.update() + config.snapshot() (copy-on-write)
+
+    Reported per strategy: reads/s (all readers), writes/s, torn reads, and
+    how many times the readers' version check fired (snapshot only -- a
+    reader rebuilding derived state only when config.version changed).
+
+    Usage (from ConfigurationFiles/):
+
+        python config_benchmark.py --readers 4 --seconds 2
+"""
+#%%
+import argparse
+import os
+import sys
+import threading
+import time
+
+from config_manager import ConfigManager, thaw
+
+SECTION = 'settings'
+KEYS = ('max_iterations', 'tolerance')
+
+
+def _run_threads(reader, writer, n_readers, seconds):
+    """Run n_readers reader threads and one writer for `seconds`."""
+    stop = threading.Event()
+    counts = [None] * n_readers
+    written = [0]
+
+    def read_loop(i):
+        counts[i] = reader(stop)
+
+    def write_loop():
+        written[0] = writer(stop)
+
+    threads = [threading.Thread(target=read_loop, args=(i,)) for i in range(n_readers)]
+    threads.append(threading.Thread(target=write_loop))
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    reads = sum(c[0] for c in counts)
+    return {
+        'reads_per_s': reads / seconds,
+        'writes_per_s': written[0] / seconds,
+        'torn': sum(c[1] for c in counts),
+        'version_changes': sum(c[2] for c in counts),
+    }
+
+
+def _set_in_place(data, section, key, value):
+    """What ConfigManager.set() used to do."""
+    if section not in data:
+        data[section] = {}
+    data[section][key] = value
+
+
+def bench_in_place(config, n_readers, seconds, lock=None):
+    """The old behaviour: one shared nested dict, mutated key by key."""
+    data = thaw(config.config_data)
+    settings = data.setdefault(SECTION, {})
+    a, b = KEYS
+
+    def reader(stop):
+        reads = torn = 0
+        while not stop.is_set():
+            if lock is None:
+                x, y = settings[a], settings[b]
+            else:
+                with lock:
+                    x, y = settings[a], settings[b]
+            reads += 1
+            torn += x != y
+        return reads, torn, 0
+
+    def writer(stop):
+        i = 0
+        while not stop.is_set():
+            i += 1
+            if lock is None:
+                _set_in_place(data, SECTION, a, i)
+                _set_in_place(data, SECTION, b, i)
+            else:
+                with lock:
+                    _set_in_place(data, SECTION, a, i)
+                    _set_in_place(data, SECTION, b, i)
+        return i
+
+    settings[a] = settings[b] = 0
+    return _run_threads(reader, writer, n_readers, seconds)
+
+
+def bench_snapshot(config, n_readers, seconds):
+    """Copy-on-write: readers take a snapshot, the writer publishes new ones."""
+    a, b = KEYS
+
+    def reader(stop):
+        reads = torn = changes = 0
+        seen = -1
+        while not stop.is_set():
+            snap = config.snapshot()
+            if snap.version != seen:        # cheap change detection
+                seen = snap.version
+                changes += 1
+            settings = snap.data[SECTION]
+            x, y = settings[a], settings[b]
+            reads += 1
+            torn += x != y
+        return reads, torn, changes
+
+    def writer(stop):
+        i = 0
+        while not stop.is_set():
+            i += 1
+            config.update({SECTION: {a: i, b: i}})
+        return i
+
+    config.update({SECTION: {a: 0, b: 0}})
+    return _run_threads(reader, writer, n_readers, seconds)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Readers vs one writer: in-place, locked and snapshot configs.')
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    parser.add_argument('--switch-interval', type=float, default=None,
+                        help='sys.setswitchinterval() in seconds (smaller = more '
+                             'thread switches, more chances to tear)')
+    parser.add_argument('--config', default=os.path.join(os.path.dirname(
+        os.path.abspath(__file__)), 'config.yaml'))
+    args = parser.parse_args(argv)
+
+    if args.switch_interval is not None:
+        sys.setswitchinterval(args.switch_interval)
+
+    results = {
+        'in-place': bench_in_place(ConfigManager(args.config), args.readers, args.seconds),
+        'locked': bench_in_place(ConfigManager(args.config), args.readers, args.seconds,
+                                 lock=threading.Lock()),
+        'snapshot': bench_snapshot(ConfigManager(args.config), args.readers, args.seconds),
+    }
+
+    print(f"\n{args.readers} readers + 1 writer, {args.seconds:g} s each")
+    print(f"{'strategy':<10} {'reads/s':>12} {'writes/s':>12} {'torn reads':>11} "
+          f"{'version changes':>16}")
+    for name, r in results.items():
+        changes = f"{r['version_changes']:>16d}" if name == 'snapshot' else f"{'-':>16}"
+        print(f"{name:<10} {r['reads_per_s']:>12.3e} {r['writes_per_s']:>12.3e} "
+              f"{r['torn']:>11d} {changes}")
+
+
+if __name__ == "__main__":
+    main()
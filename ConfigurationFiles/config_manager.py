@@ -16,9 +16,33 @@ Created on Tue Jun 17 14:41:06 2025
         Maybe you decide later to add validation or **unit conversion**
 
 
+    THREAD SAFETY (copy-on-write snapshots)
+
+    Worker threads read settings while a control thread changes them. The
+    config is therefore never mutated in place:
+
+        - Each version of the config is an immutable ConfigSnapshot (nested
+          read-only mappings + a version number).
+        - Readers grab the current snapshot reference -- no lock. Everything
+          they read from that one snapshot is mutually consistent, however
+          long they hold it.
+        - Writers (serialized by a writer-only lock) copy just the top level
+          and the sections they change; untouched sections are shared with
+          the previous snapshot. The new snapshot is published with a single
+          reference assignment, which is atomic.
+        - snapshot.version increases by one per publish, so a consumer can
+          cache anything derived from the config and rebuild it only when
+          `config.version` changes.
+
+    Benchmark:  python config_benchmark.py --readers 4
+
 """
 #%%
 import os
+import threading
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
+
 try:
     import yaml
     YAML_AVAILABLE = True
@@ -26,10 +50,55 @@ except ImportError:
     YAML_AVAILABLE = False
 
 
+def freeze(value):
+    """Deep read-only copy: dicts -> MappingProxyType, lists -> tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """Inverse of freeze(): plain dicts and lists again (e.g. for yaml.dump)."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+class ConfigSnapshot(NamedTuple):
+    """One immutable version of the config."""
+    data: Mapping[str, Mapping[str, Any]]
+    version: int
+
+    def get(self, section, key, default=None):
+        return self.data.get(section, {}).get(key, default)
+
+
 class ConfigManager:
     def __init__(self, config_file='config.yaml'):
         self.config_file = config_file
-        self.config_data = self.load_config()
+        self._write_lock = threading.Lock()     # writers only; readers never lock
+        self._snapshot = ConfigSnapshot(freeze(self.load_config() or {}), 0)
+
+    @property
+    def config_data(self):
+        """The current config, read-only. Use set()/update() to change it."""
+        return self._snapshot.data
+
+    @property
+    def version(self):
+        """Increases by one every time a new snapshot is published."""
+        return self._snapshot.version
+
+    def snapshot(self):
+        """
+        The current ConfigSnapshot. Hold on to it to read several values
+        that must be consistent with each other.
+        """
+        return self._snapshot
 
     def load_config(self):
         if os.path.exists(self.config_file):
@@ -43,13 +112,38 @@ class ConfigManager:
         if not YAML_AVAILABLE:
             raise ImportError("PyYAML not installed")
         with open(self.config_file, 'w') as f:
-            yaml.dump(self.config_data, f, default_flow_style=False)
+            yaml.dump(thaw(self._snapshot.data), f, default_flow_style=False)
+
+    def update(self, changes):
+        """
+        Apply {section: {key: value}} changes as ONE new snapshot, so readers
+        see either all of them or none.
+
+        Returns:
+            int: version of the published snapshot
+        """
+        with self._write_lock:
+            current = self._snapshot
+            data = dict(current.data)           # shares every section...
+            for section, values in changes.items():
+                merged = dict(data.get(section, {}))    # ...except the ones changed
+                merged.update((key, freeze(value)) for key, value in values.items())
+                data[section] = MappingProxyType(merged)
+            new = ConfigSnapshot(MappingProxyType(data), current.version + 1)
+            self._snapshot = new                # atomic publish
+        return new.version
+
+    def reload(self):
+        """Re-read the config file and publish it as a new snapshot."""
+        data = freeze(self.load_config() or {})
+        with self._write_lock:
+            new = ConfigSnapshot(data, self._snapshot.version + 1)
+            self._snapshot = new
+        return new.version
 
     def set(self, section, key, value):
-        """Set a configuration value and optionally save"""
-        if section not in self.config_data:
-            self.config_data[section] = {}
-        self.config_data[section][key] = value
+        """Set a configuration value (publishes a new snapshot)"""
+        return self.update({section: {key: value}})
 
     def set_and_save(self, section, key, value):
         """Set a value and immediately save to file"""
@@ -59,15 +153,15 @@ class ConfigManager:
 
     def get_path(self, key):
         """Get a file path from the config"""
-        return self.config_data['paths'][key]
+        return self._snapshot.data['paths'][key]
 
     def get_setting(self, key):
         """Get a setting value"""
-        return self.config_data['settings'][key]
+        return self._snapshot.data['settings'][key]
 
     def get_engine_param(self, key):
         """Get an engine parameter"""
-        return self.config_data['engine_parameters'][key]
+        return self._snapshot.data['engine_parameters'][key]
 
 # Create a global instance that your scripts can import
 config = ConfigManager()
\ No newline at end of file
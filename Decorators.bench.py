@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Tue Oct 20 11:05:41 2026
+
+@Description: Call overhead of @profiled (Decorators.py).
+
+    Kept out of Decorators.py so importing the decorators doesn't need
+    bench.py or register the benchmark's profiled functions.
+
+        python bench.py run Decorators.bench.py
+"""
+#%%
+from bench import benchmark
+from Decorators import profiled, set_profiling
+
+
+def _work(a, b=1):
+    return a + b
+
+_work_profiled = profiled(_work, name='bench._work')
+_work_sampled = profiled(_work, name='bench._work[sample=100]', sample=100)
+
+
+_CALLS = range(100)
+
+
+@benchmark(ops=len(_CALLS))
+def bench_bare_call():
+    for _ in _CALLS:
+        _work(1, b=2)
+
+
+@benchmark(ops=len(_CALLS))
+def bench_profiled():
+    for _ in _CALLS:
+        _work_profiled(1, b=2)
+
+
+@benchmark(ops=len(_CALLS))
+def bench_profiled_sample_100():
+    for _ in _CALLS:
+        _work_sampled(1, b=2)
+
+
+@benchmark(ops=len(_CALLS))
+def bench_profiled_disabled():
+    set_profiling(False)
+    for _ in _CALLS:
+        _work_profiled(1, b=2)
+    set_profiling(True)
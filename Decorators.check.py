@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Wed Oct 21 09:14:26 2026
+
+@Description: Regression checks for the memoize decorators (Decorators.py).
+
+        python Decorators.check.py
+"""
+#%%
+import os
+
+import numpy as np
+
+os.environ.setdefault('DECORATORS_PROFILE_REPORT', '0')
+from Decorators import approx_size, lfu_cache, memoize  # noqa: E402
+
+
+def check_lfu_admits_new_keys():
+    """Once every entry is hot, a new key still gets cached (by count)."""
+    calls = []
+
+    @lfu_cache(maxsize=2)
+    def f(x):
+        calls.append(x)
+        return x
+
+    for x in (1, 1, 2, 2, 3, 3):
+        f(x)
+    assert calls == [1, 2, 3], calls
+    assert f.cache_info().currsize == 2
+
+
+def check_lfu_admits_new_keys_by_bytes():
+    """Same sequence, bounded by maxbytes instead of maxsize."""
+    calls = []
+    result = b'x' * 1000
+
+    @lfu_cache(maxsize=None, maxbytes=2 * approx_size(result))
+    def f(x):
+        calls.append(x)
+        return result
+
+    for x in (1, 1, 2, 2, 3, 3):
+        f(x)
+    assert calls == [1, 2, 3], calls
+    assert f.cache_info().currsize == 2
+
+
+def check_array_keys():
+    """0-d and 1-element arrays are different keys; object arrays work."""
+
+    @memoize
+    def shape(a):
+        return a.shape
+
+    assert shape(np.array(3.0)) == ()
+    assert shape(np.array([3.0])) == (1,)
+    assert shape(np.array([[3.0]])) == (1, 1)
+
+    @memoize
+    def first(a):
+        return a[0]
+
+    assert first(np.array(['a', None], dtype=object)) == 'a'
+    assert first(np.array(['b', None], dtype=object)) == 'b'
+    assert first.cache_info().misses == 2
+
+    try:
+        first(np.array([lambda: 0], dtype=object))
+    except TypeError as e:
+        assert 'unhashable argument' in str(e)
+    else:
+        raise AssertionError('unpicklable object array was accepted')
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith('check_'):
+            check()
+            print(f'ok  {name}')
@@ -3,10 +3,29 @@
 @author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
 Created on Tue May 27 16:38:02 2025
 
-@Description:
+@Description: Shared decorators.
+
+    my_decorator   -- the basic "wrap a function" example
+    profiled       -- low-overhead call-count / latency-histogram profiler
+    memoize        -- bounded LRU / LFU / TTL result cache (numpy-array args,
+                      byte budget, optional disk tier); lru_cache, lfu_cache
+                      and ttl_cache are shorthands
 
 """
 #%%
+import atexit
+import collections
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+import time
+
+
 def my_decorator(func):
     def wrapper():
         print("Before the function is called")
@@ -18,6 +37,596 @@ def my_decorator(func):
 def say_hello_world():
     print("Hello World!")
 
-x = my_decorator(say_hello_world)
 
-x()
\ No newline at end of file
+#%% PROFILING DECORATOR
+"""
+    @profiled                        # every call timed
+    def evaluate_engine(case): ...
+
+    @profiled(sample=100)            # 1 in 100 calls timed, all counted
+    def inner_loop_helper(x): ...
+
+    print(profile_report())          # or export_profile('profile.json')
+
+WHAT IT RECORDS (per function, in a process-wide registry)
+    calls          every call, sampled or not
+    sampled        calls that were actually timed
+    total/min/max  of the sampled latencies
+    histogram      sampled latencies in power-of-2 nanosecond buckets
+                   (bucket b holds 2**(b-1) <= ns < 2**b), which is enough for
+                   p50/p90/p99 to within a factor of 2 at a fixed 64 ints of
+                   memory -- no per-call list that grows forever.
+
+TURNING IT OFF
+    set_profiling(False)      at runtime: wrappers stay, so each call still
+                              pays one extra (wrapper) frame + a flag check.
+    DECORATORS_PROFILE=0      in the environment, BEFORE import: @profiled
+                              returns the function untouched -- exactly a
+                              bare call.
+
+AT EXIT
+    If anything was recorded, the report is printed at interpreter exit
+    (DECORATORS_PROFILE_REPORT=0 to silence it), and written as JSON to
+    $DECORATORS_PROFILE_EXPORT if that's set.
+
+Counters are updated without a lock (a lost increment under heavy threading
+is acceptable for profiling); only registering a new function takes one.
+
+Overhead benchmark:   python bench.py run Decorators.bench.py
+"""
+
+_PROFILE_AT_IMPORT = os.environ.get('DECORATORS_PROFILE', '1') != '0'
+_profiling_enabled = _PROFILE_AT_IMPORT
+_registry = {}
+_registry_lock = threading.Lock()
+N_BUCKETS = 64
+
+
+class FunctionStats:
+    """Aggregated call statistics for one profiled function."""
+
+    __slots__ = ('name', 'calls', 'sampled', 'total_ns', 'min_ns', 'max_ns',
+                 'histogram')
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.sampled = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.histogram = [0] * N_BUCKETS
+
+    def add(self, ns):
+        self.sampled += 1
+        self.total_ns += ns
+        if self.min_ns is None or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.histogram[min(ns.bit_length(), N_BUCKETS - 1)] += 1
+
+    def percentile(self, q):
+        """Upper bound (ns) on the q-th percentile, from the histogram."""
+        if not self.sampled:
+            return None
+        target = q / 100 * self.sampled
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return min(1 << bucket, self.max_ns)
+        return self.max_ns
+
+    @property
+    def mean_ns(self):
+        return self.total_ns / self.sampled if self.sampled else None
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'sampled': self.sampled,
+            'total_ns': self.total_ns,
+            'mean_ns': self.mean_ns,
+            'min_ns': self.min_ns,
+            'max_ns': self.max_ns,
+            'p50_ns': self.percentile(50),
+            'p90_ns': self.percentile(90),
+            'p99_ns': self.percentile(99),
+            'histogram': self.histogram,
+        }
+
+
+def _get_stats(name):
+    stats = _registry.get(name)
+    if stats is None:
+        with _registry_lock:
+            stats = _registry.setdefault(name, FunctionStats(name))
+    return stats
+
+
+def profiled(func=None, *, name=None, sample=1):
+    """
+    Count calls and record a latency histogram for the decorated function.
+
+    Arguments, return values and exceptions pass straight through, and
+    functools.wraps keeps the name, docstring and signature.
+
+    Args:
+        func (callable): Function to profile.
+        name (str, optional): Registry key. Default is module.qualname.
+        sample (int, optional): Time only 1 in `sample` calls (all calls
+            are still counted). Default is 1 (time every call).
+
+    Returns:
+        callable: the wrapper (or func itself if DECORATORS_PROFILE=0).
+
+    Raises:
+        ValueError: If sample < 1.
+    """
+    if sample < 1:
+        raise ValueError(f"sample must be >= 1 (got {sample})")
+
+    def decorate(f):
+        if not _PROFILE_AT_IMPORT:
+            return f
+        stats = _get_stats(name or f'{f.__module__}.{f.__qualname__}')
+        clock = time.perf_counter_ns
+
+        if sample == 1:
+            @functools.wraps(f)
+            def wrapper(*args, **kwargs):
+                if not _profiling_enabled:
+                    return f(*args, **kwargs)
+                stats.calls += 1
+                t0 = clock()
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    stats.add(clock() - t0)
+        else:
+            @functools.wraps(f)
+            def wrapper(*args, **kwargs):
+                if not _profiling_enabled:
+                    return f(*args, **kwargs)
+                stats.calls += 1
+                if stats.calls % sample:
+                    return f(*args, **kwargs)
+                t0 = clock()
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    stats.add(clock() - t0)
+
+        wrapper.profile_stats = stats
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def set_profiling(enabled):
+    """Globally turn recording on/off for every @profiled function."""
+    global _profiling_enabled
+    _profiling_enabled = bool(enabled)
+
+
+def reset_profile():
+    """Forget everything recorded so far (registered functions stay)."""
+    with _registry_lock:
+        for key, stats in _registry.items():
+            fresh = FunctionStats(key)
+            for attr in FunctionStats.__slots__:
+                setattr(stats, attr, getattr(fresh, attr))
+
+
+def profile_stats():
+    """{name: dict of stats} for every function that has been called."""
+    return {key: s.to_dict() for key, s in sorted(_registry.items()) if s.calls}
+
+
+def _fmt_ns(ns):
+    if ns is None:
+        return '-'
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+        if ns >= scale:
+            return f'{ns / scale:.2f} {unit}'
+    return f'{ns:.0f} ns'
+
+
+def profile_report():
+    """Human-readable table of the registry, slowest total time first."""
+    rows = sorted(profile_stats().values(), key=lambda r: r['total_ns'], reverse=True)
+    if not rows:
+        return 'No profiled calls recorded.'
+    width = max(len(r['name']) for r in rows)
+    lines = [f"{'function':<{width}} {'calls':>10} {'sampled':>9} {'mean':>10} "
+             f"{'p50<':>10} {'p99<':>10} {'max':>10}"]
+    for r in rows:
+        lines.append(f"{r['name']:<{width}} {r['calls']:>10d} {r['sampled']:>9d} "
+                     f"{_fmt_ns(r['mean_ns']):>10} {_fmt_ns(r['p50_ns']):>10} "
+                     f"{_fmt_ns(r['p99_ns']):>10} {_fmt_ns(r['max_ns']):>10}")
+    return '\n'.join(lines)
+
+
+def export_profile(path):
+    """Write profile_stats() to a JSON file."""
+    with open(path, 'w') as f:
+        json.dump(profile_stats(), f, indent=2)
+
+
+@atexit.register
+def _report_at_exit():
+    if not profile_stats():
+        return
+    export_path = os.environ.get('DECORATORS_PROFILE_EXPORT')
+    if export_path:
+        export_profile(export_path)
+    if os.environ.get('DECORATORS_PROFILE_REPORT', '1') != '0':
+        print('\n' + profile_report())
+
+
+#%% MEMOIZATION DECORATORS
+"""
+    @memoize(maxsize=256)                        # LRU, 256 entries
+    def engine_performance(pc, mr): ...
+
+    @lfu_cache(maxbytes=512 * 2**20)             # LFU, ~512 MB of results
+    def nozzle_map(area_ratios): ...             # area_ratios: np.ndarray
+
+    @ttl_cache(ttl=600, thread_safe=True, disk_dir='.cache/tables')
+    def load_table(path): ...
+
+    engine_performance.cache_info()   # hits, misses, evictions, sizes, ...
+    engine_performance.cache_clear()  # (disk=True also wipes the disk tier)
+
+WHY NOT functools.lru_cache?
+    No TTL, no LFU, only an entry count (one 1 GB array counts the same as a
+    float), no way in for numpy arrays (unhashable), no persistence and only
+    hits/misses in its stats.
+
+POLICIES  (what gets evicted when maxsize / maxbytes is exceeded)
+    'lru'   least recently used                      -- recency matters
+    'lfu'   least frequently used, LRU among ties    -- a few hot keys
+    'ttl'   LRU, plus entries expire `ttl` seconds after they were stored
+            (ttl= also works with 'lru'/'lfu')
+
+KEYS
+    Arguments are turned into a hashable key: lists/tuples/dicts/sets are
+    converted recursively and numpy arrays are hashed by dtype, shape and
+    a BLAKE2 digest of their bytes. Hashing an array is O(nbytes) -- cheap
+    next to an expensive evaluation, but don't memoize trivial functions of
+    huge arrays.
+
+SIZES
+    maxbytes uses an APPROXIMATE result size: ndarray.nbytes, len() of
+    bytes/str, sys.getsizeof for everything else (containers recursively).
+    A result bigger than maxbytes on its own is returned but not cached.
+
+DISK TIER  (disk_dir=...)
+    Every computed result is also pickled to disk_dir (write-through). A
+    memory miss checks the disk before recomputing, so results survive
+    evictions AND restarts. Files are keyed by a hash of the function's
+    qualified name + arguments, so change the name (or clear the directory)
+    if the function's code changes. The disk tier is not size-bounded.
+
+THREAD SAFETY  (thread_safe=True)
+    Cache bookkeeping runs under a lock; the function itself runs outside
+    it, so two threads missing on the same key may both compute it.
+"""
+
+try:
+    import numpy as _np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'expirations', 'disk_hits',
+                  'currsize', 'currbytes', 'maxsize', 'maxbytes', 'policy'])
+
+_MISSING = object()
+
+
+def _freeze(obj):
+    """Recursively turn an argument into something hashable."""
+    if NUMPY_AVAILABLE and isinstance(obj, _np.ndarray):
+        if obj.dtype.hasobject:
+            # No raw bytes to hash (they're pointers): hash the pickled elements
+            try:
+                data = pickle.dumps(obj.tolist(), protocol=4)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                raise TypeError(f"unhashable argument: object-dtype ndarray ({e})") from None
+        else:
+            data = _np.ascontiguousarray(obj).view(_np.uint8)
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        # shape from obj itself: ascontiguousarray() turns 0-d into (1,)
+        return ('__ndarray__', obj.dtype.str, obj.shape, digest)
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__, tuple(_freeze(o) for o in obj))
+    if isinstance(obj, dict):
+        return ('__dict__', tuple(sorted((k, _freeze(v)) for k, v in obj.items())))
+    if isinstance(obj, (set, frozenset)):
+        return ('__set__', frozenset(_freeze(o) for o in obj))
+    return obj
+
+
+def _make_key(args, kwargs):
+    key = tuple(_freeze(a) for a in args)
+    if kwargs:
+        key += ('__kwargs__',) + tuple(sorted((k, _freeze(v)) for k, v in kwargs.items()))
+    return key
+
+
+def approx_size(obj, _depth=0):
+    """Approximate memory footprint of a cached result, in bytes."""
+    if NUMPY_AVAILABLE and isinstance(obj, _np.ndarray):
+        return obj.nbytes + 112
+    if isinstance(obj, (bytes, bytearray, str)):
+        return sys.getsizeof(obj)
+    size = sys.getsizeof(obj)
+    if _depth < 3:
+        if isinstance(obj, dict):
+            size += sum(approx_size(k, _depth + 1) + approx_size(v, _depth + 1)
+                        for k, v in obj.items())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            size += sum(approx_size(o, _depth + 1) for o in obj)
+    return size
+
+
+class _Entry:
+    __slots__ = ('value', 'size', 'expires', 'freq')
+
+    def __init__(self, value, size, expires):
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.freq = 1
+
+
+class _MemoryCache:
+    """
+    Bounded in-memory store implementing the LRU / LFU eviction policies.
+
+    LRU keeps one OrderedDict in recency order. LFU keeps one OrderedDict
+    per use count (each in recency order) plus the current minimum count,
+    so get/put/evict are all O(1).
+    """
+
+    def __init__(self, policy, maxsize, maxbytes, ttl):
+        self.policy = 'lfu' if policy == 'lfu' else 'lru'
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.clear()
+
+    def clear(self):
+        self.entries = {}
+        self.order = collections.OrderedDict()                     # lru
+        self.freqs = collections.defaultdict(collections.OrderedDict)  # lfu
+        self.min_freq = 0
+        self.nbytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _touch(self, key, entry):
+        if self.policy == 'lru':
+            self.order.move_to_end(key)
+            return
+        bucket = self.freqs[entry.freq]
+        del bucket[key]
+        if not bucket:
+            del self.freqs[entry.freq]
+            if self.min_freq == entry.freq:
+                self.min_freq += 1
+        entry.freq += 1
+        self.freqs[entry.freq][key] = None
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self.nbytes -= entry.size
+        if self.policy == 'lru':
+            del self.order[key]
+        else:
+            bucket = self.freqs[entry.freq]
+            del bucket[key]
+            if not bucket:
+                del self.freqs[entry.freq]
+        return entry
+
+    def _victim(self):
+        if self.policy == 'lru':
+            return next(iter(self.order))
+        if self.min_freq not in self.freqs:
+            self.min_freq = min(self.freqs)
+        return next(iter(self.freqs[self.min_freq]))
+
+    def get(self, key, now):
+        entry = self.entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry.expires is not None and now >= entry.expires:
+            self._remove(key)
+            self.expirations += 1
+            return _MISSING
+        self._touch(key, entry)
+        return entry.value
+
+    def put(self, key, value, size, expires):
+        if key in self.entries:
+            self._remove(key)
+        if self.maxsize == 0 or (self.maxbytes is not None and size > self.maxbytes):
+            return
+
+        # Make room first: the new key must not be its own victim (under LFU
+        # it would be the only use-count-1 entry once the rest are hot).
+        while self.entries and (
+                (self.maxsize is not None and len(self.entries) >= self.maxsize)
+                or (self.maxbytes is not None and self.nbytes + size > self.maxbytes)):
+            self._remove(self._victim())
+            self.evictions += 1
+
+        entry = _Entry(value, size, expires)
+        self.entries[key] = entry
+        self.nbytes += size
+        if self.policy == 'lru':
+            self.order[key] = None
+        else:
+            self.freqs[1][key] = None
+            self.min_freq = 1
+
+
+class _DiskCache:
+    """Write-through pickle store: one file per key under `directory`."""
+
+    def __init__(self, directory, namespace):
+        self.directory = directory
+        self.namespace = namespace
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        blob = pickle.dumps((self.namespace, key), protocol=4)
+        return os.path.join(self.directory, hashlib.sha256(blob).hexdigest() + '.pkl')
+
+    def get(self, key):
+        """(value, expires) or _MISSING. Expiry is wall-clock (time.time())."""
+        try:
+            with open(self._path(key), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return _MISSING
+
+    def put(self, key, value, expires):
+        path = self._path(key)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                pickle.dump((value, expires), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)      # atomic: readers never see half a file
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.pkl'):
+                os.remove(os.path.join(self.directory, name))
+
+
+def memoize(func=None, *, policy='lru', maxsize=128, maxbytes=None, ttl=None,
+            thread_safe=False, disk_dir=None):
+    """
+    Cache a pure function's results with a bounded eviction policy.
+
+    Args:
+        func (callable): Function to cache.
+        policy (str, optional): 'lru', 'lfu' or 'ttl'. Default is 'lru'.
+        maxsize (int, optional): Max cached entries; None for no entry
+            limit. Default is 128.
+        maxbytes (int, optional): Max approximate bytes of cached results;
+            None for no byte limit. Default is None.
+        ttl (float, optional): Seconds an entry stays valid. Required for
+            policy='ttl', optional for the others. Default is None.
+        thread_safe (bool, optional): Lock the cache bookkeeping. Default
+            is False.
+        disk_dir (str, optional): Directory for the write-through disk
+            tier. Default is None (memory only).
+
+    Returns:
+        callable: wrapper with .cache_info(), .cache_clear(disk=False) and
+            .cache_parameters().
+
+    Raises:
+        ValueError: For an unknown policy, policy='ttl' without ttl, or no
+            bound at all (maxsize and maxbytes both None).
+    """
+    if policy not in ('lru', 'lfu', 'ttl'):
+        raise ValueError(f"Unknown policy '{policy}' (expected 'lru', 'lfu' or 'ttl')")
+    if policy == 'ttl' and ttl is None:
+        raise ValueError("policy='ttl' needs ttl=<seconds>")
+    if maxsize is None and maxbytes is None:
+        raise ValueError("Need maxsize and/or maxbytes -- use functools.cache "
+                         "for an unbounded cache")
+
+    def decorate(f):
+        memory = _MemoryCache(policy, maxsize, maxbytes, ttl)
+        disk_cache = (_DiskCache(disk_dir, f'{f.__module__}.{f.__qualname__}')
+                      if disk_dir else None)
+        lock = threading.RLock() if thread_safe else contextlib.nullcontext()
+        stats = {'hits': 0, 'misses': 0, 'disk_hits': 0}
+        clock = time.monotonic
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            with lock:
+                value = memory.get(key, clock())
+                if value is not _MISSING:
+                    stats['hits'] += 1
+                    return value
+
+            if disk_cache is not None:
+                stored = disk_cache.get(key)
+                if stored is not _MISSING:
+                    value, expires_wall = stored
+                    remaining = None if expires_wall is None else expires_wall - time.time()
+                    if remaining is None or remaining > 0:
+                        with lock:
+                            stats['disk_hits'] += 1
+                            memory.put(key, value, approx_size(value),
+                                       None if remaining is None else clock() + remaining)
+                        return value
+
+            value = f(*args, **kwargs)
+            with lock:
+                stats['misses'] += 1
+                memory.put(key, value, approx_size(value),
+                           None if ttl is None else clock() + ttl)
+            if disk_cache is not None:
+                disk_cache.put(key, value, None if ttl is None else time.time() + ttl)
+            return value
+
+        def cache_info():
+            with lock:
+                return CacheInfo(stats['hits'], stats['misses'], memory.evictions,
+                                 memory.expirations, stats['disk_hits'],
+                                 len(memory.entries), memory.nbytes, maxsize,
+                                 maxbytes, policy)
+
+        def cache_clear(disk=False):
+            with lock:
+                memory.clear()
+                stats.update(hits=0, misses=0, disk_hits=0)
+                if disk and disk_cache is not None:
+                    disk_cache.clear()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_parameters = lambda: {
+            'policy': policy, 'maxsize': maxsize, 'maxbytes': maxbytes, 'ttl': ttl,
+            'thread_safe': thread_safe, 'disk_dir': disk_dir}
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def lru_cache(func=None, **kwargs):
+    """memoize(policy='lru', ...)"""
+    return memoize(func, policy='lru', **kwargs)
+
+
+def lfu_cache(func=None, **kwargs):
+    """memoize(policy='lfu', ...)"""
+    return memoize(func, policy='lfu', **kwargs)
+
+
+def ttl_cache(func=None, *, ttl, **kwargs):
+    """memoize(policy='ttl', ttl=ttl, ...)"""
+    return memoize(func, policy='ttl', ttl=ttl, **kwargs)
+
+
+if __name__ == "__main__":
+    x = my_decorator(say_hello_world)
+
+    x()
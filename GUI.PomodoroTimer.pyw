@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Wed Oct 21 13:40:55 2026
+
+@Description: Low-wakeup Pomodoro timer (PyQt6), see GUI.PomodoroTimer.txt.
+
+    The tutorial timers call after(1000, tick) (or sleep(1) in a loop) and
+    decrement a counter: the process wakes up at least once a second all
+    day long, even minimized, and every late tick adds to the drift.
+
+    Here:
+        DEADLINE     each phase ends at time.monotonic() + duration; the
+                     display is always deadline - now, so late wakeups are
+                     never accumulated (zero drift over any session length).
+        ONE TIMER    a single single-shot QTimer, re-armed for the NEXT
+                     VISIBLE CHANGE only:
+                        visible    -> next whole second of the countdown
+                        minimized  -> next whole minute (taskbar title)
+                        hidden     -> the end of the phase, nothing else
+                     Display ticks use Qt's coarse timer type (the OS may
+                     batch them with other wakeups); the phase end is
+                     precise.
+        MEASURED     --measure SECONDS runs headless-ish and prints timer
+                     wakeups/min, context switches/min and CPU ms/min,
+                     optionally against the naive 100 ms poll (--naive).
+
+    Usage:
+
+        pythonw GUI.PomodoroTimer.pyw                    (no console)
+        python GUI.PomodoroTimer.pyw --measure 120 --minimized
+        python GUI.PomodoroTimer.pyw --measure 120 --naive
+"""
+#%%
+import argparse
+import math
+import sys
+import time
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (QApplication, QHBoxLayout, QLabel, QPushButton,
+                             QVBoxLayout, QWidget)
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:             # Windows
+    RESOURCE_AVAILABLE = False
+
+WORK_MIN = 25
+SHORT_BREAK_MIN = 5
+LONG_BREAK_MIN = 15
+WORKS_PER_LONG_BREAK = 4
+
+
+class PomodoroTimer(QObject):
+    """
+    Deadline-based Pomodoro cycle, with no UI.
+
+    Args:
+        work (float, optional): Work phase length [min]. Default is 25.
+        short_break (float, optional): Short break [min]. Default is 5.
+        long_break (float, optional): Long break [min]. Default is 15.
+        works_per_long_break (int, optional): Default is 4.
+
+    Signals:
+        tick(float): remaining seconds, emitted only at visible changes.
+        phaseFinished(str): name of the phase that just ended.
+
+    Attributes:
+        wakeups (int): Times the timer woke the event loop.
+        granularity (float): Seconds between display updates, or None for
+            "phase end only". Set with set_granularity().
+    """
+    tick = pyqtSignal(float)
+    phaseFinished = pyqtSignal(str)
+
+    MARGIN = 0.06       # of a display step, > Qt's 5% coarse-timer slack
+
+    def __init__(self, work=WORK_MIN, short_break=SHORT_BREAK_MIN,
+                 long_break=LONG_BREAK_MIN, works_per_long_break=WORKS_PER_LONG_BREAK,
+                 parent=None):
+        super().__init__(parent)
+        self.durations = {'work': 60.0 * work, 'short break': 60.0 * short_break,
+                          'long break': 60.0 * long_break}
+        self.works_per_long_break = works_per_long_break
+        self.phase = 'work'
+        self.completed_works = 0
+        self.granularity = 1.0
+        self.wakeups = 0
+
+        self._deadline = None                     # monotonic; None = paused
+        self._remaining = self.durations['work']  # valid while paused
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+    # --- state -----------------------------------------------------------------
+
+    @property
+    def running(self):
+        return self._deadline is not None
+
+    def remaining(self):
+        if self._deadline is None:
+            return self._remaining
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def start(self):
+        if self.running:
+            return
+        self._deadline = time.monotonic() + self._remaining
+        self._schedule()
+
+    def pause(self):
+        if not self.running:
+            return
+        self._remaining = self.remaining()
+        self._deadline = None
+        self._timer.stop()
+        self.tick.emit(self._remaining)
+
+    def reset(self):
+        self._timer.stop()
+        self._deadline = None
+        self._remaining = self.durations[self.phase]
+        self.tick.emit(self._remaining)
+
+    def skip(self):
+        was_running = self.running
+        self._timer.stop()
+        self._advance()
+        self._deadline = None
+        if was_running:
+            self.start()
+        else:
+            self.tick.emit(self._remaining)
+
+    def set_granularity(self, seconds):
+        """Display update interval: 1 (visible), 60 (minimized), None (hidden)."""
+        self.granularity = seconds
+        if self.running:
+            self._schedule()
+
+    # --- scheduling ------------------------------------------------------------
+
+    def _schedule(self):
+        """Arm the one timer for the next visible change (or the phase end)."""
+        remaining = self.remaining()
+        step = self.granularity
+        target = 0.0
+        if step is not None:
+            # The display rounds up, so it changes when the countdown drops
+            # below the next multiple of `step`. Aim a little past that
+            # crossing: a coarse timer may fire up to 5% early or late and
+            # the display must still be right when it does.
+            target = step * (math.ceil(remaining / step) - 1) - self.MARGIN * step
+        delay = remaining - max(target, 0.0)
+
+        at_deadline = target <= 0.0
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer if at_deadline
+                                 else Qt.TimerType.CoarseTimer)
+        self._timer.start(max(int(math.ceil(1e3 * delay)), 0))
+
+    def _on_timeout(self):
+        self.wakeups += 1
+        remaining = self.remaining()
+        if remaining <= 0.0:
+            finished = self.phase
+            self._advance()
+            # Chain from the old deadline, not from now: a late wakeup
+            # mustn't make the next phase end late too.
+            self._deadline += self._remaining
+            self.phaseFinished.emit(finished)
+            remaining = self._remaining
+        self.tick.emit(remaining)
+        self._schedule()
+
+    def _advance(self):
+        if self.phase == 'work':
+            self.completed_works += 1
+            long_break = self.completed_works % self.works_per_long_break == 0
+            self.phase = 'long break' if long_break else 'short break'
+        else:
+            self.phase = 'work'
+        self._remaining = self.durations[self.phase]
+
+
+def format_remaining(seconds, granularity=1.0):
+    if granularity and granularity >= 60:
+        return f"{math.ceil(seconds / 60):d} min"
+    seconds = math.ceil(seconds)
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class PomodoroWindow(QWidget):
+    """Small Pomodoro window that slows its own updates when not visible."""
+
+    def __init__(self, timer=None):
+        super().__init__()
+        self.timer = timer or PomodoroTimer(parent=self)
+
+        self.phase_label = QLabel(alignment=Qt.AlignmentFlag.AlignCenter)
+        self.time_label = QLabel(alignment=Qt.AlignmentFlag.AlignCenter)
+        font = QFont()
+        font.setPointSize(40)
+        self.time_label.setFont(font)
+
+        self.start_button = QPushButton('Start')
+        self.start_button.clicked.connect(self.toggle)
+        reset_button = QPushButton('Reset')
+        reset_button.clicked.connect(self.timer.reset)
+        skip_button = QPushButton('Skip')
+        skip_button.clicked.connect(self.timer.skip)
+
+        buttons = QHBoxLayout()
+        for b in (self.start_button, reset_button, skip_button):
+            buttons.addWidget(b)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.phase_label)
+        layout.addWidget(self.time_label)
+        layout.addLayout(buttons)
+
+        self.timer.tick.connect(self.update_display)
+        self.timer.phaseFinished.connect(self.on_phase_finished)
+        self.update_display(self.timer.remaining())
+
+    def toggle(self):
+        if self.timer.running:
+            self.timer.pause()
+        else:
+            self.timer.start()
+        self.start_button.setText('Pause' if self.timer.running else 'Start')
+
+    def update_display(self, remaining):
+        text = format_remaining(remaining, self.timer.granularity)
+        self.phase_label.setText(f"{self.timer.phase.capitalize()}  "
+                                 f"(#{self.timer.completed_works + 1})")
+        self.time_label.setText(format_remaining(remaining))
+        self.setWindowTitle(f"{text} - {self.timer.phase}")
+
+    def on_phase_finished(self, phase):
+        QApplication.beep()
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    # Visibility -> update rate
+    def _update_granularity(self):
+        if not self.isVisible():
+            self.timer.set_granularity(None)
+        elif self.isMinimized():
+            self.timer.set_granularity(60.0)
+        else:
+            self.timer.set_granularity(1.0)
+            self.update_display(self.timer.remaining())
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == event.Type.WindowStateChange:
+            self._update_granularity()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_granularity()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._update_granularity()
+
+
+# =============================================================================
+# Wakeup measurement
+# =============================================================================
+
+class NaivePoller(QObject):
+    """The tutorial approach: poll every `interval_ms`, whatever is on screen."""
+
+    def __init__(self, timer, interval_ms=100, parent=None):
+        super().__init__(parent)
+        self.wakeups = 0
+        self._timer = timer
+        self._poll = QTimer(self, interval=interval_ms)
+        self._poll.timeout.connect(self._on_poll)
+
+    def start(self):
+        self._poll.start()
+
+    def _on_poll(self):
+        self.wakeups += 1
+        self._timer.tick.emit(self._timer.remaining())
+
+
+def _context_switches():
+    if not RESOURCE_AVAILABLE:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_nvcsw + usage.ru_nivcsw
+
+
+def measure_wakeups(seconds, minimized=False, naive=False, work_min=WORK_MIN):
+    """
+    Run the timer for `seconds` and count what it cost.
+
+    Returns:
+        dict: "timer_wakeups", "context_switches" (None on Windows) and
+            "cpu_ms", each per minute, plus "drift_ms": the time elapsed on
+            an independent monotonic clock minus the time the timer accounts
+            for (phases it finished + progress in the current one).
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = PomodoroWindow(PomodoroTimer(work=work_min))
+    window.show()
+    if minimized:
+        window.showMinimized()
+    app.processEvents()
+
+    counter = window.timer
+    if naive:
+        window.timer.set_granularity(None)      # only the poller updates
+        counter = NaivePoller(window.timer)
+        counter.start()
+
+    finished = []                               # durations of completed phases
+    window.timer.phaseFinished.connect(
+        lambda phase: finished.append(window.timer.durations[phase]))
+
+    t_start = time.monotonic()
+    window.timer.start()
+    cpu0, ctx0, wakeups0 = time.process_time(), _context_switches(), counter.wakeups
+    QTimer.singleShot(int(1e3 * seconds), app.quit)
+    app.exec()
+
+    elapsed = time.monotonic() - t_start
+    per_min = 60.0 / elapsed
+    ctx1 = _context_switches()
+    timer = window.timer
+    timer_elapsed = sum(finished) + timer.durations[timer.phase] - timer.remaining()
+    out = {
+        'timer_wakeups': (counter.wakeups - wakeups0) * per_min,
+        'context_switches': None if ctx0 is None else (ctx1 - ctx0) * per_min,
+        'cpu_ms': 1e3 * (time.process_time() - cpu0) * per_min,
+        'drift_ms': 1e3 * (elapsed - timer_elapsed),
+    }
+    window.close()
+    return out
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Low-wakeup Pomodoro timer.')
+    parser.add_argument('--work', type=float, default=WORK_MIN, help='work minutes')
+    parser.add_argument('--measure', type=float, metavar='SECONDS',
+                        help='run for SECONDS and report wakeups per minute')
+    parser.add_argument('--minimized', action='store_true',
+                        help='(--measure) run minimized')
+    parser.add_argument('--naive', action='store_true',
+                        help='(--measure) poll every 100 ms like the tutorials')
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        r = measure_wakeups(args.measure, args.minimized, args.naive, args.work)
+        ctx = 'n/a' if r['context_switches'] is None else f"{r['context_switches']:.0f}"
+        print(f"timer wakeups/min: {r['timer_wakeups']:.1f}   "
+              f"context switches/min: {ctx}   CPU ms/min: {r['cpu_ms']:.2f}   "
+              f"drift: {r['drift_ms']:+.1f} ms")
+        sys.exit()
+
+    app = QApplication(sys.argv)
+    window = PomodoroWindow(PomodoroTimer(work=args.work))
+    window.show()
+    sys.exit(app.exec())
@@ -140,3 +140,26 @@ w = Window()
 w.show()
 
 app.exec()
+
+
+# %% Scales to thousands of icons: virtualized model/view picker
+
+# Standard + theme + resource icons in a QListView; only the visible ones
+# are rendered (bounded pixmap cache), with incremental search.
+# See icon_picker.py -- `python icon_picker.py --exit-after-paint` (and
+# `--eager` for the button grid above) prints the time to first paint.
+
+import sys
+
+from PyQt6.QtWidgets import QApplication
+
+from icon_picker import IconPicker
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+w = IconPicker()
+w.iconSelected.connect(lambda name, icon: print(name))
+w.resize(900, 600)
+w.show()
+
+app.exec()
@@ -1,4 +1,35 @@
+"""
+Undo/redo with QUndoStack -- plus what it takes to survive long sessions.
+
+    A QUndoStack of MyUndoCommand closures has no limit: dragging a
+    schematic node pushes one command per mouse-move event, and every one
+    of them is kept forever. Three fixes, usable together:
+
+        MERGING      MoveNodeCommand has an id(); consecutive moves of the
+                     same node are folded into one command by mergeWith(),
+                     so a 200-step drag is ONE undo step (as users expect).
+        BYTE BUDGET  BudgetedUndoStack has the QUndoStack push/undo/redo
+                     interface but evicts the OLDEST commands once their
+                     estimated size exceeds `max_bytes` (QUndoStack only
+                     has a count limit, settable on an empty stack).
+        SNAPSHOT     For commands that change a big state object, StateHistory
+                     stores zlib-compressed deltas (only the changed keys)
+                     and a full compressed snapshot every `snapshot_every`
+                     commits; StateCommand undo/redo replays from it.
+
+    Stress benchmark (10^5 commands):
+
+        python GUI.UndoRedo.py --bench 100000
+"""
+import argparse
+import os
+import pickle
 import sys
+import time
+import tracemalloc
+import zlib
+
+from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QUndoStack, QUndoCommand
 
 class MyUndoCommand(QUndoCommand):
@@ -13,11 +44,403 @@ class MyUndoCommand(QUndoCommand):
     def redo(self):
         self._redo_function()
 
+    def byte_size(self):
+        # Closures are opaque; count the functions and what they captured.
+        # Captured containers are skipped: they're normally the document
+        # being edited (shared by every command), not per-command history.
+        size = 0
+        for fn in (self._undo_function, self._redo_function):
+            size += sys.getsizeof(fn)
+            for cell in getattr(fn, '__closure__', None) or ():
+                if not isinstance(cell.cell_contents, (dict, list, set)):
+                    size += sys.getsizeof(cell.cell_contents)
+        return size
+
+
+#%% MERGEABLE COMMANDS
+class MoveNodeCommand(QUndoCommand):
+    """
+    Move one node; consecutive moves of the same node merge into one step.
+
+    Args:
+        positions (dict): node id -> (x, y), edited in place.
+        node (hashable): Node being moved.
+        new_pos (tuple): Position after the move.
+        old_pos (tuple, optional): Position before the move. Default is the
+            current position in `positions`.
+    """
+    ID = 1
+
+    def __init__(self, positions, node, new_pos, old_pos=None):
+        super().__init__(f'Move {node}')
+        self._positions = positions
+        self._node = node
+        self._old = positions[node] if old_pos is None else old_pos
+        self._new = new_pos
+
+    def id(self):
+        return self.ID
+
+    def mergeWith(self, other):
+        if other.id() != self.id() or other._node != self._node:
+            return False
+        self._new = other._new          # keep our old position, take theirs
+        self.setObsolete(self._new == self._old)
+        return True
+
+    def redo(self):
+        self._positions[self._node] = self._new
+
+    def undo(self):
+        self._positions[self._node] = self._old
+
+    def byte_size(self):
+        return 64 + sys.getsizeof(self._old) + sys.getsizeof(self._new)
+
+
+#%% BYTE-BUDGETED STACK
+class BudgetedUndoStack(QObject):
+    """
+    QUndoStack work-alike that drops the oldest history past a byte budget.
+
+    Command size comes from cmd.byte_size() when defined (MyUndoCommand,
+    MoveNodeCommand and StateCommand all have one), else `default_size`.
+    Merging follows QUndoStack: a pushed command is offered to the top
+    command's mergeWith() when both have the same id() != -1.
+
+    Args:
+        max_bytes (int, optional): Budget for the whole history. Default is
+            8 MB. The newest command is always kept, whatever its size.
+        default_size (int, optional): Size assumed for commands without
+            byte_size(). Default is 256.
+        low_water (float, optional): When over budget, evict down to this
+            fraction of max_bytes. Default is 0.9.
+
+    Signals:
+        indexChanged(int), canUndoChanged(bool), canRedoChanged(bool),
+        evicted(int) -- number of commands dropped by the last push.
+    """
+    indexChanged = pyqtSignal(int)
+    canUndoChanged = pyqtSignal(bool)
+    canRedoChanged = pyqtSignal(bool)
+    evicted = pyqtSignal(int)
+
+    def __init__(self, max_bytes=8 * 2**20, default_size=256, low_water=0.9,
+                 parent=None):
+        super().__init__(parent)
+        self.max_bytes = max_bytes
+        self.default_size = default_size
+        self.low_water = low_water
+        self._commands = []
+        self._sizes = []
+        self._index = 0
+        self.total_bytes = 0
+        self.evictions = 0
+        self.merges = 0
+
+    def _size(self, cmd):
+        byte_size = getattr(cmd, 'byte_size', None)
+        return byte_size() if byte_size is not None else self.default_size
+
+    def _emit(self, can_undo, can_redo):
+        self.indexChanged.emit(self._index)
+        if can_undo != self.canUndo():
+            self.canUndoChanged.emit(self.canUndo())
+        if can_redo != self.canRedo():
+            self.canRedoChanged.emit(self.canRedo())
+
+    def push(self, cmd):
+        can_undo, can_redo = self.canUndo(), self.canRedo()
+        cmd.redo()
+
+        # Pushing discards anything that could have been redone
+        del self._commands[self._index:]
+        self.total_bytes -= sum(self._sizes[self._index:])
+        del self._sizes[self._index:]
+
+        top = self._commands[-1] if self._commands else None
+        if (top is not None and cmd.id() != -1 and top.id() == cmd.id()
+                and top.mergeWith(cmd)):
+            self.merges += 1
+            if top.isObsolete():
+                self._commands.pop()
+                self.total_bytes -= self._sizes.pop()
+            else:
+                size = self._size(top)
+                self.total_bytes += size - self._sizes[-1]
+                self._sizes[-1] = size
+        else:
+            self._commands.append(cmd)
+            size = self._size(cmd)
+            self._sizes.append(size)
+            self.total_bytes += size
+
+        n_evicted = 0
+        if self.total_bytes > self.max_bytes:
+            # Evict down to the low-water mark in one go, so a full stack
+            # doesn't pay for an eviction on every single push.
+            target = self.low_water * self.max_bytes
+            while self.total_bytes > target and len(self._commands) - n_evicted > 1:
+                self.total_bytes -= self._sizes[n_evicted]
+                n_evicted += 1
+            # A lone command over the whole budget is kept (and not discarded)
+            if n_evicted:
+                self._discard(self._commands[n_evicted - 1])
+            del self._commands[:n_evicted]
+            del self._sizes[:n_evicted]
+        self.evictions += n_evicted
+
+        self._index = len(self._commands)
+        self._emit(can_undo, can_redo)
+        if n_evicted:
+            self.evicted.emit(n_evicted)
+
+    @staticmethod
+    def _discard(cmd):
+        # Tell the newest evicted command it was the oldest one (StateCommand
+        # trims its history); redo-tail commands are simply dropped.
+        discard = getattr(cmd, 'discard', None)
+        if discard is not None:
+            discard()
+
+    def undo(self):
+        if not self.canUndo():
+            return
+        can_undo, can_redo = self.canUndo(), self.canRedo()
+        self._index -= 1
+        self._commands[self._index].undo()
+        self._emit(can_undo, can_redo)
+
+    def redo(self):
+        if not self.canRedo():
+            return
+        can_undo, can_redo = self.canUndo(), self.canRedo()
+        self._commands[self._index].redo()
+        self._index += 1
+        self._emit(can_undo, can_redo)
+
+    def canUndo(self):
+        return self._index > 0
+
+    def canRedo(self):
+        return self._index < len(self._commands)
+
+    def index(self):
+        return self._index
+
+    def count(self):
+        return len(self._commands)
+
+    def command(self, index):
+        return self._commands[index]
+
+    def clear(self):
+        can_undo, can_redo = self.canUndo(), self.canRedo()
+        self._commands, self._sizes = [], []
+        self._index = self.total_bytes = 0
+        self._emit(can_undo, can_redo)
+
+
+#%% SNAPSHOT + DELTA STATE HISTORY
+class _Missing:
+    """Marks an absent key in a delta. Pickles by name, so it stays a singleton."""
+    def __repr__(self):
+        return '<missing>'
+
+    def __reduce__(self):
+        return '_MISSING'
+
+_MISSING = _Missing()
+
+
+def _same(a, b):
+    """Default StateHistory equality: `==`, but an ambiguous result (NumPy arrays) counts as changed."""
+    if a is b:
+        return True
+    try:
+        return bool(a == b)
+    except (ValueError, TypeError):
+        return False
+
+
+class StateHistory:
+    """
+    Compressed history of a dict-like state object.
+
+    Record 0 (and every `snapshot_every`-th record) is a full zlib-pickled
+    snapshot; the rest are deltas {key: (old, new)} of the keys that
+    changed. Moving between adjacent states applies one delta; jumping
+    further restores the nearest snapshot and replays forward.
+
+    Args:
+        state (dict): Live state object, edited in place.
+        snapshot_every (int, optional): Records between snapshots. Default
+            is 64.
+        level (int, optional): zlib compression level. Default is 1 (fast).
+        equal (callable, optional): equal(old, new) -> bool; keys whose new
+            value is equal are left out of the delta. Default `==`, with
+            ambiguous results (NumPy arrays) counted as a change.
+    """
+
+    def __init__(self, state, snapshot_every=64, level=1, equal=_same):
+        self.state = state
+        self.snapshot_every = snapshot_every
+        self.level = level
+        self.equal = equal
+        self._records = {0: self._pack(('snapshot', dict(state)))}
+        self._first = 0
+        self._last = 0
+        self.current = 0
+
+    def _pack(self, record):
+        return zlib.compress(pickle.dumps(record, pickle.HIGHEST_PROTOCOL), self.level)
+
+    @staticmethod
+    def _unpack(blob):
+        return pickle.loads(zlib.decompress(blob))
+
+    def commit(self, changes):
+        """
+        Apply `changes` ({key: new value}) and record them; a value of
+        `_MISSING` deletes the key.
+
+        Returns:
+            int: index of the new state.
+        """
+        self.restore(self._last)
+        delta = {}
+        for k, v in changes.items():
+            old = self.state.get(k, _MISSING)
+            if old is v:
+                continue
+            if old is _MISSING or v is _MISSING or not self.equal(old, v):
+                delta[k] = (old, v)
+        self._apply(delta, forward=True)
+        self._last += 1
+        if self._last % self.snapshot_every == 0:
+            self._records[self._last] = self._pack(('snapshot', dict(self.state), delta))
+        else:
+            self._records[self._last] = self._pack(('delta', delta))
+        self.current = self._last
+        return self._last
+
+    def _apply(self, delta, forward):
+        for key, (old, new) in delta.items():
+            value = new if forward else old
+            if value is _MISSING:
+                self.state.pop(key, None)
+            else:
+                self.state[key] = value
+
+    def _delta(self, i):
+        record = self._unpack(self._records[i])
+        return record[-1] if i != self._first else {}
+
+    def restore(self, i):
+        """Put the live state into recorded state `i`."""
+        if not self._first <= i <= self._last:
+            raise IndexError(f"state {i} not in history [{self._first}, {self._last}]")
+        if abs(i - self.current) > self.snapshot_every:
+            base = self._base(i)
+            self.state.clear()
+            self.state.update(self._unpack(self._records[base])[1])
+            self.current = base
+        while self.current < i:
+            self.current += 1
+            self._apply(self._delta(self.current), forward=True)
+        while self.current > i:
+            self._apply(self._delta(self.current), forward=False)
+            self.current -= 1
+
+    def truncate(self, i):
+        """Forget states after `i` (a new commit after undoing)."""
+        for j in range(i + 1, self._last + 1):
+            del self._records[j]
+        self._last = i
+        self.current = min(self.current, i)
+
+    def trim(self, i):
+        """Forget states before `i`; state `i` becomes the base snapshot."""
+        if i <= self._first:
+            return
+        if self.current < i:
+            self.restore(i)
+        snapshot = self.state_at(i)
+        delta = self._delta(i)
+        for j in range(self._first, i):
+            del self._records[j]
+        self._records[i] = self._pack(('snapshot', snapshot, delta))
+        self._first = i
+
+    def _base(self, i):
+        """Nearest snapshot record at or before i."""
+        if i - self._first < self.snapshot_every:
+            return self._first
+        return max(self._first, i - i % self.snapshot_every)
+
+    def state_at(self, i):
+        """Copy of recorded state `i`, leaving the live state alone."""
+        if i == self.current:
+            return dict(self.state)
+        base = self._base(i)
+        state = self._unpack(self._records[base])[1]
+        for j in range(base + 1, i + 1):
+            for key, (_, new) in self._delta(j).items():
+                if new is _MISSING:
+                    state.pop(key, None)
+                else:
+                    state[key] = new
+        return state
+
+    def record_size(self, i):
+        return len(self._records[i])
+
+    @property
+    def nbytes(self):
+        return sum(len(blob) for blob in self._records.values())
+
+
+class StateCommand(QUndoCommand):
+    """
+    Undoable change of a StateHistory's state (stored as a compressed delta).
+
+    Args:
+        history (StateHistory): History to commit to.
+        changes (dict): key -> new value.
+        text (str, optional): Undo text.
+    """
+
+    def __init__(self, history, changes, text='Edit'):
+        super().__init__(text)
+        self._history = history
+        self._changes = changes
+        self._index = None
+
+    def redo(self):
+        if self._index is None:         # first redo() == the push itself
+            self._history.truncate(self._history.current)
+            self._index = self._history.commit(self._changes)
+            self._changes = None        # the history holds it now
+        else:
+            self._history.restore(self._index)
+
+    def undo(self):
+        self._history.restore(self._index - 1)
+
+    def byte_size(self):
+        return 64 + (self._history.record_size(self._index) if self._index else 0)
+
+    def discard(self):
+        # Evicted as the oldest command: nothing before it is reachable now.
+        if self._index is not None and self._index > self._history._first:
+            self._history.trim(self._index)
+
+
 class MyApplication(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        self.undo_stack = QUndoStack()
+        self.undo_stack = BudgetedUndoStack(max_bytes=8 * 2**20)
 
         self.initUI()
 
@@ -35,7 +458,136 @@ class MyApplication(QMainWindow):
         self.setWindowTitle('Undo/Redo Example')
         self.show()
 
+
+#%% STRESS BENCHMARK
+def _drag_session(n, nodes=100, steps_per_drag=50):
+    """n mouse-move micro-edits: drags of `steps_per_drag` steps on random nodes."""
+    for i in range(n):
+        node = (i // steps_per_drag) * 7919 % nodes
+        yield node, (float(i % steps_per_drag), float(i))
+
+
+def _run(make_stack, make_command, edits):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    stack = make_stack()
+    for edit in edits:
+        stack.push(make_command(*edit))
+    push_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    while stack.canUndo():
+        stack.undo()
+    while stack.canRedo():
+        stack.redo()
+    replay_time = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'commands': stack.count(), 'push': push_time, 'replay': replay_time,
+            'peak': peak}
+
+
+def stress_benchmark(n=100_000, budget=256 * 2**10, state_keys=256):
+    """
+    Push n commands through each variant, then undo and redo all of them.
+
+    Memory is the tracemalloc peak, i.e. the Python side only (the C++
+    half of each QUndoCommand comes on top of that).
+
+    Returns:
+        dict: variant -> commands kept, push / replay time, peak bytes.
+    """
+    out = {}
+
+    # --- node drags -----------------------------------------------------------
+    def closure_command(node, pos, positions):
+        old = positions.get(node)
+
+        def undo():
+            positions[node] = old
+
+        def redo():
+            positions[node] = pos
+        return MyUndoCommand(f'Move {node}', undo, redo)
+
+    positions = {node: (0.0, 0.0) for node in range(100)}
+    out['closures / QUndoStack'] = _run(
+        QUndoStack, lambda node, pos: closure_command(node, pos, positions),
+        _drag_session(n))
+
+    positions = {node: (0.0, 0.0) for node in range(100)}
+    out['merged / QUndoStack'] = _run(
+        QUndoStack, lambda node, pos: MoveNodeCommand(positions, node, pos),
+        _drag_session(n))
+
+    positions = {node: (0.0, 0.0) for node in range(100)}
+    out[f'closures / budget {budget // 1024} kB'] = _run(
+        lambda: BudgetedUndoStack(budget),
+        lambda node, pos: closure_command(node, pos, positions),
+        _drag_session(n))
+
+    positions = {node: (0.0, 0.0) for node in range(100)}
+    out[f'merged / budget {budget // 1024} kB'] = _run(
+        lambda: BudgetedUndoStack(budget),
+        lambda node, pos: MoveNodeCommand(positions, node, pos),
+        _drag_session(n))
+
+    # --- state-heavy edits (one key of a big state per command) --------------
+    n_state = n // 10           # full copies of the state don't fit 10^5 times
+    edits = [(f'k{i * 31 % state_keys}', i) for i in range(n_state)]
+
+    state = {f'k{i}': i for i in range(state_keys)}
+
+    def full_copy_command(key, value):
+        old, new = dict(state), dict(state)
+        new[key] = value
+        return MyUndoCommand('Edit', lambda: (state.clear(), state.update(old)),
+                             lambda: (state.clear(), state.update(new)))
+    out[f'full state x{n_state} / QUndoStack'] = _run(QUndoStack, full_copy_command, edits)
+
+    state = {f'k{i}': i for i in range(state_keys)}
+    history = StateHistory(state)
+    out[f'snapshot+delta x{n_state} / QUndoStack'] = _run(
+        QUndoStack, lambda key, value: StateCommand(history, {key: value}), edits)
+
+    state = {f'k{i}': i for i in range(state_keys)}
+    history = StateHistory(state)
+    out[f'snapshot+delta x{n_state} / budget {budget // 1024} kB'] = _run(
+        lambda: BudgetedUndoStack(budget),
+        lambda key, value: StateCommand(history, {key: value}), edits)
+
+    # --- one command bigger than the whole budget ----------------------------
+    # Kept as the only undo step; undo must still reach the state before it.
+    state = {'blob': b''}
+    history = StateHistory(state)
+    out[f'oversized x1 / budget {budget // 1024} kB'] = _run(
+        lambda: BudgetedUndoStack(budget),
+        lambda key, value: StateCommand(history, {key: value}),
+        [('blob', os.urandom(2 * budget))])
+    assert history.state_at(0) == {'blob': b''}, 'oversized command trimmed its own undo state'
+    return out
+
+
+def print_benchmark(n, budget):
+    out = stress_benchmark(n, budget)
+    print(f"\n{'variant':<40} {'commands':>9} {'peak [MB]':>10} "
+          f"{'push [s]':>9} {'undo+redo all [s]':>18}")
+    for label, r in out.items():
+        print(f"{label:<40} {r['commands']:>9d} {r['peak'] / 2**20:>10.2f} "
+              f"{r['push']:>9.3f} {r['replay']:>18.3f}")
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Undo/redo example.')
+    parser.add_argument('--bench', type=int, metavar='N',
+                        help='run the stress benchmark with N commands instead')
+    parser.add_argument('--budget', type=int, default=256 * 2**10,
+                        help='BudgetedUndoStack byte budget for the benchmark')
+    args = parser.parse_args()
+
     app = QApplication(sys.argv)
+    if args.bench is not None:
+        print_benchmark(args.bench, args.budget)
+        sys.exit()
     ex = MyApplication()
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(app.exec_())
@@ -1,31 +1,35 @@
-import openmdao.api as om
-
-# build the model
-prob = om.Problem()
-
-prob.model.add_subsystem('paraboloid', om.ExecComp(
-    'f = (x-3)**2 + x*y + (y+4)**2 - 3'))
-
-# setup the optimization
-prob.driver = om.ScipyOptimizeDriver()
-prob.driver.options['optimizer'] = 'SLSQP'
-
-prob.model.add_design_var('paraboloid.x', lower=-50, upper=50)
-prob.model.add_design_var('paraboloid.y', lower=-50, upper=50)
-prob.model.add_objective('paraboloid.f')
-
-prob.setup()
-
-# set initial values
-prob.set_val('paraboloid.x', 3.0)
-prob.set_val('paraboloid.y', -4.0)
-
-# run the optimization
-prob.run_driver()
-
-# minimum value
-print(prob.get_val('paraboloid.f'))
-
-# location of the minimum
-print(prob.get_val('paraboloid.x'))
-print(prob.get_val('paraboloid.y'))
+"""
+Minimize f = (x-3)**2 + x*y + (y+4)**2 - 3 over -50 <= x, y <= 50 with SLSQP.
+
+The problem itself is built by MDAO/paraboloid_problem.py so it can be set up
+once and re-used (cached evaluations, warm starts) by other studies. This
+script is the single-run version.
+
+    python MDAO.paraboloid_min.py --driver surrogate
+
+optimizes through an RBF surrogate instead (MDAO/surrogate.py), running the
+true model only at the sample and infill points.
+"""
+import argparse
+
+from MDAO.paraboloid_problem import ParaboloidProblem
+from MDAO.surrogate import SurrogateDriver
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--driver', choices=('slsqp', 'surrogate'), default='slsqp')
+args = parser.parse_args()
+
+# build the model and set up the optimization
+driver = SurrogateDriver() if args.driver == 'surrogate' else None
+problem = ParaboloidProblem(lower=-50, upper=50, driver=driver)
+
+# run the optimization from the initial values
+result = problem.optimize(start=(3.0, -4.0))
+print(f"{args.driver}: {result['true_evals']} true model evaluations")
+
+# minimum value
+print(problem.prob.get_val('paraboloid.f'))
+
+# location of the minimum
+print(problem.prob.get_val('paraboloid.x'))
+print(problem.prob.get_val('paraboloid.y'))
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Mon Oct 19 09:12:40 2026
+
+@Description: Reusable pieces of the paraboloid MDAO example.
+
+    The original single-run demo still lives in ../MDAO.paraboloid_min.py.
+    Modules in here are meant to be run from the repo root, e.g.
+
+        python -m MDAO.multistart --starts 64 --workers 4
+"""
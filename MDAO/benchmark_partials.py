@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Mon Oct 19 10:41:55 2026
+
+@Description: Derivative-method benchmark for the paraboloid optimization.
+
+    Runs the same SLSQP problem as MDAO.paraboloid_min.py with four ways of
+    getting the partials:
+
+        execcomp-cs   om.ExecComp (string expression, complex-step partials)
+        comp-fd       Paraboloid, partials by finite difference
+        comp-cs       Paraboloid, partials by complex step
+        comp-exact    Paraboloid, analytic compute_partials
+
+    and reports, per variant:
+        - optimizer iterations, model evals and derivative evals
+        - compute() calls inside the component (fd/cs perturbations included)
+        - median time-to-solution over several repeats (setup excluded)
+        - error against the known optimum f* = -27.3333...
+
+    A second table times one vectorized run_model + partials evaluation over
+    N points, ExecComp vs the analytic component.
+
+    Usage (from the repo root):
+
+        python -m MDAO.benchmark_partials --repeats 20
+"""
+#%%
+import argparse
+import statistics
+import time
+
+import numpy as np
+import openmdao.api as om
+
+from .paraboloid_comp import Paraboloid
+
+EXPR = 'f = (x-3)**2 + x*y + (y+4)**2 - 3'
+F_STAR = -82.0 / 3.0    # analytic minimum, at x = 20/3, y = -22/3
+VARIANTS = ('execcomp-cs', 'comp-fd', 'comp-cs', 'comp-exact')
+
+
+class _CountingExecComp(om.ExecComp):
+    """ExecComp that counts its compute() calls, to line up with Paraboloid."""
+
+    def initialize(self):
+        super().initialize()
+        self.num_compute = 0
+
+    def compute(self, inputs, outputs):
+        self.num_compute += 1
+        super().compute(inputs, outputs)
+
+
+def _make_component(variant, vec_size=1):
+    if variant == 'execcomp-cs':
+        shape = {'shape': (vec_size,)}
+        return _CountingExecComp(EXPR, x=shape, y=shape, f=shape,
+                                 has_diag_partials=True)
+    method = variant.split('-', 1)[1]
+    return Paraboloid(vec_size=vec_size, partials_method=method)
+
+
+def build_problem(variant):
+    """Set-up SLSQP paraboloid problem using the given partials variant."""
+    prob = om.Problem()
+    prob.model.add_subsystem('paraboloid', _make_component(variant))
+
+    prob.driver = om.ScipyOptimizeDriver()
+    prob.driver.options['optimizer'] = 'SLSQP'
+    prob.driver.options['disp'] = False
+
+    prob.model.add_design_var('paraboloid.x', lower=-50, upper=50)
+    prob.model.add_design_var('paraboloid.y', lower=-50, upper=50)
+    prob.model.add_objective('paraboloid.f')
+
+    prob.setup(force_alloc_complex=variant.endswith('cs'))
+    return prob
+
+
+def bench_optimization(variant, start=(3.0, -4.0), repeats=10):
+    """
+    Time-to-solution and call counts for one partials variant.
+
+    The problem is set up once; every repeat resets the design variables to
+    `start` and re-runs the driver, so only the optimization itself is timed.
+
+    Returns:
+        dict: counts from the last repeat plus median/min time over repeats.
+    """
+    prob = build_problem(variant)
+    comp = prob.model.paraboloid
+    times = []
+
+    for _ in range(repeats):
+        prob.set_val('paraboloid.x', start[0])
+        prob.set_val('paraboloid.y', start[1])
+        comp.num_compute = 0
+
+        t0 = time.perf_counter()
+        result = prob.run_driver()
+        times.append(time.perf_counter() - t0)
+
+    f = float(prob.get_val('paraboloid.f')[0])
+    return {
+        'variant': variant,
+        'success': bool(result.success),
+        'iterations': int(prob.driver.iter_count),
+        'model_evals': int(result.model_evals),
+        'deriv_evals': int(result.deriv_evals),
+        'compute_calls': comp.num_compute,
+        'median_time': statistics.median(times),
+        'min_time': min(times),
+        'error': abs(f - F_STAR),
+    }
+
+
+def bench_vectorized(variant, n_points, repeats=5):
+    """
+    Median time of one run_model + linearize over n_points (x, y) pairs.
+
+    This is the "many points in one call" use case: the whole batch goes
+    through a single compute()/compute_partials() instead of n_points
+    separate model runs.
+    """
+    prob = om.Problem()
+    prob.model.add_subsystem('paraboloid', _make_component(variant, n_points),
+                             promotes=['*'])
+    prob.setup(force_alloc_complex=variant.endswith('cs'))
+
+    rng = np.random.default_rng(0)
+    prob.set_val('x', rng.uniform(-50, 50, n_points))
+    prob.set_val('y', rng.uniform(-50, 50, n_points))
+
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        prob.run_model()
+        prob.model.run_linearize()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Compare ExecComp/fd/cs/analytic partials on the paraboloid.')
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 100000],
+                        help='point counts for the vectorized table')
+    args = parser.parse_args(argv)
+
+    print(f"\n{'variant':<12} {'ok':>3} {'iters':>6} {'model':>6} {'deriv':>6} "
+          f"{'computes':>9} {'median [ms]':>12} {'|f-f*|':>10}")
+    for variant in VARIANTS:
+        r = bench_optimization(variant, repeats=args.repeats)
+        print(f"{r['variant']:<12} {'y' if r['success'] else 'n':>3} "
+              f"{r['iterations']:>6d} {r['model_evals']:>6d} {r['deriv_evals']:>6d} "
+              f"{r['compute_calls']:>9d} {1e3 * r['median_time']:>12.3f} "
+              f"{r['error']:>10.2e}")
+
+    print(f"\n{'points':>8} {'execcomp-cs [ms]':>17} {'comp-exact [ms]':>16} {'ratio':>7}")
+    for n in args.sizes:
+        t_exec = bench_vectorized('execcomp-cs', n)
+        t_comp = bench_vectorized('comp-exact', n)
+        print(f"{n:>8d} {1e3 * t_exec:>17.3f} {1e3 * t_comp:>16.3f} "
+              f"{t_exec / t_comp:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Mon Oct 19 15:48:03 2026
+
+@Description: Low-overhead binary driver recorder + zero-copy reader.
+
+    om.SqliteRecorder pickles every case into a SQLite row. That's flexible,
+    but recording costs a pickle + INSERT per iteration and reading a long
+    history back means un-pickling every case one at a time.
+
+    For driver histories we only ever want the same few fixed-size numbers
+    per iteration (design variables, objectives, constraints), so:
+
+    FILE LAYOUT (little-endian)
+        0   8 bytes   magic  b'OMBINLOG'
+        8   uint64    header length (JSON, padded)
+        16  uint64    committed row count   <- bumped by the flush thread
+        24  uint64    row capacity
+        32  JSON      {"fields": [[name, size], ...], ...}
+        ... fixed-size records (numpy structured dtype), 64-byte aligned
+
+    WRITE PATH
+        The file is preallocated and memory-mapped. Recording an iteration is
+        one structured-row assignment into the map -- no serialization, no
+        syscall. A daemon thread msync()s the map every `flush_interval`
+        seconds and only THEN bumps the committed row count, so a reader
+        never sees a row that isn't on disk yet. When the capacity runs out
+        the file is doubled and re-mapped.
+
+    READ PATH
+        BinLogReader memory-maps the same file read-only; every column is a
+        numpy view into the map (no copy, nothing read until touched).
+
+    Usage:
+
+        from MDAO.binlog_recorder import BinLogRecorder, BinLogReader
+
+        problem = ParaboloidProblem(recorder=BinLogRecorder('history.binlog'))
+        problem.optimize()
+        problem.prob.cleanup()
+
+        hist = BinLogReader('history.binlog')
+        hist['paraboloid.f']       # (n_iterations,) view, no copy
+
+    Benchmark vs SQLite (from the repo root):
+
+        python -m MDAO.binlog_recorder --runs 200
+"""
+#%%
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import numpy as np
+from openmdao.recorders.case_recorder import CaseRecorder
+
+MAGIC = b'OMBINLOG'
+PREAMBLE = 32           # magic + 3 x uint64
+ALIGN = 64
+
+
+def _record_dtype(fields):
+    """Structured row dtype: counter, timestamp, then one field per variable."""
+    spec = [('counter', '<i8'), ('timestamp', '<f8')]
+    for name, size in fields:
+        spec.append((name, '<f8') if size == 1 else (name, '<f8', (size,)))
+    return np.dtype(spec)
+
+
+def _data_offset(header_len):
+    return -(-(PREAMBLE + header_len) // ALIGN) * ALIGN
+
+
+class BinLogRecorder(CaseRecorder):
+    """
+    Driver recorder writing design vars, objectives and constraints to a
+    preallocated, memory-mapped binary log.
+
+    Args:
+        filepath (str): Log file to create (overwritten if it exists).
+        capacity (int, optional): Initial preallocated rows. Doubles when
+            full. Default is 4096.
+        flush_interval (float, optional): Seconds between background
+            flushes. Default is 0.5.
+    """
+
+    def __init__(self, filepath, capacity=4096, flush_interval=0.5):
+        super().__init__(record_viewer_data=False)
+        self._filepath = filepath
+        self._capacity = capacity
+        self._flush_interval = flush_interval
+
+        self._fields = None
+        self._sources = None
+        self._columns = None
+        self._dtype = None
+        self._mm = None
+        self._rows = None
+        self._n_rows = 0
+        self._n_committed = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher = None
+
+    # --- CaseRecorder interface ----------------------------------------------
+
+    def startup(self, recording_requester, comm=None):
+        # Called on every final_setup(); keep appending to the open log rather
+        # than truncating it between runs of the same problem.
+        if self._mm is not None:
+            return
+        super().startup(recording_requester, comm)
+
+        driver = recording_requester
+        self._fields, self._sources = [], []
+        for group in (driver._designvars, driver._objs, driver._cons):
+            for name, meta in group.items():
+                self._fields.append((name, int(meta['size'])))
+                self._sources.append(meta.get('source') or name)
+
+        self._columns = [(name, src, size == 1) for (name, size), src
+                         in zip(self._fields, self._sources)]
+        self._dtype = _record_dtype(self._fields)
+        self._create_file()
+
+        self._stop.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True,
+                                         name='BinLogRecorder-flush')
+        self._flusher.start()
+
+    def record_iteration_driver(self, recording_requester, data, metadata):
+        if self._n_rows == self._capacity:
+            self._grow()
+
+        outputs = data['output']
+        row = self._rows[self._n_rows]
+        row['counter'] = self._counter
+        row['timestamp'] = metadata['timestamp']
+        for name, src, scalar in self._columns:
+            row[name] = outputs[src][0] if scalar else outputs[src]
+        self._n_rows += 1
+
+    def record_metadata_system(self, system, run_number=None):
+        pass
+
+    def record_metadata_solver(self, solver, run_number=None):
+        pass
+
+    def record_viewer_data(self, model_viewer_data):
+        pass
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        pass
+
+    def record_iteration_system(self, recording_requester, data, metadata):
+        raise NotImplementedError("BinLogRecorder only records driver iterations")
+
+    def record_iteration_solver(self, recording_requester, data, metadata):
+        raise NotImplementedError("BinLogRecorder only records driver iterations")
+
+    def record_iteration_problem(self, recording_requester, data, metadata):
+        raise NotImplementedError("BinLogRecorder only records driver iterations")
+
+    def shutdown(self):
+        if self._mm is None:
+            return
+        self._stop.set()
+        self._flusher.join()
+        self.flush()
+        self._rows = None
+        self._mm = None
+
+    # --- file management -----------------------------------------------------
+
+    def _create_file(self):
+        header = json.dumps({'fields': self._fields, 'dtype': self._dtype.descr})
+        header = header.encode()
+        self._data_offset = _data_offset(len(header))
+
+        with open(self._filepath, 'wb') as f:
+            f.write(MAGIC)
+            f.write(np.array([self._data_offset - PREAMBLE, 0, self._capacity],
+                             dtype='<u8').tobytes())
+            f.write(header.ljust(self._data_offset - PREAMBLE))
+            f.truncate(self._data_offset + self._capacity * self._dtype.itemsize)
+        self._map()
+
+    def _map(self):
+        self._mm = np.memmap(self._filepath, dtype=np.uint8, mode='r+')
+        self._counts = np.ndarray((2,), dtype='<u8', buffer=self._mm, offset=16)
+        self._rows = np.ndarray((self._capacity,), dtype=self._dtype,
+                                buffer=self._mm, offset=self._data_offset)
+
+    def _grow(self):
+        with self._lock:
+            self._mm.flush()
+            self._rows = self._counts = self._mm = None
+            self._capacity *= 2
+            with open(self._filepath, 'r+b') as f:
+                f.truncate(self._data_offset + self._capacity * self._dtype.itemsize)
+            self._map()
+            self._counts[1] = self._capacity
+
+    def flush(self):
+        """Push written rows to disk, then publish the new row count."""
+        with self._lock:
+            n = self._n_rows
+            if n == self._n_committed or self._mm is None:
+                return
+            self._mm.flush()
+            self._counts[0] = n
+            self._mm.flush()
+            self._n_committed = n
+
+    def _flush_loop(self):
+        while not self._stop.wait(self._flush_interval):
+            self.flush()
+
+
+class BinLogReader:
+    """
+    Read-only, zero-copy view of a BinLogRecorder file.
+
+    Every column is a numpy view into a read-only memory map. Call
+    refresh() to pick up rows committed since the reader was opened (the
+    log can be read while the optimization is still running).
+
+    Args:
+        filepath (str): Log written by BinLogRecorder.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.refresh()
+
+    def refresh(self):
+        mm = np.memmap(self.filepath, dtype=np.uint8, mode='r')
+        if bytes(mm[:8]) != MAGIC:
+            raise ValueError(f"{self.filepath} is not a BinLogRecorder file")
+
+        header_len, n_rows, _ = np.ndarray((3,), dtype='<u8', buffer=mm, offset=8)
+        header = json.loads(bytes(mm[PREAMBLE:PREAMBLE + header_len]).rstrip())
+        self.fields = [(name, size) for name, size in header['fields']]
+        dtype = _record_dtype(self.fields)
+
+        self._mm = mm
+        self.rows = np.ndarray((int(n_rows),), dtype=dtype, buffer=mm,
+                               offset=_data_offset(int(header_len)))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, name):
+        return self.rows[name]
+
+    @property
+    def names(self):
+        return [name for name, _ in self.fields]
+
+    def as_dict(self):
+        """All columns (including 'counter' and 'timestamp') as views."""
+        return {name: self.rows[name] for name in self.rows.dtype.names}
+
+
+# =============================================================================
+# Benchmark vs SQLite
+# =============================================================================
+
+def _record_runs(recorder, starts):
+    """Run one optimization per start point with `recorder` attached."""
+    from .paraboloid_problem import ParaboloidProblem
+
+    # cache_size=0: every iteration really evaluates, as in production
+    problem = ParaboloidProblem(cache_size=0, recorder=recorder)
+    t0 = time.perf_counter()
+    for start in starts:
+        problem.optimize(start=start)
+    elapsed = time.perf_counter() - t0
+    problem.prob.cleanup()
+    return elapsed
+
+
+def _read_sqlite(path):
+    """
+    Driver history straight from the driver_iterations table, in insertion
+    order. CaseReader.get_cases() can't be used here: the case names
+    ('rank0:ScipyOptimize_SLSQP|0', ...) restart on every run_driver(), so
+    later runs' cases come back under earlier runs' names.
+    """
+    import openmdao.api as om
+
+    t0 = time.perf_counter()
+    cr = om.CaseReader(path)
+    x_source = cr.problem_metadata['variables']['paraboloid.x']['source']
+    with sqlite3.connect(path) as con:
+        rows = [json.loads(outputs) for (outputs,) in
+                con.execute("SELECT outputs FROM driver_iterations ORDER BY id")]
+    f = np.array([row['paraboloid.f'][0] for row in rows])
+    x = np.array([row[x_source][0] for row in rows])
+    return time.perf_counter() - t0, len(f), float(f.sum() + x.sum())
+
+
+def _read_binlog(path):
+    t0 = time.perf_counter()
+    hist = BinLogReader(path)
+    f, x = hist['paraboloid.f'], hist['paraboloid.x']
+    return time.perf_counter() - t0, len(f), float(f.sum() + x.sum())
+
+
+def benchmark(n_runs=200, seed=0, repeats=5):
+    """
+    Record the same n_runs optimizations with no recorder, SqliteRecorder
+    and BinLogRecorder; then read the histories back.
+
+    One discarded warm-up pass (imports, first-call setup, cold caches) comes
+    first, then the three configurations are run `repeats` times each,
+    interleaved and in a rotating order, so no recorder always runs first.
+    Times are medians over the repeats.
+
+    Returns:
+        dict: median timings, all record timings and history lengths per
+        recorder.
+    """
+    import openmdao.api as om
+
+    starts = np.random.default_rng(seed).uniform(-50, 50, (n_runs, 2))
+    labels = ('none', 'sqlite', 'binlog')
+    times = {label: [] for label in labels}
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+
+        def recorder(label, rep):
+            if label == 'none':
+                return None
+            paths[label] = os.path.join(tmp, f'history{rep}.{label}')
+            if label == 'sqlite':
+                return om.SqliteRecorder(paths[label])
+            return BinLogRecorder(paths[label])
+
+        _record_runs(None, starts[:10])                         # warm-up
+        for rep in range(repeats):
+            order = labels[rep % 3:] + labels[:rep % 3]
+            for label in order:
+                times[label].append(_record_runs(recorder(label, rep), starts))
+
+        out = {label: {'record': float(np.median(times[label])),
+                       'record_all': times[label]} for label in labels}
+        for label, reader in (('sqlite', _read_sqlite), ('binlog', _read_binlog)):
+            reads = [reader(paths[label]) for _ in range(repeats)]
+            _, n, checksum = reads[0]
+            out[label].update(read=float(np.median([r[0] for r in reads])), cases=n,
+                              checksum=checksum, size=os.path.getsize(paths[label]))
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmark BinLogRecorder against SqliteRecorder.')
+    parser.add_argument('--runs', type=int, default=200,
+                        help='optimizations to record (~7 iterations each)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=5,
+                        help='interleaved repetitions per recorder (medians are reported)')
+    args = parser.parse_args(argv)
+
+    out = benchmark(args.runs, args.seed, args.repeats)
+    base = out['none']['record']
+    print(f"\nmedian of {args.repeats} interleaved repeats, after a warm-up pass")
+    print(f"{'recorder':<8} {'record [s]':>11} {'min-max [s]':>13} {'overhead':>9} {'cases':>7} "
+          f"{'file [kB]':>10} {'read [ms]':>10}")
+    for label in ('none', 'sqlite', 'binlog'):
+        r = out[label]
+        spread = f"{min(r['record_all']):.3f}-{max(r['record_all']):.3f}"
+        line = f"{label:<8} {r['record']:>11.3f} {spread:>13}"
+        if label != 'none':
+            line += (f" {r['record'] / base - 1:>9.1%} {r['cases']:>7d} "
+                     f"{r['size'] / 1024:>10.1f} {1e3 * r['read']:>10.2f}")
+        print(line)
+    if not np.isclose(out['sqlite']['checksum'], out['binlog']['checksum']):
+        print("WARNING: sqlite and binlog histories differ")
+    else:
+        print("sqlite and binlog histories match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Mon Oct 19 13:05:18 2026
+
+@Description: Batched (vectorized) design-of-experiments for the paraboloid.
+
+    om.DOEDriver runs the model once per design point. For a 1000 x 1000
+    grid that's 10^6 run_model() calls, and almost all of the time goes
+    into framework overhead rather than into evaluating f.
+
+    Here the model is a single Paraboloid(vec_size=batch_size) component.
+    Design points are generated chunk by chunk, each chunk goes through ONE
+    run_model() call, and the results are written straight into a columnar
+    output so only one chunk is ever held in memory:
+
+        results_dir/
+            x.npy   y.npy   f.npy      <- one .npy per column
+            meta.json                  <- row count, generator, bounds, ...
+
+    The .npy columns are memory-mapped on write and on read, so a 10^6-row
+    (or 10^8-row) run never needs the full table in RAM. If pyarrow is
+    installed, --format parquet writes one row group per chunk instead.
+
+    Usage (from the repo root):
+
+        python -m MDAO.doe grid --levels 1000 --out doe_grid
+        python -m MDAO.doe lhs --samples 1000000 --out doe_lhs --seed 0
+        python -m MDAO.doe grid --levels 30 --compare
+"""
+#%%
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import openmdao.api as om
+from numpy.lib.format import open_memmap
+
+from .paraboloid_comp import Paraboloid
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+LOWER = -50.0
+UPPER = 50.0
+COLUMNS = ('x', 'y', 'f')
+
+
+# =============================================================================
+# Point generators
+# =============================================================================
+# Each generator yields (x, y) chunks of at most `chunk` points, never the
+# whole design at once.
+
+def grid_chunks(levels, chunk, lower=LOWER, upper=UPPER):
+    """Full-factorial levels x levels grid, row-major (y varies fastest)."""
+    axis = np.linspace(lower, upper, levels)
+    total = levels * levels
+    for start in range(0, total, chunk):
+        idx = np.arange(start, min(start + chunk, total))
+        yield axis[idx // levels], axis[idx % levels]
+
+
+def lhs_chunks(samples, chunk, lower=LOWER, upper=UPPER, seed=None):
+    """
+    Latin-hypercube sample, generated in chunks.
+
+    The per-axis stratum permutations are the only full-length arrays
+    (one int64 per sample per axis); the points themselves are built chunk
+    by chunk.
+    """
+    rng = np.random.default_rng(seed)
+    perm_x = rng.permutation(samples)
+    perm_y = rng.permutation(samples)
+    span = (upper - lower) / samples
+    for start in range(0, samples, chunk):
+        stop = min(start + chunk, samples)
+        n = stop - start
+        x = lower + (perm_x[start:stop] + rng.random(n)) * span
+        y = lower + (perm_y[start:stop] + rng.random(n)) * span
+        yield x, y
+
+
+# =============================================================================
+# Columnar output
+# =============================================================================
+
+class ColumnarWriter:
+    """
+    Stream fixed-length columns to disk one chunk at a time.
+
+    Args:
+        out_dir (str): Output directory (created if needed).
+        n_rows (int): Total rows that will be written.
+        fmt (str, optional): 'npy' (memory-mapped .npy per column) or
+            'parquet' (needs pyarrow). Default is 'npy'.
+        dtype (str, optional): Storage dtype; 'float32' halves the file
+            size at ~7 significant digits. Default is 'float64'.
+        meta (dict, optional): Extra entries for meta.json.
+    """
+
+    def __init__(self, out_dir, n_rows, fmt='npy', dtype='float64', meta=None):
+        if fmt == 'parquet' and not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow not installed (needed for --format parquet)")
+        if fmt not in ('npy', 'parquet'):
+            raise ValueError(f"Unknown format '{fmt}' (expected 'npy' or 'parquet')")
+
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+        self.n_rows = n_rows
+        self.fmt = fmt
+        self.dtype = np.dtype(dtype)
+        self.meta = dict(meta or {})
+        self.rows_written = 0
+
+        if fmt == 'npy':
+            self._columns = {
+                name: open_memmap(os.path.join(out_dir, f'{name}.npy'), mode='w+',
+                                  dtype=self.dtype, shape=(n_rows,))
+                for name in COLUMNS
+            }
+        else:
+            pa_type = pa.from_numpy_dtype(self.dtype)
+            schema = pa.schema([(name, pa_type) for name in COLUMNS])
+            self._parquet = pq.ParquetWriter(os.path.join(out_dir, 'doe.parquet'),
+                                             schema)
+
+    def write(self, **chunk):
+        n = len(chunk[COLUMNS[0]])
+        start, stop = self.rows_written, self.rows_written + n
+        if stop > self.n_rows:
+            raise ValueError(f"Writing rows {start}:{stop} past n_rows={self.n_rows}")
+
+        if self.fmt == 'npy':
+            for name in COLUMNS:
+                self._columns[name][start:stop] = chunk[name]
+        else:
+            table = pa.table({name: np.asarray(chunk[name], dtype=self.dtype)
+                              for name in COLUMNS})
+            self._parquet.write_table(table)
+        self.rows_written = stop
+
+    def close(self):
+        if self.fmt == 'npy':
+            for col in self._columns.values():
+                col.flush()
+            self._columns = {}
+        else:
+            self._parquet.close()
+
+        meta = {'rows': self.rows_written, 'columns': list(COLUMNS),
+                'format': self.fmt, 'dtype': self.dtype.name, **self.meta}
+        with open(os.path.join(self.out_dir, 'meta.json'), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_results(out_dir):
+    """
+    Open a DOE result directory written by ColumnarWriter.
+
+    Returns:
+        dict[str, np.ndarray]: column name -> array. For the 'npy' format
+            these are read-only memmaps, so nothing is loaded until sliced.
+    """
+    with open(os.path.join(out_dir, 'meta.json')) as f:
+        meta = json.load(f)
+
+    if meta['format'] == 'npy':
+        return {name: np.load(os.path.join(out_dir, f'{name}.npy'), mmap_mode='r')
+                for name in meta['columns']}
+
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow not installed (needed to read parquet results)")
+    table = pq.read_table(os.path.join(out_dir, 'doe.parquet'))
+    return {name: table[name].to_numpy() for name in meta['columns']}
+
+
+# =============================================================================
+# Batched evaluation
+# =============================================================================
+
+def build_batch_problem(batch_size):
+    """Set-up problem holding one Paraboloid evaluating batch_size points."""
+    prob = om.Problem()
+    prob.model.add_subsystem('paraboloid', Paraboloid(vec_size=batch_size),
+                             promotes=['*'])
+    prob.setup()
+    return prob
+
+
+def run_batched_doe(chunks, n_rows, batch_size, out_dir, fmt='npy',
+                    dtype='float64', meta=None):
+    """
+    Evaluate every chunk of design points with one run_model() per chunk.
+
+    The final chunk is usually short; it's padded up to batch_size (the
+    component's fixed vec_size) and the padding is dropped before writing.
+
+    Args:
+        chunks (iterable): (x, y) array pairs, each at most batch_size long.
+        n_rows (int): Total number of design points across all chunks.
+        batch_size (int): Points per run_model() call.
+        out_dir (str): Result directory for ColumnarWriter.
+        fmt (str, optional): 'npy' or 'parquet'. Default is 'npy'.
+        dtype (str, optional): Storage dtype. Default is 'float64'.
+        meta (dict, optional): Extra entries for meta.json.
+
+    Returns:
+        dict with "rows", "batches", "wall_time" and "points_per_s".
+    """
+    prob = build_batch_problem(batch_size)
+    x_buf = np.zeros(batch_size)
+    y_buf = np.zeros(batch_size)
+    batches = 0
+
+    t0 = time.perf_counter()
+    with ColumnarWriter(out_dir, n_rows, fmt=fmt, dtype=dtype, meta=meta) as writer:
+        for x, y in chunks:
+            n = len(x)
+            x_buf[:n] = x
+            y_buf[:n] = y
+            prob.set_val('x', x_buf)
+            prob.set_val('y', y_buf)
+            prob.run_model()
+            writer.write(x=x, y=y, f=prob.get_val('f')[:n])
+            batches += 1
+    wall_time = time.perf_counter() - t0
+
+    return {'rows': n_rows, 'batches': batches, 'wall_time': wall_time,
+            'points_per_s': n_rows / wall_time}
+
+
+def run_reference_doe(levels):
+    """
+    The same grid through the standard om.DOEDriver, one run per point.
+
+    Only meant for small grids -- it's the baseline the batched mode is
+    measured against.
+    """
+    prob = om.Problem()
+    prob.model.add_subsystem('paraboloid', om.ExecComp(
+        'f = (x-3)**2 + x*y + (y+4)**2 - 3'), promotes=['*'])
+    prob.model.add_design_var('x', lower=LOWER, upper=UPPER)
+    prob.model.add_design_var('y', lower=LOWER, upper=UPPER)
+    prob.model.add_objective('f')
+
+    # ListGenerator, not FullFactorialGenerator, so pydoe isn't required
+    cases = [[('x', x), ('y', y)]
+             for x, y in zip(*next(grid_chunks(levels, levels * levels)))]
+    prob.driver = om.DOEDriver(om.ListGenerator(cases))
+    prob.setup()
+
+    t0 = time.perf_counter()
+    prob.run_driver()
+    wall_time = time.perf_counter() - t0
+    prob.cleanup()
+
+    n_rows = levels * levels
+    return {'rows': n_rows, 'wall_time': wall_time,
+            'points_per_s': n_rows / wall_time}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Batched DOE over the paraboloid design space.')
+    parser.add_argument('generator', choices=('grid', 'lhs'))
+    parser.add_argument('--levels', type=int, default=1000,
+                        help='grid points per axis (grid)')
+    parser.add_argument('--samples', type=int, default=1_000_000,
+                        help='number of points (lhs)')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--batch', type=int, default=65_536,
+                        help='points per run_model() call')
+    parser.add_argument('--out', default='doe_results')
+    parser.add_argument('--format', choices=('npy', 'parquet'), default='npy')
+    parser.add_argument('--dtype', choices=('float64', 'float32'), default='float64')
+    parser.add_argument('--compare', action='store_true',
+                        help='also time om.DOEDriver on the same grid')
+    args = parser.parse_args(argv)
+
+    if args.generator == 'grid':
+        n_rows = args.levels ** 2
+        batch = min(args.batch, n_rows)
+        chunks = grid_chunks(args.levels, batch)
+        meta = {'generator': 'grid', 'levels': args.levels}
+    else:
+        n_rows = args.samples
+        batch = min(args.batch, n_rows)
+        chunks = lhs_chunks(n_rows, batch, seed=args.seed)
+        meta = {'generator': 'lhs', 'seed': args.seed}
+    meta.update(lower=LOWER, upper=UPPER, batch=batch)
+
+    out = run_batched_doe(chunks, n_rows, batch, args.out, fmt=args.format,
+                          dtype=args.dtype, meta=meta)
+    print(f"batched:   {out['rows']:>10d} points in {out['batches']} run_model() "
+          f"calls, {out['wall_time']:.3f} s ({out['points_per_s']:.3e} pts/s)")
+
+    results = load_results(args.out)
+    best = int(np.argmin(results['f']))
+    print(f"   min f = {results['f'][best]:.6f} at x = {results['x'][best]:.4f}, "
+          f"y = {results['y'][best]:.4f}  -> {args.out}/")
+
+    if args.compare:
+        if args.generator != 'grid':
+            parser.error('--compare only applies to the grid generator')
+        ref = run_reference_doe(args.levels)
+        print(f"DOEDriver: {ref['rows']:>10d} points in {ref['rows']} run_model() "
+              f"calls, {ref['wall_time']:.3f} s ({ref['points_per_s']:.3e} pts/s)")
+        print(f"   speedup: {ref['wall_time'] / out['wall_time']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Mon Oct 19 09:20:11 2026
+
+@Description: Multi-start driver for the paraboloid SLSQP optimization.
+
+    MDAO.paraboloid_min.py runs SLSQP from ONE starting point, which only
+    finds the optimum whose basin that point happens to sit in. For
+    multimodal problems we instead:
+
+        1. Scatter N start points over the design-variable bounds
+        2. Run an independent optimization from each one in a process pool
+        3. Merge optima that converged to the same place (within a tolerance)
+        4. Report the best one
+
+    Each worker process builds and sets up its own om.Problem ONCE (in the
+    pool initializer) and re-uses it for every start point it is handed, so
+    prob.setup() is not paid per start.
+
+    Usage (from the repo root):
+
+        python -m MDAO.multistart --starts 64 --workers 4
+        python -m MDAO.multistart --starts 64 --scaling 1 2 4 8
+"""
+#%%
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .paraboloid_problem import make_problem
+
+LOWER = -50.0
+UPPER = 50.0
+DESIGN_VARS = ('paraboloid.x', 'paraboloid.y')
+
+
+def build_problem():
+    """
+    Set-up paraboloid problem for one worker (see paraboloid_problem.py).
+
+    Each worker gets its own evaluation cache, so starts handed to the same
+    process share the points they have already evaluated.
+
+    Returns:
+        om.Problem: set-up problem with a quiet SLSQP driver attached.
+    """
+    return make_problem(LOWER, UPPER)
+
+
+def generate_start_points(n_starts, lower=LOWER, upper=UPPER, seed=None):
+    """
+    Latin-hypercube start points inside the design-variable bounds.
+
+    A plain uniform draw tends to clump; LHS guarantees every 1/N slice of
+    each axis gets exactly one point, which covers the box better for the
+    same N.
+
+    Args:
+        n_starts (int): Number of start points.
+        lower (float, optional): Lower bound for every design variable.
+        upper (float, optional): Upper bound for every design variable.
+        seed (int, optional): RNG seed for reproducible runs. Default is None.
+
+    Returns:
+        np.ndarray: (n_starts, n_design_vars) array of start points.
+    """
+    rng = np.random.default_rng(seed)
+    n_dims = len(DESIGN_VARS)
+
+    # One stratified sample per row, then shuffle the strata per column
+    strata = (np.arange(n_starts)[:, None] + rng.random((n_starts, n_dims))) / n_starts
+    for col in range(n_dims):
+        strata[:, col] = rng.permutation(strata[:, col])
+
+    return lower + strata * (upper - lower)
+
+
+# =============================================================================
+# Worker side
+# =============================================================================
+# Every process in the pool gets its own problem instance. Module-level so it
+# survives between tasks handed to the same worker.
+
+_worker_prob = None
+
+
+def _init_worker():
+    global _worker_prob
+    _worker_prob = build_problem()
+
+
+def _optimize_from(start):
+    """Run one SLSQP optimization from `start` inside a pool worker."""
+    prob = _worker_prob if _worker_prob is not None else build_problem()
+
+    for name, value in zip(DESIGN_VARS, start):
+        prob.set_val(name, value)
+
+    t0 = time.perf_counter()
+    result = prob.run_driver()
+    elapsed = time.perf_counter() - t0
+
+    return {
+        'start': [float(v) for v in start],
+        'x': [float(prob.get_val(name)[0]) for name in DESIGN_VARS],
+        'f': float(prob.get_val('paraboloid.f')[0]),
+        'success': bool(result.success),
+        'model_evals': int(result.model_evals),
+        'deriv_evals': int(result.deriv_evals),
+        'time': elapsed,
+    }
+
+
+# =============================================================================
+# Driver side
+# =============================================================================
+
+def deduplicate_optima(results, tol=1e-4):
+    """
+    Collapse converged runs that landed on the same optimum.
+
+    Two optima are "the same" if their design vectors are within `tol`
+    (Euclidean, relative to the bounds span). Each unique optimum keeps the
+    best objective seen for it and a count of how many starts reached it.
+
+    Args:
+        results (list[dict]): Output of _optimize_from for every start.
+        tol (float, optional): Relative merge distance. Default is 1e-4.
+
+    Returns:
+        list[dict]: Unique optima, sorted best (lowest f) first.
+    """
+    span = UPPER - LOWER
+    unique = []
+
+    for res in sorted((r for r in results if r['success']), key=lambda r: r['f']):
+        x = np.asarray(res['x'])
+        for opt in unique:
+            if np.linalg.norm(x - opt['x']) / span <= tol:
+                opt['hits'] += 1
+                break
+        else:
+            unique.append({'x': x, 'f': res['f'], 'hits': 1})
+
+    return unique
+
+
+def run_multistart(n_starts=32, n_workers=None, seed=None, starts=None):
+    """
+    Run independent SLSQP optimizations from many start points in parallel.
+
+    Args:
+        n_starts (int, optional): Number of start points. Default is 32.
+        n_workers (int, optional): Pool size. Default is os.cpu_count().
+        seed (int, optional): Start-point RNG seed. Default is None.
+        starts (np.ndarray, optional): Explicit start points; overrides
+            n_starts/seed when given.
+
+    Returns:
+        dict with keys:
+            - "best" (dict):     lowest-f unique optimum (or None)
+            - "optima" (list):   every unique optimum, best first
+            - "runs" (list):     per-start results
+            - "failed" (int):    number of starts that did not converge
+            - "wall_time" (float): seconds for the whole pool run
+    """
+    if starts is None:
+        starts = generate_start_points(n_starts, seed=seed)
+    n_workers = n_workers or os.cpu_count() or 1
+
+    t0 = time.perf_counter()
+    if n_workers == 1:
+        # No pool: avoids process start-up cost and keeps tracebacks readable
+        _init_worker()
+        runs = [_optimize_from(s) for s in starts]
+    else:
+        chunksize = max(1, len(starts) // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_worker) as pool:
+            runs = list(pool.map(_optimize_from, starts, chunksize=chunksize))
+    wall_time = time.perf_counter() - t0
+
+    optima = deduplicate_optima(runs)
+    return {
+        'best': optima[0] if optima else None,
+        'optima': optima,
+        'runs': runs,
+        'failed': sum(not r['success'] for r in runs),
+        'wall_time': wall_time,
+    }
+
+
+def scaling_study(n_starts=64, core_counts=(1, 2, 4), seed=0):
+    """
+    Time the same multi-start run at several pool sizes.
+
+    The start points are generated once so every pool size solves exactly
+    the same set of problems.
+
+    Returns:
+        list[dict]: one row per core count with wall time, speedup and
+            parallel efficiency relative to the first entry.
+    """
+    starts = generate_start_points(n_starts, seed=seed)
+    rows = []
+    for n_workers in core_counts:
+        out = run_multistart(n_workers=n_workers, starts=starts)
+        rows.append({'workers': n_workers, 'wall_time': out['wall_time']})
+
+    base = rows[0]['wall_time'] * core_counts[0]
+    for row in rows:
+        row['speedup'] = base / row['wall_time']
+        row['efficiency'] = row['speedup'] / row['workers']
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Multi-start SLSQP for the paraboloid problem.')
+    parser.add_argument('--starts', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--scaling', type=int, nargs='+', metavar='N',
+                        help='run a scaling study over these pool sizes')
+    args = parser.parse_args(argv)
+
+    if args.scaling:
+        print(f"{'workers':>8} {'wall [s]':>10} {'speedup':>8} {'eff':>6}")
+        for row in scaling_study(args.starts, args.scaling, seed=args.seed):
+            print(f"{row['workers']:>8d} {row['wall_time']:>10.3f} "
+                  f"{row['speedup']:>8.2f} {row['efficiency']:>6.2f}")
+        return
+
+    out = run_multistart(args.starts, args.workers, args.seed)
+    print(f"{len(out['runs'])} starts, {out['failed']} failed, "
+          f"{len(out['optima'])} unique optima in {out['wall_time']:.3f} s")
+    for opt in out['optima']:
+        x, y = opt['x']
+        print(f"   f = {opt['f']:.8f} at x = {x:.6f}, y = {y:.6f}  ({opt['hits']} hits)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Mon Oct 19 10:02:37 2026
+
+@Description: Explicit paraboloid component with analytic partials.
+
+        f = (x-3)**2 + x*y + (y+4)**2 - 3
+
+    WHY NOT om.ExecComp?
+        ExecComp parses the expression string and gets its partials by
+        complex-stepping that expression. That's great for prototyping, but
+        every derivative costs extra (complex) function evaluations. Here
+        the partials are written out by hand:
+
+            df/dx = 2*(x-3) + y
+            df/dy = x + 2*(y+4)
+
+    VECTORIZED
+        With vec_size=N, x and y are length-N arrays and f is evaluated for
+        all N (x, y) pairs in one compute() call. Point i only depends on
+        x[i] and y[i], so the Jacobian is diagonal and declared sparse
+        (rows == cols) -- no dense N x N block gets allocated.
+"""
+#%%
+import numpy as np
+import openmdao.api as om
+
+
+class Paraboloid(om.ExplicitComponent):
+    """
+    f(x, y) = (x-3)**2 + x*y + (y+4)**2 - 3, evaluated for vec_size points.
+
+    Options:
+        vec_size (int): Number of (x, y) points per compute(). Default is 1.
+        partials_method (str): 'exact' for the analytic partials, or 'fd' /
+            'cs' to approximate them (for benchmarking). Default is 'exact'.
+
+    Attributes:
+        num_compute (int): compute() calls so far, including any made by an
+            fd/cs approximation.
+        num_compute_partials (int): compute_partials() calls so far.
+    """
+
+    def initialize(self):
+        self.options.declare('vec_size', types=int, default=1, lower=1)
+        self.options.declare('partials_method', default='exact',
+                             values=('exact', 'fd', 'cs'))
+        self.num_compute = 0
+        self.num_compute_partials = 0
+
+    def setup(self):
+        n = self.options['vec_size']
+
+        self.add_input('x', val=np.zeros(n))
+        self.add_input('y', val=np.zeros(n))
+        self.add_output('f', val=np.zeros(n))
+
+        diag = np.arange(n)
+        method = self.options['partials_method']
+        if method == 'exact':
+            self.declare_partials('f', ['x', 'y'], rows=diag, cols=diag)
+        else:
+            self.declare_partials('f', ['x', 'y'], rows=diag, cols=diag,
+                                  method=method)
+
+    def compute(self, inputs, outputs):
+        self.num_compute += 1
+        x = inputs['x']
+        y = inputs['y']
+        outputs['f'] = (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0
+
+    def compute_partials(self, inputs, partials):
+        # OpenMDAO still calls this after an fd/cs approximation, and anything
+        # written here would overwrite the approximated partials.
+        if self.options['partials_method'] != 'exact':
+            return
+        self.num_compute_partials += 1
+        x = inputs['x']
+        y = inputs['y']
+        partials['f', 'x'] = 2.0 * (x - 3.0) + y
+        partials['f', 'y'] = x + 2.0 * (y + 4.0)
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Mon Oct 19 14:26:50 2026
+
+@Description: Reusable paraboloid problem factory with an evaluation cache
+              and warm starts.
+
+    MDAO.paraboloid_min.py used to rebuild the om.Problem, call setup() and
+    start from scratch on every execution. For repeated studies (same model,
+    slightly different bounds or start points) most of that is wasted:
+
+        1. SETUP ONCE
+           ParaboloidProblem keeps its set-up om.Problem alive. Changing the
+           bounds goes through set_design_var_options(), no re-setup.
+
+        2. MEMOIZE EVALUATIONS
+           CachedParaboloid remembers f and its partials keyed on the exact
+           design vector, in a bounded LRU (oldest entry evicted first).
+           Re-visiting a point -- e.g. the previous optimum -- is a dict
+           lookup instead of a model evaluation. With the real ROCETS model
+           behind this component that's minutes saved per hit.
+
+        3. WARM START
+           optimize() with no start point begins at the previous optimum
+           (clipped into the new bounds) instead of the default guess.
+
+    Usage (from the repo root):
+
+        python -m MDAO.paraboloid_problem --runs 20
+"""
+#%%
+import argparse
+import time
+from collections import OrderedDict
+
+import numpy as np
+import openmdao.api as om
+
+from .paraboloid_comp import Paraboloid
+
+LOWER = -50.0
+UPPER = 50.0
+DEFAULT_START = (3.0, -4.0)
+DESIGN_VARS = ('paraboloid.x', 'paraboloid.y')
+
+
+class CachedParaboloid(Paraboloid):
+    """
+    Paraboloid with an LRU cache on compute() and compute_partials().
+
+    Options:
+        cache_size (int): Max design vectors remembered (per cache). 0
+            disables caching. Default is 1024.
+
+    Attributes:
+        hits (int): Cache hits across both caches.
+        misses (int): Cache misses across both caches.
+        evictions (int): Entries dropped to stay within cache_size.
+    """
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare('cache_size', types=int, default=1024, lower=0)
+        self._f_cache = OrderedDict()
+        self._partials_cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(inputs):
+        # Exact bytes of the design vector: only bit-identical points match,
+        # so a hit can never return a slightly-wrong answer.
+        return inputs['x'].tobytes() + inputs['y'].tobytes()
+
+    def _lookup(self, cache, key):
+        value = cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            cache.move_to_end(key)
+        return value
+
+    def _store(self, cache, key, value):
+        size = self.options['cache_size']
+        if size == 0:
+            return
+        cache[key] = value
+        while len(cache) > size:
+            cache.popitem(last=False)
+            self.evictions += 1
+
+    def compute(self, inputs, outputs):
+        key = self._key(inputs)
+        f = self._lookup(self._f_cache, key)
+        if f is None:
+            super().compute(inputs, outputs)
+            self._store(self._f_cache, key, outputs['f'].copy())
+        else:
+            outputs['f'] = f
+
+    def compute_partials(self, inputs, partials):
+        key = self._key(inputs)
+        cached = self._lookup(self._partials_cache, key)
+        if cached is None:
+            super().compute_partials(inputs, partials)
+            cached = (partials['f', 'x'].copy(), partials['f', 'y'].copy())
+            self._store(self._partials_cache, key, cached)
+        else:
+            partials['f', 'x'], partials['f', 'y'] = cached
+
+    def clear_cache(self):
+        self._f_cache.clear()
+        self._partials_cache.clear()
+
+
+def make_problem(lower=LOWER, upper=UPPER, cache_size=1024, component=None,
+                 recorder=None, driver=None):
+    """
+    Build and set up the paraboloid optimization problem.
+
+    Args:
+        lower (float, optional): Lower bound on x and y. Default is -50.
+        upper (float, optional): Upper bound on x and y. Default is 50.
+        cache_size (int, optional): CachedParaboloid LRU size. Default is 1024.
+        component (om.ExplicitComponent, optional): Use this instead of a
+            CachedParaboloid (e.g. the original om.ExecComp).
+        recorder (CaseRecorder, optional): Driver recorder to attach before
+            setup (e.g. binlog_recorder.BinLogRecorder).
+        driver (om.Driver, optional): Use this instead of a quiet SLSQP
+            driver (e.g. surrogate.SurrogateDriver).
+
+    Returns:
+        om.Problem: set-up problem with its driver attached.
+    """
+    if component is None:
+        component = CachedParaboloid(cache_size=cache_size)
+
+    prob = om.Problem()
+    prob.model.add_subsystem('paraboloid', component)
+
+    if driver is None:
+        driver = om.ScipyOptimizeDriver()
+        driver.options['optimizer'] = 'SLSQP'
+        driver.options['disp'] = False
+    prob.driver = driver
+
+    for name in DESIGN_VARS:
+        prob.model.add_design_var(name, lower=lower, upper=upper)
+    prob.model.add_objective('paraboloid.f')
+
+    if recorder is not None:
+        prob.driver.add_recorder(recorder)
+
+    prob.setup()
+    return prob
+
+
+class ParaboloidProblem:
+    """
+    Long-lived paraboloid optimization: set up once, run many times.
+
+    Args:
+        lower (float, optional): Initial lower bound. Default is -50.
+        upper (float, optional): Initial upper bound. Default is 50.
+        cache_size (int, optional): Evaluation cache size. Default is 1024.
+        recorder (CaseRecorder, optional): Driver recorder. Default is None.
+        driver (om.Driver, optional): Driver instead of SLSQP. Default is None.
+
+    Attributes:
+        prob (om.Problem): The set-up problem (re-used by every run).
+        last_optimum (np.ndarray): Design vector of the previous run, or None.
+    """
+
+    def __init__(self, lower=LOWER, upper=UPPER, cache_size=1024, recorder=None,
+                 driver=None):
+        self.prob = make_problem(lower, upper, cache_size, recorder=recorder,
+                                 driver=driver)
+        self.bounds = (lower, upper)
+        self.last_optimum = None
+
+    @property
+    def component(self):
+        return self.prob.model.paraboloid
+
+    def set_bounds(self, lower, upper):
+        """Change the design-variable bounds without re-running setup()."""
+        if (lower, upper) == self.bounds:
+            return
+        for name in DESIGN_VARS:
+            self.prob.model.set_design_var_options(name, lower=lower, upper=upper)
+        self.bounds = (lower, upper)
+
+    def optimize(self, start=None, lower=None, upper=None):
+        """
+        Run the driver, re-using the set-up problem and evaluation cache.
+
+        Args:
+            start (sequence, optional): (x, y) start point. Default is the
+                previous optimum (warm start), or DEFAULT_START on the first
+                run.
+            lower (float, optional): New lower bound. Default is unchanged.
+            upper (float, optional): New upper bound. Default is unchanged.
+
+        Returns:
+            dict with "x", "y", "f", "success", "model_evals", "deriv_evals",
+            "true_evals" (model evals that missed the cache), "cache_hits",
+            "warm_start" and "time".
+        """
+        lower = self.bounds[0] if lower is None else lower
+        upper = self.bounds[1] if upper is None else upper
+        self.set_bounds(lower, upper)
+
+        warm = start is None and self.last_optimum is not None
+        if start is None:
+            start = self.last_optimum if warm else DEFAULT_START
+        start = np.clip(np.asarray(start, dtype=float), lower, upper)
+
+        for name, value in zip(DESIGN_VARS, start):
+            self.prob.set_val(name, value)
+
+        comp = self.component
+        hits0, computes0 = comp.hits, comp.num_compute
+        t0 = time.perf_counter()
+        result = self.prob.run_driver()
+        elapsed = time.perf_counter() - t0
+
+        x, y = (float(self.prob.get_val(name)[0]) for name in DESIGN_VARS)
+        self.last_optimum = np.array([x, y])
+        return {
+            'x': x,
+            'y': y,
+            'f': float(self.prob.get_val('paraboloid.f')[0]),
+            'success': bool(result.success),
+            'model_evals': int(result.model_evals),
+            'deriv_evals': int(result.deriv_evals),
+            'true_evals': comp.num_compute - computes0,
+            'cache_hits': comp.hits - hits0,
+            'warm_start': warm,
+            'time': elapsed,
+        }
+
+
+# =============================================================================
+# Re-run benchmark
+# =============================================================================
+
+def _cold_run(start, lower, upper):
+    """What the old script did every time: build, setup, run."""
+    t0 = time.perf_counter()
+    prob = make_problem(lower, upper, component=om.ExecComp(
+        'f = (x-3)**2 + x*y + (y+4)**2 - 3'))
+    for name, value in zip(DESIGN_VARS, start):
+        prob.set_val(name, value)
+    result = prob.run_driver()
+    return time.perf_counter() - t0, int(result.model_evals)
+
+
+def compare_reruns(n_runs=20, bound_jitter=1.0, start_jitter=2.0, seed=0):
+    """
+    Cold (rebuild every time) vs warm (ParaboloidProblem) repeated runs.
+
+    Two scenarios, n_runs each:
+        "bounds": the bounds move by up to +/- bound_jitter; the warm
+                  side starts from the previous optimum.
+        "starts": the start point moves by up to +/- start_jitter around
+                  DEFAULT_START; same bounds every time.
+
+    Returns:
+        dict[str, dict]: per scenario, total cold/warm time and the number of
+            actual f evaluations (cache hits excluded on the warm side).
+    """
+    rng = np.random.default_rng(seed)
+    report = {}
+
+    scenarios = {
+        'bounds': [(None,
+                    LOWER + rng.uniform(-bound_jitter, bound_jitter),
+                    UPPER + rng.uniform(-bound_jitter, bound_jitter))
+                   for _ in range(n_runs)],
+        'starts': [(np.add(DEFAULT_START, rng.uniform(-start_jitter, start_jitter, 2)),
+                    LOWER, UPPER)
+                   for _ in range(n_runs)],
+    }
+
+    for label, cases in scenarios.items():
+        cold_time = cold_evals = 0
+        for start, lower, upper in cases:
+            dt, evals = _cold_run(DEFAULT_START if start is None else start,
+                                  lower, upper)
+            cold_time += dt
+            cold_evals += evals
+
+        t0 = time.perf_counter()
+        problem = ParaboloidProblem()
+        warm_evals = warm_hits = 0
+        for start, lower, upper in cases:
+            out = problem.optimize(start, lower, upper)
+            warm_evals += out['true_evals']
+            warm_hits += out['cache_hits']
+        warm_time = time.perf_counter() - t0
+
+        report[label] = {
+            'cold_time': cold_time, 'warm_time': warm_time,
+            'cold_evals': cold_evals, 'warm_evals': warm_evals,
+            'cache_hits': warm_hits,
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Time saved by re-using a set-up paraboloid problem.')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = compare_reruns(args.runs, seed=args.seed)
+    print(f"\n{'scenario':<8} {'cold [s]':>9} {'warm [s]':>9} {'saved':>7} "
+          f"{'cold evals':>11} {'warm evals':>11} {'cache hits':>11}")
+    for label, r in report.items():
+        saved = 1.0 - r['warm_time'] / r['cold_time']
+        print(f"{label:<8} {r['cold_time']:>9.3f} {r['warm_time']:>9.3f} "
+              f"{saved:>7.1%} {r['cold_evals']:>11d} {r['warm_evals']:>11d} "
+              f"{r['cache_hits']:>11d}")
+
+
+if __name__ == "__main__":
+    main()
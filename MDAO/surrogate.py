@@ -0,0 +1,518 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Mon Oct 19 16:08:12 2026
+
+@Description: Surrogate-assisted optimization driver for expensive models.
+
+    In production the paraboloid stands in for a ROCETS run that takes
+    minutes. SLSQP with finite-difference partials pays for every gradient
+    with one extra model run per design variable, and most of its budget
+    goes there. SurrogateDriver spends true-model runs only where they
+    teach it something:
+
+        1. SAMPLE      Latin-hypercube sample of n_initial points over the
+                       design-variable bounds (true model).
+        2. FIT         Cubic RBF surrogate of the objective, in the unit
+                       box.
+        3. INFILL      Minimize the surrogate -- cheap, so multi-start
+                       L-BFGS-B -- and run the true model only there.
+        4. REFIT       Add the new point to the surrogate incrementally: the
+                       RBF system's inverse is bordered by one row and column
+                       (O(n^2)).
+        5. Repeat 3-4. When the surrogate's optimum is a point already
+           sampled (within xtol) it has nothing new to offer, so instead
+           EXPLORE: run the true model at the point of a box around the best
+           sample that is farthest from every sample, and halve the box if
+           that didn't improve on the best. Stop once the box is smaller
+           than min_radius, or max_evals true runs have been spent.
+
+    The design-variable bounds are required; there are no constraints.
+
+    Usage (from the repo root):
+
+        python -m MDAO.surrogate                       # evals-to-tolerance table
+        python -m MDAO.surrogate --seeds 10
+        python MDAO.paraboloid_min.py --driver surrogate
+"""
+#%%
+import argparse
+import math
+import statistics
+
+import numpy as np
+import openmdao.api as om
+from openmdao.core.driver import Driver, RecordingDebugging
+from scipy.linalg import cho_solve, cholesky, solve_triangular
+from scipy.optimize import minimize
+
+from .benchmark_partials import F_STAR
+from .paraboloid_comp import Paraboloid
+from .paraboloid_problem import DEFAULT_START, DESIGN_VARS, make_problem
+
+
+# =============================================================================
+# Surrogate models (inputs already scaled to the unit box)
+# =============================================================================
+
+class KrigingSurrogate:
+    """
+    Kriging with a linear trend (universal kriging), a Gaussian correlation
+    and one length scale per input (theta), fit by maximum likelihood.
+
+    Not in SURROGATES: on the paraboloid it rarely converges within 50
+    evaluations (samples clustered at the optimum leave R ill-conditioned,
+    and a nugget large enough to fix that smooths away the differences the
+    driver needs). Register it again once it does.
+
+    Args:
+        nugget (float, optional): Added to the correlation diagonal to keep
+            the Cholesky factorization well-conditioned. Default is 1e-10.
+        refit_every (int, optional): Re-estimate theta after this many add()
+            calls; in between, theta is kept and the Cholesky factor is just
+            extended by one row. Default is 5.
+    """
+
+    LOG10_THETA_BOUNDS = (-3.0, 3.0)
+
+    def __init__(self, nugget=1e-10, refit_every=5):
+        self.nugget = nugget
+        self.refit_every = refit_every
+        self.theta = None
+        self.full_fits = 0
+        self.updates = 0
+
+    def _corr(self, A, B):
+        diff = A[:, None, :] - B[None, :, :]
+        return np.exp(-np.einsum('ijk,k->ij', diff * diff, self.theta))
+
+    def _factor(self):
+        """(Re)compute everything that depends on the Cholesky factor."""
+        F = np.hstack([np.ones((len(self.y), 1)), self.X])
+        r_inv_F = cho_solve((self.L, True), F)
+        r_inv_y = cho_solve((self.L, True), self.y)
+        self.beta = np.linalg.lstsq(F.T @ r_inv_F, F.T @ r_inv_y, rcond=None)[0]
+        self.alpha = r_inv_y - r_inv_F @ self.beta
+        self.sigma2 = max((self.y - F @ self.beta) @ self.alpha / len(self.y), 1e-300)
+
+    def _neg_log_likelihood(self, log10_theta):
+        self.theta = 10.0 ** log10_theta
+        R = self._corr(self.X, self.X) + self.nugget * np.eye(len(self.X))
+        try:
+            self.L = cholesky(R, lower=True)
+        except np.linalg.LinAlgError:
+            return 1e300
+        self._factor()
+        log_det = 2.0 * np.log(np.diag(self.L)).sum()
+        return 0.5 * (len(self.y) * math.log(self.sigma2) + log_det)
+
+    def fit(self, X, y):
+        """Fit from scratch, including the length scales."""
+        self.X = np.array(X, dtype=float)
+        self.y = np.array(y, dtype=float)
+        n_dims = self.X.shape[1]
+        bounds = [self.LOG10_THETA_BOUNDS] * n_dims
+
+        starts = [np.zeros(n_dims)]
+        if self.theta is not None:
+            starts.append(np.clip(np.log10(self.theta), *self.LOG10_THETA_BOUNDS))
+        best = min((minimize(self._neg_log_likelihood, s, method='L-BFGS-B', bounds=bounds)
+                    for s in starts), key=lambda res: res.fun)
+
+        self._neg_log_likelihood(best.x)    # leave the model at the best theta
+        self.full_fits += 1
+        self._since_fit = 0
+        return self
+
+    def add(self, x, y):
+        """Add one sample, extending the Cholesky factor (theta unchanged)."""
+        self._since_fit += 1
+        if self._since_fit >= self.refit_every:
+            return self.fit(np.vstack([self.X, x]), np.append(self.y, y))
+
+        x = np.atleast_2d(x)
+        r = self._corr(self.X, x)[:, 0]
+        row = solve_triangular(self.L, r, lower=True)
+        d2 = 1.0 + self.nugget - row @ row
+        if d2 <= 1e-12:                     # (nearly) duplicate point
+            return self.fit(np.vstack([self.X, x]), np.append(self.y, y))
+
+        n = len(self.y)
+        L = np.zeros((n + 1, n + 1))
+        L[:n, :n] = self.L
+        L[n, :n] = row
+        L[n, n] = math.sqrt(d2)
+        self.L = L
+        self.X = np.vstack([self.X, x])
+        self.y = np.append(self.y, y)
+        self._factor()
+        self.updates += 1
+        return self
+
+    def predict(self, X):
+        """Predicted mean at the rows of X."""
+        X = np.atleast_2d(X)
+        return self.beta[0] + X @ self.beta[1:] + self._corr(X, self.X) @ self.alpha
+
+    def mean_and_gradient(self, z):
+        """Predicted mean at one point z, and its gradient with respect to z."""
+        diff = z - self.X
+        weights = self.alpha * np.exp(-(diff * diff) @ self.theta)
+        mean = self.beta[0] + z @ self.beta[1:] + weights.sum()
+        return mean, self.beta[1:] - 2.0 * self.theta * (weights @ diff)
+
+
+class RBFSurrogate:
+    """
+    Cubic radial basis function interpolant with a linear polynomial tail.
+
+    The interpolation system is ordered [polynomial; samples],
+
+        A = | 0  P^T |      A [poly; weights] = [0; y]
+            | P  Phi |
+
+    so a new sample appends one row and column, and add() borders the
+    stored inverse of A (block inverse, O(n^2)) instead of re-solving it.
+    """
+
+    def __init__(self):
+        self.full_fits = 0
+        self.updates = 0
+
+    def fit(self, X, y):
+        """Fit from scratch (inverts the whole system)."""
+        self.X = np.array(X, dtype=float)
+        self.y = np.array(y, dtype=float)
+        n, n_dims = self.X.shape
+        k = n_dims + 1
+        P = np.hstack([np.ones((n, 1)), self.X])
+        A = np.zeros((k + n, k + n))
+        A[:k, k:] = P.T
+        A[k:, :k] = P
+        A[k:, k:] = self._phi(self.X, self.X)
+        self._A_inv = np.linalg.pinv(A)
+        self._solve()
+        self.full_fits += 1
+        return self
+
+    def add(self, x, y):
+        """Add one sample, bordering the inverse by one row and column."""
+        x = np.atleast_2d(x)
+        b = np.concatenate([[1.0], x[0], self._phi(self.X, x)[:, 0]])
+        u = self._A_inv @ b
+        s = -b @ u                          # Schur complement; phi(0) = 0
+        if abs(s) <= 1e-12:                 # (nearly) duplicate point
+            return self.fit(np.vstack([self.X, x]), np.append(self.y, y))
+
+        m = len(b)
+        A_inv = np.empty((m + 1, m + 1))
+        A_inv[:m, :m] = self._A_inv + np.outer(u, u) / s
+        A_inv[:m, m] = A_inv[m, :m] = -u / s
+        A_inv[m, m] = 1.0 / s
+        self._A_inv = A_inv
+        self.X = np.vstack([self.X, x])
+        self.y = np.append(self.y, y)
+        self._solve()
+        self.updates += 1
+        return self
+
+    def _solve(self):
+        k = self.X.shape[1] + 1
+        coef = self._A_inv[:, k:] @ self.y      # right-hand side is [0; y]
+        self.poly, self.weights = coef[:k], coef[k:]
+
+    @staticmethod
+    def _phi(A, B):
+        dist = np.sqrt(((A[:, None, :] - B[None, :, :]) ** 2).sum(axis=2))
+        return dist ** 3
+
+    def predict(self, X):
+        X = np.atleast_2d(X)
+        return self._phi(X, self.X) @ self.weights + self.poly[0] + X @ self.poly[1:]
+
+    def mean_and_gradient(self, z):
+        """Interpolant at one point z, and its gradient with respect to z."""
+        diff = z - self.X
+        dist = np.sqrt((diff * diff).sum(axis=1))
+        mean = self.weights @ dist ** 3 + self.poly[0] + z @ self.poly[1:]
+        return mean, 3.0 * (self.weights * dist) @ diff + self.poly[1:]
+
+
+SURROGATES = {'rbf': RBFSurrogate}
+
+
+# =============================================================================
+# Driver
+# =============================================================================
+
+class SurrogateDriver(Driver):
+    """
+    Optimize a model through a surrogate fit to its true evaluations.
+
+    Options:
+        surrogate (str): A SURROGATES key. Default is 'rbf'.
+        n_initial (int): Space-filling sample size. 0 means 4 * n for n
+            design variables. Default is 0.
+        max_evals (int): Budget of true-model evaluations. Default is 50.
+        xtol (float): The surrogate's optimum counts as already evaluated
+            within xtol (unit box distance) of a sample. Default is 1e-6.
+        radius (float): Initial half-width (unit box) of the exploration box
+            around the best sample. Default is 0.1.
+        min_radius (float): Converged once the exploration box has shrunk
+            below this. Default is 1e-3.
+        n_starts (int): Multi-start count for minimizing the surrogate.
+            Default is 8.
+        seed (int): Seed for the sample and the multi-starts. Default is None.
+
+    Attributes:
+        history (list[tuple]): (design vector, objective) of every true
+            evaluation this run, in order.
+        surrogate: The fitted surrogate after the last run.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.history = []
+        self.surrogate = None
+        self._best_state = None     # (f, inputs, outputs) of the best evaluation
+
+    def _declare_options(self):
+        self.options.declare('surrogate', default='rbf', values=tuple(SURROGATES))
+        self.options.declare('n_initial', types=int, default=0, lower=0)
+        self.options.declare('max_evals', types=int, default=50, lower=1)
+        self.options.declare('xtol', types=float, default=1e-6, lower=0.0)
+        self.options.declare('radius', types=float, default=0.1, lower=0.0)
+        self.options.declare('min_radius', types=float, default=1e-3, lower=0.0)
+        self.options.declare('n_starts', types=int, default=8, lower=1)
+        self.options.declare('seed', types=int, default=None, allow_none=True)
+
+    def _get_name(self):
+        return 'Surrogate'
+
+    # --- design-vector plumbing ---------------------------------------------
+
+    def _flatten_bounds(self):
+        lower, upper, x0 = [], [], []
+        values = self.get_design_var_values()
+        for name, meta in self._designvars.items():
+            size = meta['size']
+            lower.append(np.broadcast_to(meta['lower'], size))
+            upper.append(np.broadcast_to(meta['upper'], size))
+            x0.append(np.ravel(values[name]))
+        lower, upper = np.concatenate(lower), np.concatenate(upper)
+        if not (np.all(np.isfinite(lower)) and np.all(np.isfinite(upper))):
+            raise RuntimeError(f"{self.msginfo}: SurrogateDriver needs finite bounds "
+                               "on every design variable.")
+        return lower, upper, np.concatenate(x0)
+
+    def _evaluate(self, z):
+        """Run the true model at unit-box point z; returns the objective."""
+        x = self._lower + z * (self._upper - self._lower)
+        i = 0
+        for name, meta in self._designvars.items():
+            self._set_design_var(name, x[i:i + meta['size']])
+            i += meta['size']
+
+        with RecordingDebugging(self._get_name(), self.iter_count, self):
+            self._run_solve_nonlinear()
+        self.iter_count += 1
+
+        f = float(np.ravel(list(self.get_objective_values().values())[0])[0])
+        self.history.append((x, f))
+        if self._best_state is None or f < self._best_state[0]:
+            model = self._problem().model
+            self._best_state = (f, model._inputs.asarray(copy=True),
+                                model._outputs.asarray(copy=True))
+        return f
+
+    def _latin_hypercube(self, n, n_dims, rng):
+        strata = (np.arange(n)[:, None] + rng.random((n, n_dims))) / n
+        for col in range(n_dims):
+            strata[:, col] = rng.permutation(strata[:, col])
+        return strata
+
+    def _minimize_surrogate(self, Z, y, rng):
+        """Best of n_starts L-BFGS-B runs on the surrogate mean."""
+        n_dims = Z.shape[1]
+        starts = [Z[np.argmin(y)]] + list(rng.random((self.options['n_starts'] - 1, n_dims)))
+        best = min((minimize(self.surrogate.mean_and_gradient, s, jac=True, method='L-BFGS-B',
+                             bounds=[(0.0, 1.0)] * n_dims) for s in starts),
+                   key=lambda res: res.fun)
+        return np.clip(best.x, 0.0, 1.0)
+
+    def _explore(self, Z, center, radius, rng):
+        """Max-min-distance point (to the samples Z) in a box around center."""
+        candidates = center + radius * (2.0 * rng.random((64 * Z.shape[1], Z.shape[1])) - 1.0)
+        candidates = np.clip(candidates, 0.0, 1.0)
+        dist = np.linalg.norm(candidates[:, None, :] - Z[None, :, :], axis=2).min(axis=1)
+        return candidates[np.argmax(dist)]
+
+    # --- run ----------------------------------------------------------------
+
+    def run(self):
+        """
+        Sample, fit, and infill until converged or out of budget.
+
+        Returns:
+            bool: Failure flag; True if max_evals ran out before converging.
+        """
+        self.result.reset()
+        self.iter_count = 0
+        self.history = []
+        self._best_state = None
+        if len(self._objs) != 1:
+            raise RuntimeError(f"{self.msginfo}: SurrogateDriver supports exactly one objective.")
+
+        opts = self.options
+        rng = np.random.default_rng(opts['seed'])
+        self._lower, self._upper, x0 = self._flatten_bounds()
+        n_dims = len(x0)
+        span = self._upper - self._lower
+
+        # 1. Space-filling sample (the start point is one of the samples)
+        n_initial = max(opts['n_initial'] or 4 * n_dims, n_dims + 1)
+        n_initial = min(n_initial, opts['max_evals'])
+        Z = self._latin_hypercube(n_initial, n_dims, rng)
+        Z[0] = np.clip((x0 - self._lower) / span, 0.0, 1.0)
+        y = np.array([self._evaluate(z) for z in Z])
+
+        # 2. Surrogate
+        self.surrogate = SURROGATES[opts['surrogate']]()
+        self.surrogate.fit(Z, y)
+
+        # 3-5. Infill, exploring around the best sample when that stalls
+        radius = opts['radius']
+        converged = False
+        while len(y) < opts['max_evals']:
+            z = self._minimize_surrogate(Z, y, rng)
+            explore = np.min(np.linalg.norm(Z - z, axis=1)) <= opts['xtol']
+            if explore:
+                if radius < opts['min_radius']:
+                    converged = True
+                    break
+                z = self._explore(Z, Z[np.argmin(y)], radius, rng)
+            f = self._evaluate(z)
+            if explore and f >= y.min():
+                radius /= 2.0
+            Z = np.vstack([Z, z])
+            y = np.append(y, f)
+            self.surrogate.add(z, f)
+
+        # Leave the model at the best point found: put back the vectors saved
+        # when it was evaluated rather than spend another true-model run.
+        _, inputs, outputs = self._best_state
+        model = self._problem().model
+        model._inputs.set_val(inputs)
+        model._outputs.set_val(outputs)
+
+        self.result.exit_status = ('exploration box below min_radius' if converged
+                                   else f'max_evals={opts["max_evals"]} reached')
+        return not converged
+
+
+# =============================================================================
+# Evals-to-tolerance comparison against SLSQP
+# =============================================================================
+
+class TracedParaboloid(Paraboloid):
+    """Paraboloid that records f for every compute() (including FD steps)."""
+
+    def initialize(self):
+        super().initialize()
+        self.trace = []
+
+    def compute(self, inputs, outputs):
+        super().compute(inputs, outputs)
+        self.trace.append(float(outputs['f'][0]))
+
+
+def evals_to_tolerance(trace, tol, f_star=F_STAR):
+    """
+    True-model evaluations until the best f seen is within tol of f_star.
+
+    Returns:
+        int or None: 1-based evaluation count, or None if never reached.
+    """
+    best = np.minimum.accumulate(trace)
+    hit = np.nonzero(best - f_star <= tol)[0]
+    return int(hit[0]) + 1 if hit.size else None
+
+
+def run_traced(driver, partials_method='fd', start=DEFAULT_START):
+    """
+    One optimization of the paraboloid with `driver`, tracing every compute.
+
+    Returns:
+        dict with "trace" (f per true evaluation), "evals", "f" and "success".
+    """
+    comp = TracedParaboloid(partials_method=partials_method)
+    prob = make_problem(component=comp, driver=driver)
+    for name, value in zip(DESIGN_VARS, start):
+        prob.set_val(name, value)
+    result = prob.run_driver()
+    return {
+        'trace': comp.trace,
+        'evals': len(comp.trace),
+        'f': float(prob.get_val('paraboloid.f')[0]),
+        'success': bool(result.success),
+    }
+
+
+def compare(tols=(1e-1, 1e-2, 1e-3), seeds=range(5), surrogate='rbf',
+            max_evals=50, start=DEFAULT_START):
+    """
+    True evaluations needed to reach each tolerance on f: SLSQP (partials by
+    finite difference, as for a black-box ROCETS run, and analytic for
+    reference) vs SurrogateDriver (median over seeds).
+
+    Returns:
+        dict[str, dict]: per method, "to_tol" {tol: evals or None}, and
+            "evals" (total spent before the method stopped).
+    """
+    report = {}
+    for method in ('fd', 'exact'):
+        driver = om.ScipyOptimizeDriver(optimizer='SLSQP', disp=False)
+        run = run_traced(driver, partials_method=method, start=start)
+        report[f'slsqp-{method}'] = {
+            'to_tol': {tol: evals_to_tolerance(run['trace'], tol) for tol in tols},
+            'evals': run['evals'],
+        }
+
+    runs = [run_traced(SurrogateDriver(surrogate=surrogate, max_evals=max_evals, seed=seed),
+                       start=start) for seed in seeds]
+
+    def median_or_none(counts):
+        # A seed that never reached tol counts as "worse than any budget"
+        if sum(c is None for c in counts) * 2 >= len(counts):
+            return None
+        return statistics.median(math.inf if c is None else c for c in counts)
+
+    report[f'surrogate-{surrogate}'] = {
+        'to_tol': {tol: median_or_none([evals_to_tolerance(r['trace'], tol) for r in runs])
+                   for tol in tols},
+        'evals': statistics.median(r['evals'] for r in runs),
+    }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='True-model evaluations to reach a tolerance: surrogate vs SLSQP.')
+    parser.add_argument('--surrogate', choices=tuple(SURROGATES), default='rbf')
+    parser.add_argument('--tols', type=float, nargs='+', default=[1e-1, 1e-2, 1e-3])
+    parser.add_argument('--seeds', type=int, default=5,
+                        help='surrogate runs (different initial samples)')
+    parser.add_argument('--max-evals', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    report = compare(args.tols, range(args.seeds), args.surrogate, args.max_evals)
+    header = ''.join(f"{'|df|<=' + format(tol, 'g'):>12}" for tol in args.tols)
+    print(f"\n{'method':<18}{header}{'total evals':>13}")
+    for label, r in report.items():
+        cells = ''.join(f"{'-' if n is None else format(n, 'g'):>12}" for n in r['to_tol'].values())
+        print(f"{label:<18}{cells}{r['evals']:>13g}")
+    print("\n(true-model evaluations; '-' = tolerance not reached; surrogate = median over seeds)")
+
+
+if __name__ == "__main__":
+    main()
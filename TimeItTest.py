@@ -3,15 +3,216 @@
 Created on Mon Mar 31 15:41:09 2025
 
 @author: dpriley1
+
+List comprehension vs map(lambda) -- and, further down, a size sweep over the
+other ways of doing the same element-wise transform.
 """
 
-import timeit
+import argparse
+import json
+import os
+from array import array
+
+import numpy as np
+
+from bench import benchmark, format_bytes, run
+
+try:
+    import matplotlib.pyplot as plt
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
 
 # Using list comprehension
-list_time = timeit.timeit("[x**2 for x in range(1000)]", number=1000)
+def bench_list_comprehension():
+    [x**2 for x in range(1000)]
 
 # Using map with lambda
-map_time = timeit.timeit("list(map(lambda x: x**2, range(1000)))", number=1000)
+def bench_map_lambda():
+    list(map(lambda x: x**2, range(1000)))
+
+
+#%% SIZE SWEEP: when should the data-reduction code switch strategies?
+"""
+Every strategy computes the same thing -- square each element, then sum the
+result (transform + reduce, like our data-reduction code) -- for input sizes
+from 10 to 10^8:
+
+    list_comprehension   sum([x*x for x in data])          builds a list
+    map_lambda           sum(list(map(lambda x: x*x, data)))
+    generator            sum(x*x for x in data)             streams, O(1) memory
+    array_module         sum(array('d', (x*x ...)))         compact 8 B/element
+    numpy                (a * a).sum()                      one temporary array
+    numpy_chunked        same, CHUNK elements at a time     bounded temporary
+
+Pure-Python strategies iterate a range() (as above); the NumPy ones get a
+float64 array that already exists (built in setup, not timed or counted).
+Times are reported PER ELEMENT; peak memory is what the call allocated.
+
+    python TimeItTest.py --sweep -o sweep.json          # run, table, plot
+    python TimeItTest.py --report sweep.json            # from a saved run
+"""
+
+SIZES = [10**k for k in range(1, 9)]
+CHUNK = 65_536
+PY_STRATEGIES = ['list_comprehension', 'map_lambda', 'generator', 'array_module']
+NP_STRATEGIES = ['numpy', 'numpy_chunked']
+STRATEGIES = PY_STRATEGIES + NP_STRATEGIES
+
+# Pure-Python strategies above 10^7 elements take tens of seconds and several
+# GB per call (a list of 10^8 floats is ~3 GB) while scaling linearly; cap
+# them unless asked to go further with --python-max. The cap is read from the
+# environment because bench.py re-imports this file to discover benchmarks.
+PYTHON_MAX = int(os.environ.get('SWEEP_PYTHON_MAX', 10**7))
+
+
+def _list_comprehension(data):
+    return sum([x * x for x in data])
+
+def _map_lambda(data):
+    return sum(list(map(lambda x: x * x, data)))
+
+def _generator(data):
+    return sum(x * x for x in data)
+
+def _array_module(data):
+    return sum(array('d', (x * x for x in data)))
+
+def _numpy(data):
+    return float((data * data).sum())
+
+def _numpy_chunked(data):
+    total = 0.0
+    buf = np.empty(min(CHUNK, len(data)))
+    for start in range(0, len(data), CHUNK):
+        chunk = data[start:start + CHUNK]
+        out = buf[:len(chunk)]
+        np.multiply(chunk, chunk, out=out)
+        total += out.sum()
+    return float(total)
+
+TRANSFORMS = {
+    'list_comprehension': _list_comprehension,
+    'map_lambda': _map_lambda,
+    'generator': _generator,
+    'array_module': _array_module,
+    'numpy': _numpy,
+    'numpy_chunked': _numpy_chunked,
+}
+
+
+def _setup_sweep(strategy, n):
+    data = np.arange(n, dtype=np.float64) if strategy in NP_STRATEGIES else range(n)
+    return TRANSFORMS[strategy], data
+
+
+# Two benchmarks so the pure-Python sizes are capped even when discovered by
+# `python bench.py run TimeItTest.py`.
+@benchmark(params={'strategy': PY_STRATEGIES, 'n': [n for n in SIZES if n <= PYTHON_MAX]},
+           setup=_setup_sweep, ops=lambda n, **_: n)
+def bench_sweep_python(transform, data):
+    transform(data)
+
+
+@benchmark(params={'strategy': NP_STRATEGIES, 'n': SIZES}, setup=_setup_sweep,
+           ops=lambda n, **_: n)
+def bench_sweep_numpy(transform, data):
+    transform(data)
+
+
+def _sweep_results(report):
+    out = {}
+    for r in report['results'].values():
+        p = r['params']
+        if 'strategy' in p and 'n' in p:
+            out[(p['strategy'], p['n'])] = r
+    return out
+
+
+def print_sweep(report):
+    """Per-element time, throughput and peak memory vs size."""
+    results = _sweep_results(report)
+    sizes = sorted({n for _, n in results})
+
+    for title, key, fmt in (
+            ('ns per element', 'median', lambda r: f"{1e9 * r['median']:.2f}"),
+            ('throughput [M elements/s]', 'median', lambda r: f"{1e-6 / r['median']:.1f}"),
+            ('peak memory', 'peak_bytes', lambda r: format_bytes(r['peak_bytes']))):
+        print(f"\n{title}")
+        print(f"{'N':>10}" + ''.join(f'{s:>20}' for s in STRATEGIES))
+        for n in sizes:
+            cells = [results.get((s, n)) for s in STRATEGIES]
+            print(f'{n:>10}' + ''.join(
+                f'{fmt(c):>20}' if c and key in c else f"{'-':>20}" for c in cells))
+
+    # Fastest strategy per size = where to switch
+    print(f"\n{'N':>10}  fastest")
+    for n in sizes:
+        timed = [(results[s, n]['median'], s) for s in STRATEGIES if (s, n) in results]
+        print(f'{n:>10}  {min(timed)[1]}')
+
+
+def plot_sweep(report, path='sweep.png'):
+    """Throughput (and peak memory, if recorded) vs size, log-log."""
+    if not MATPLOTLIB_AVAILABLE:
+        print('matplotlib not installed -- skipping plot')
+        return
+    results = _sweep_results(report)
+    has_mem = any('peak_bytes' in r for r in results.values())
+    fig, axes = plt.subplots(1, 2 if has_mem else 1, figsize=(12 if has_mem else 7, 5),
+                             squeeze=False)
+
+    for s in STRATEGIES:
+        sizes = sorted(n for (name, n) in results if name == s)
+        if not sizes:
+            continue
+        axes[0][0].loglog(sizes, [1e-6 / results[s, n]['median'] for n in sizes],
+                          marker='o', label=s)
+        if has_mem:
+            axes[0][1].loglog(sizes, [max(results[s, n].get('peak_bytes', 0), 1)
+                                      for n in sizes], marker='o', label=s)
+
+    axes[0][0].set(xlabel='elements', ylabel='M elements / s',
+                   title='Throughput per element')
+    if has_mem:
+        axes[0][1].set(xlabel='elements', ylabel='bytes', title='Peak memory')
+    axes[0][0].legend()
+    for ax in axes[0]:
+        ax.grid(True, which='both', alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
+    print(f'Saved plot to {path}')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Element-wise transform benchmarks.')
+    parser.add_argument('--sweep', action='store_true',
+                        help='run the size sweep instead of the 1000-element test')
+    parser.add_argument('--max-size', type=int, default=max(SIZES))
+    parser.add_argument('--python-max', type=int, default=PYTHON_MAX,
+                        help='largest size for the pure-Python strategies')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('-o', '--output', help='save results to this JSON file')
+    parser.add_argument('--report', help='table + plot from a saved JSON file')
+    parser.add_argument('--plot', default='sweep.png', help='plot file name')
+    args = parser.parse_args()
+
+    if args.report:
+        with open(args.report) as f:
+            report = json.load(f)
+    elif args.sweep:
+        os.environ['SWEEP_PYTHON_MAX'] = str(args.python_max)
+
+        def in_range(name, params):
+            return params['n'] <= args.max_size
+
+        report = run([__file__], 'bench_sweep', repeats=args.repeats, target=0.2,
+                     warmup=0.0, output=args.output, memory=True, select=in_range)
+    else:
+        # Same as:  python bench.py run TimeItTest.py  (minus the sweep)
+        run([__file__], output=args.output,
+            select=lambda name, params: 'bench_sweep' not in name)
+        raise SystemExit
 
-print(f"List comprehension time: {list_time} seconds")
-print(f"Map time: {map_time} seconds")
+    print_sweep(report)
+    plot_sweep(report, args.plot)
@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Tue Oct 20 08:47:12 2026
+
+@Description: Small statistical micro-benchmark runner.
+
+    A single timeit.timeit() call gives one number with no idea of how noisy
+    it is. This runner, for every benchmark:
+
+        1. WARMS UP    -- calls it for `warmup` seconds first (caches, JIT-ish
+                          specialization in 3.11+, CPU frequency ramp-up)
+        2. CALIBRATES  -- picks a loop count so one repeat takes >= the target
+                          time (same idea as timeit.Timer.autorange)
+        3. REPEATS     -- times `repeats` independent repeats
+        4. SUMMARIZES  -- median time per call + a bootstrap 95% confidence
+                          interval on that median
+        5. SAVES       -- everything (raw repeats included) to a JSON file
+
+    and `compare` flags regressions between two saved result files.
+
+    With --memory, the peak memory of one extra (untimed) call is recorded
+    too, via tracemalloc.
+
+    WRITING BENCHMARKS
+        Any module-level function named bench_* is discovered automatically:
+
+            def bench_list_comprehension():
+                [x**2 for x in range(1000)]
+
+        Use @benchmark for parameters and setup that shouldn't be timed.
+        setup(**params) returns the positional args for the timed call:
+
+            @benchmark(params={'n': [10, 1000]}, setup=lambda n: (list(range(n)),))
+            def bench_sum(data):
+                sum(data)
+
+    USAGE
+
+        python bench.py run TimeItTest.py ifsVsMatchCases.py -o base.json
+        python bench.py run ifsVsMatchCases.py -k match -o new.json
+        python bench.py compare base.json new.json
+"""
+#%%
+import argparse
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+
+# =============================================================================
+# Declaring benchmarks
+# =============================================================================
+
+def benchmark(func=None, *, name=None, params=None, setup=None, ops=1):
+    """
+    Mark a function as a benchmark (optional for bench_* functions).
+
+    Args:
+        func (callable): The function to time.
+        name (str, optional): Report name. Default is func.__name__.
+        params (dict, optional): {param: [values]}; one benchmark is run per
+            combination (cartesian product). Default is None.
+        setup (callable, optional): Called with the params of each case, NOT
+            timed; returns a tuple of positional args for func. Default is
+            None (func is called with the params as keyword args).
+        ops (int or callable, optional): Operations done per call of func
+            (e.g. the length of an inner loop); reported times are divided
+            by it so results are per operation. A callable gets the params
+            of each case, e.g. ops=lambda n, **_: n. Default is 1.
+
+    Returns:
+        callable: func, unchanged apart from a `_bench` attribute.
+    """
+    def mark(f):
+        f._bench = {'name': name or f.__name__, 'params': params or {},
+                    'setup': setup, 'ops': ops}
+        return f
+
+    return mark(func) if func is not None else mark
+
+
+def _load_module(path):
+    # Load by path so files like MDAO.paraboloid_min.py (dots in the name)
+    # still work. The name must not be '__main__' or the script would
+    # re-run its own CLI.
+    mod_name = '_bench_' + os.path.splitext(os.path.basename(path))[0].replace('.', '_')
+    spec = importlib.util.spec_from_file_location(mod_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[mod_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover(paths, keyword=None, select=None):
+    """
+    Collect benchmark cases from the given files.
+
+    Args:
+        paths (list[str]): Python files to search.
+        keyword (str, optional): Only keep cases whose full name contains it.
+        select (callable, optional): select(name, params) -> bool; only keep
+            cases it returns True for.
+
+    Returns:
+        list[dict]: one case per (function, parameter combination), with
+            "name", "func", "params", "setup" and "ops".
+    """
+    cases = []
+    for path in paths:
+        module = _load_module(path)
+        for attr, func in vars(module).items():
+            if not callable(func) or getattr(func, '__module__', None) != module.__name__:
+                continue
+            meta = getattr(func, '_bench', None)
+            if meta is None:
+                if not attr.startswith('bench_'):
+                    continue
+                meta = {'name': attr, 'params': {}, 'setup': None, 'ops': 1}
+
+            keys = list(meta['params'])
+            for values in itertools.product(*(meta['params'][k] for k in keys)):
+                params = dict(zip(keys, values))
+                label = ', '.join(f'{k}={v}' for k, v in params.items())
+                full_name = f"{os.path.basename(path)}::{meta['name']}"
+                if label:
+                    full_name += f'[{label}]'
+                if keyword and keyword not in full_name:
+                    continue
+                if select is not None and not select(full_name, params):
+                    continue
+                ops = meta['ops'](**params) if callable(meta['ops']) else meta['ops']
+                cases.append({'name': full_name, 'func': func, 'params': params,
+                              'setup': meta['setup'], 'ops': ops})
+    return cases
+
+
+# =============================================================================
+# Timing
+# =============================================================================
+
+def _time_loops(func, args, kwargs, loops):
+    it = itertools.repeat(None, loops)
+    t0 = time.perf_counter()
+    for _ in it:
+        func(*args, **kwargs)
+    return time.perf_counter() - t0
+
+
+def calibrate(func, args=(), kwargs=None, target=0.05):
+    """Smallest loop count in 1, 2, 5, 10, 20, 50, ... taking >= target s."""
+    kwargs = kwargs or {}
+    for loops in (m * 10**e for e in range(10) for m in (1, 2, 5)):
+        if _time_loops(func, args, kwargs, loops) >= target:
+            return loops
+    return loops
+
+
+def bootstrap_ci(samples, stat=statistics.median, confidence=0.95,
+                 resamples=2000, seed=0):
+    """Percentile-bootstrap confidence interval for stat(samples)."""
+    rng = random.Random(seed)
+    n = len(samples)
+    boots = sorted(stat(rng.choices(samples, k=n)) for _ in range(resamples))
+    lo = boots[int((1 - confidence) / 2 * resamples)]
+    hi = boots[int((1 + confidence) / 2 * resamples) - 1]
+    return lo, hi
+
+
+def peak_memory(func, args=(), kwargs=None):
+    """
+    Peak bytes allocated during one call of func, via tracemalloc.
+
+    Only allocations made during the call count (setup data that already
+    exists doesn't). NumPy reports its array buffers to tracemalloc, so
+    those are included.
+    """
+    kwargs = kwargs or {}
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    func(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1] - base
+    if not was_tracing:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(case, repeats=20, target=0.05, warmup=0.1, memory=False):
+    """
+    Warm up, calibrate and time one benchmark case.
+
+    Args:
+        memory (bool, optional): Also record the peak memory of one extra,
+            untimed call (tracemalloc slows calls down, so never during
+            timing). Default is False.
+
+    Returns:
+        dict: loops, repeats, per-op times for every repeat and the
+            summary statistics (all times in seconds per operation), plus
+            "peak_bytes" when memory=True.
+    """
+    params = case['params']
+    if case['setup'] is not None:
+        args, kwargs = tuple(case['setup'](**params)), {}
+    else:
+        args, kwargs = (), params
+    func = case['func']
+
+    t_end = time.perf_counter() + warmup
+    while time.perf_counter() < t_end:
+        func(*args, **kwargs)
+
+    loops = calibrate(func, args, kwargs, target)
+    per_op = loops * case['ops']
+    times = [_time_loops(func, args, kwargs, loops) / per_op for _ in range(repeats)]
+
+    ci_low, ci_high = bootstrap_ci(times)
+    result = {
+        'params': {k: repr(v) if not isinstance(v, (int, float, str)) else v
+                   for k, v in params.items()},
+        'loops': loops,
+        'ops': case['ops'],
+        'repeats': repeats,
+        'times': times,
+        'median': statistics.median(times),
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+        'mean': statistics.fmean(times),
+        'stdev': statistics.stdev(times) if repeats > 1 else 0.0,
+        'min': min(times),
+    }
+    if memory:
+        result['peak_bytes'] = peak_memory(func, args, kwargs)
+    return result
+
+
+def _machine_info():
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3f} {unit}'
+    return f'{seconds / 1e-9:.1f} ns'
+
+
+def format_bytes(n):
+    for unit, scale in (('GB', 1 << 30), ('MB', 1 << 20), ('kB', 1 << 10)):
+        if n >= scale:
+            return f'{n / scale:.2f} {unit}'
+    return f'{n} B'
+
+
+def run(paths, keyword=None, repeats=20, target=0.05, warmup=0.1, output=None,
+        memory=False, select=None):
+    """
+    Discover and run benchmarks, print a table and optionally save JSON.
+
+    Returns:
+        dict: {"machine": {...}, "results": {name: result}}
+    """
+    cases = discover(paths, keyword, select)
+    if not cases:
+        print('No benchmarks found.')
+    results = {}
+    width = max((len(c['name']) for c in cases), default=10)
+
+    print(f"{'benchmark':<{width}}  {'median':>11}  {'95% CI':>25}  {'loops':>8}"
+          + (f"  {'peak mem':>10}" if memory else ''))
+    for case in cases:
+        r = run_case(case, repeats=repeats, target=target, warmup=warmup,
+                     memory=memory)
+        results[case['name']] = r
+        ci = f"[{format_time(r['ci_low'])}, {format_time(r['ci_high'])}]"
+        print(f"{case['name']:<{width}}  {format_time(r['median']):>11}  "
+              f"{ci:>25}  {r['loops']:>8d}"
+              + (f"  {format_bytes(r['peak_bytes']):>10}" if memory else ''))
+
+    report = {'machine': _machine_info(), 'results': results}
+    if output:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'\nSaved {len(results)} results to {output}')
+    return report
+
+
+# =============================================================================
+# Comparing result files
+# =============================================================================
+
+def compare(base, new, threshold=0.05):
+    """
+    Compare two result files benchmark by benchmark.
+
+    A benchmark is flagged as a REGRESSION (or an improvement) only if the
+    medians differ by more than `threshold` (relative) AND the two 95%
+    confidence intervals don't overlap -- so noise alone doesn't trip it.
+
+    Args:
+        base (dict): Baseline report (as saved by run()).
+        new (dict): Report to check.
+        threshold (float, optional): Minimum relative change. Default 5%.
+
+    Returns:
+        list[dict]: one row per benchmark present in both files.
+    """
+    rows = []
+    for name, b in base['results'].items():
+        n = new['results'].get(name)
+        if n is None:
+            continue
+        ratio = n['median'] / b['median']
+        if ratio > 1 + threshold and n['ci_low'] > b['ci_high']:
+            status = 'REGRESSION'
+        elif ratio < 1 - threshold and n['ci_high'] < b['ci_low']:
+            status = 'improved'
+        else:
+            status = ''
+        rows.append({'name': name, 'base': b['median'], 'new': n['median'],
+                     'ratio': ratio, 'status': status})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Statistical micro-benchmark runner.')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_run = sub.add_parser('run', help='discover and run benchmarks')
+    p_run.add_argument('paths', nargs='+', help='Python files with bench_* functions')
+    p_run.add_argument('-k', '--keyword', help='only run names containing this')
+    p_run.add_argument('-o', '--output', help='save results to this JSON file')
+    p_run.add_argument('--repeats', type=int, default=20)
+    p_run.add_argument('--target', type=float, default=0.05,
+                       help='seconds per repeat the loop count is calibrated to')
+    p_run.add_argument('--warmup', type=float, default=0.1, help='seconds')
+    p_run.add_argument('--memory', action='store_true',
+                       help='also record peak memory (tracemalloc)')
+
+    p_cmp = sub.add_parser('compare', help='compare two result files')
+    p_cmp.add_argument('base')
+    p_cmp.add_argument('new')
+    p_cmp.add_argument('--threshold', type=float, default=0.05)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        run(args.paths, args.keyword, args.repeats, args.target, args.warmup,
+            args.output, args.memory)
+        return 0
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    rows = compare(base, new, args.threshold)
+    width = max((len(r['name']) for r in rows), default=10)
+    print(f"{'benchmark':<{width}}  {'base':>11}  {'new':>11}  {'ratio':>7}")
+    for r in rows:
+        print(f"{r['name']:<{width}}  {format_time(r['base']):>11}  "
+              f"{format_time(r['new']):>11}  {r['ratio']:>7.3f}  {r['status']}")
+
+    regressions = sum(r['status'] == 'REGRESSION' for r in rows)
+    if regressions:
+        print(f'\n{regressions} regression(s) beyond {args.threshold:.0%}')
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+main.py — Eel backend that routes the schematic's edges around its blocks.
+
+WORKFLOW:
+    1. Eel starts and serves web/index.html (or its dist/ build)
+    2. schematic.js sends the whole graph once: eel.set_graph(nodes, edges)
+    3. Python routes every edge (router.py) and returns {edge_id: svg_path}
+    4. While the user drags, the page draws the cheap L route immediately
+       and sends the latest node positions: eel.move_nodes({id: {x, y}})
+    5. Python invalidates only the routes the move touches, re-routes them
+       (in parallel for big batches) and returns just those paths
+    6. schematic.js swaps them in on its next animation frame
+
+WHY ONE REQUEST IN FLIGHT?
+    schematic.js never has more than one move_nodes() call outstanding. Moves
+    made while a call is running are merged (latest position per node wins)
+    and sent when it returns, so a fast drag never queues up stale routing
+    work here.
+"""
+
+import argparse
+import os
+import sys
+
+import eel
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from eel_assets import use_built_assets  # noqa: E402  (repo root)
+
+from router import OrthogonalRouter
+
+
+router = OrthogonalRouter()
+
+
+@eel.expose
+def set_graph(nodes, edges):
+    """
+    Replace the graph and route every edge.
+
+    Returns:
+        dict: {"success": True, "paths": {edge_id: d}, "stats": {...}}
+    """
+    try:
+        router.set_graph(nodes, edges)
+        paths = router.route()
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    return {"success": True, "paths": paths, "stats": router.stats.to_dict()}
+
+
+@eel.expose
+def move_nodes(moves):
+    """
+    Apply node moves ({node_id: {"x": .., "y": ..}}) and re-route what they
+    invalidated.
+
+    Returns:
+        dict: {"success": True, "paths": {edge_id: d}} -- changed edges only.
+    """
+    try:
+        paths = router.route(router.move_nodes(moves))
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    return {"success": True, "paths": paths, "ms": router.stats.last_batch_ms}
+
+
+@eel.expose
+def route_edges(edge_ids=None):
+    """Paths for `edge_ids` (default: all), from the cache where possible."""
+    return {"success": True, "paths": router.route(edge_ids)}
+
+
+@eel.expose
+def router_stats():
+    return router.stats.to_dict()
+
+
+def start_app():
+    """Initialize and launch the Eel application."""
+    parser = argparse.ArgumentParser(description="Schematic editor with routed edges.")
+    parser.add_argument("--workers", type=int, default=router.workers,
+                        help="processes used for big routing batches")
+    parser.add_argument("--bend-penalty", type=float, default=router.bend_penalty)
+    args = parser.parse_args()
+    router.workers = args.workers
+    router.bend_penalty = args.bend_penalty
+
+    # Only web/ is served: never this folder, which holds the Python sources
+    web_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "web")
+    web_root, app = use_built_assets(web_dir)
+    eel.init(web_root)
+    try:
+        eel.start("index.html", size=(1200, 800), port=0, app=app)
+    finally:
+        router.close()
+
+
+if __name__ == "__main__":
+    start_app()
@@ -0,0 +1,479 @@
+"""
+router.py — Obstacle-avoiding orthogonal edge router for the schematic.
+
+WHY IN PYTHON?
+    schematic.js draws each edge as an L: horizontal, then vertical, straight
+    through whatever blocks are in the way. Real routing (find a path around
+    every block, prefer few bends) is a graph search per edge. Doing that in
+    JS on every mousemove would freeze the page on a large ROCETS schematic,
+    so the browser keeps drawing the cheap L while dragging and asks this
+    module (through Eel, see main.py) for proper routes.
+
+HOW AN EDGE IS ROUTED:
+    1. CORRIDOR   Only blocks near the edge matter. The corridor is the
+                  bounding box of the two port stubs plus some padding; the
+                  blocks overlapping it are found with a spatial grid.
+    2. SPARSE ORTHOGONAL VISIBILITY GRAPH
+                  Candidate x coordinates = the corridor blocks' left/right
+                  sides (inflated by `clearance`) + the two port stubs; same
+                  for y. Vertices are their crossings that are not inside a
+                  block, edges join neighbouring vertices when the segment
+                  between them doesn't cut through a block. With k blocks in
+                  the corridor that's O(k^2) vertices, however big the
+                  schematic is.
+    3. A* WITH BEND PENALTIES
+                  State = (vertex, direction of travel). Cost = path length
+                  + `bend_penalty` per 90-degree turn, so among equally short
+                  routes the one with fewest bends wins. Manhattan distance
+                  is the (admissible) heuristic.
+    4. FALLBACK   No route inside the corridor -> double the padding and try
+                  again (3 times), then give up and draw the L.
+
+CACHING / INVALIDATION:
+    Each route is cached together with its corridor, and corridors are
+    indexed in a second spatial grid. Moving a node invalidates the edges
+    attached to it plus the edges whose corridor its old or new rectangle
+    overlaps. Nothing else is re-routed.
+
+PARALLELISM:
+    Edges don't avoid each other, so every invalid edge can be routed
+    independently. Big batches go to a process pool: the parent collects each
+    edge's corridor blocks and ships (stubs, blocks) to a worker, so workers
+    need no copy of the schematic.
+
+OUTPUT:
+    SVG path strings ("M x y L x y ..."), batched as {edge_id: d}.
+"""
+
+import heapq
+import math
+import os
+import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+SIDES = {"E": (1, 0), "W": (-1, 0), "N": (0, -1), "S": (0, 1)}
+
+Rect = Tuple[float, float, float, float]    # x0, y0, x1, y1
+
+
+# =============================================================================
+# Spatial grid (shared by the node index and the corridor index)
+# =============================================================================
+
+class SpatialGrid:
+    """Uniform grid: cell -> set of keys whose rectangle overlaps the cell."""
+
+    def __init__(self, cell_size: float = 256.0):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], set] = {}
+        self.rects: Dict[str, Rect] = {}
+
+    def _cells(self, rect: Rect):
+        c = self.cell_size
+        x0, y0, x1, y1 = rect
+        for cx in range(math.floor(x0 / c), math.floor(x1 / c) + 1):
+            for cy in range(math.floor(y0 / c), math.floor(y1 / c) + 1):
+                yield cx, cy
+
+    def insert(self, key: str, rect: Rect):
+        self.remove(key)
+        self.rects[key] = rect
+        for cell in self._cells(rect):
+            self.cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key: str):
+        rect = self.rects.pop(key, None)
+        if rect is None:
+            return
+        for cell in self._cells(rect):
+            keys = self.cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.cells[cell]
+
+    def query(self, rect: Rect) -> set:
+        """Keys whose rectangle overlaps `rect`."""
+        found = set()
+        for cell in self._cells(rect):
+            found.update(self.cells.get(cell, ()))
+        return {k for k in found if _overlaps(self.rects[k], rect)}
+
+
+def _overlaps(a: Rect, b: Rect) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+# =============================================================================
+# Routing one edge (pure function -- runs in worker processes too)
+# =============================================================================
+
+def route_path(start, start_side, goal, goal_side, blocks: List[Rect], bounds: Rect,
+               bend_penalty: float) -> Optional[List[Tuple[float, float]]]:
+    """
+    A* over the sparse orthogonal visibility graph of `blocks` in `bounds`.
+
+    Args:
+        start, goal: Port stub points (already `clearance` outside the block).
+        start_side, goal_side: "N"/"E"/"S"/"W" -- the direction the path
+            leaves `start` in, and the side of its block `goal` is on.
+        blocks: Inflated obstacle rectangles (x0, y0, x1, y1).
+        bounds: Search area; the path stays inside it.
+        bend_penalty: Extra cost per 90-degree turn.
+
+    Returns:
+        List of corner points from start to goal, or None if there's no path.
+    """
+    xs = sorted({start[0], goal[0], bounds[0], bounds[2]}
+                | {v for b in blocks for v in (b[0], b[2]) if bounds[0] <= v <= bounds[2]})
+    ys = sorted({start[1], goal[1], bounds[1], bounds[3]}
+                | {v for b in blocks for v in (b[1], b[3]) if bounds[1] <= v <= bounds[3]})
+    nx, ny = len(xs), len(ys)
+
+    # Blocked vertices and blocked unit segments, marked block by block.
+    # Every block side is a grid line, so a segment between neighbouring
+    # grid lines is either entirely inside a block or entirely outside.
+    inside = bytearray(nx * ny)       # vertex (i, j) strictly inside a block
+    h_blocked = bytearray(nx * ny)    # segment (i, j) -> (i + 1, j)
+    v_blocked = bytearray(nx * ny)    # segment (i, j) -> (i, j + 1)
+    for x0, y0, x1, y1 in blocks:
+        i0, i1 = bisect_left(xs, x0), bisect_right(xs, x1) - 1     # x0 <= xs <= x1
+        j0, j1 = bisect_left(ys, y0), bisect_right(ys, y1) - 1
+        for j in range(j0, j1 + 1):
+            interior_row = y0 < ys[j] < y1
+            for i in range(i0, i1 + 1):
+                k = j * nx + i
+                interior_col = x0 < xs[i] < x1
+                if interior_row and interior_col:
+                    inside[k] = 1
+                if interior_row and i < i1:
+                    h_blocked[k] = 1
+                if interior_col and j < j1:
+                    v_blocked[k] = 1
+
+    si, sj = xs.index(start[0]), ys.index(start[1])
+    gi, gj = xs.index(goal[0]), ys.index(goal[1])
+    start_axis = 0 if start_side in "EW" else 1
+    goal_axis = 0 if goal_side in "EW" else 1
+    gx, gy = goal
+
+    # (f, g, tie, i, j, axis); axis 0 = horizontal travel, 1 = vertical
+    open_heap = [(abs(start[0] - gx) + abs(start[1] - gy), 0.0, 0, si, sj, start_axis)]
+    best = {(si, sj, start_axis): 0.0}
+    parent = {}
+    tie = 0
+    while open_heap:
+        _, g, _, i, j, axis = heapq.heappop(open_heap)
+        if g > best.get((i, j, axis), math.inf):
+            continue
+        if i == gi and j == gj:
+            # Arriving along the wrong axis needs one more bend into the port
+            if axis != goal_axis:
+                g += bend_penalty
+            state = (i, j, axis)
+            points = [(xs[i], ys[j])]
+            while state in parent:
+                state = parent[state]
+                points.append((xs[state[0]], ys[state[1]]))
+            return _simplify(points[::-1])
+
+        k = j * nx + i
+        for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            ni, nj = i + di, j + dj
+            if not (0 <= ni < nx and 0 <= nj < ny):
+                continue
+            if di:
+                if h_blocked[k if di > 0 else k - 1]:
+                    continue
+                new_axis, step = 0, abs(xs[ni] - xs[i])
+            else:
+                if v_blocked[k if dj > 0 else k - nx]:
+                    continue
+                new_axis, step = 1, abs(ys[nj] - ys[j])
+            if inside[nj * nx + ni]:
+                continue
+            ng = g + step + (bend_penalty if new_axis != axis else 0.0)
+            state = (ni, nj, new_axis)
+            if ng < best.get(state, math.inf):
+                best[state] = ng
+                parent[state] = (i, j, axis)
+                tie += 1
+                h = abs(xs[ni] - gx) + abs(ys[nj] - gy)
+                heapq.heappush(open_heap, (ng + h, ng, tie, ni, nj, new_axis))
+    return None
+
+
+def _simplify(points):
+    """Drop repeated and collinear points."""
+    out = []
+    for p in points:
+        if out and p == out[-1]:
+            continue
+        if len(out) >= 2 and (out[-2][0] == out[-1][0] == p[0] or out[-2][1] == out[-1][1] == p[1]):
+            out[-1] = p
+        else:
+            out.append(p)
+    return out
+
+
+def to_svg_path(points) -> str:
+    return "M " + " L ".join(f"{x:g} {y:g}" for x, y in points)
+
+
+def _route_task(task):
+    """Worker entry point: task = (edge_id, start, start_side, goal, goal_side,
+    blocks, bounds, bend_penalty)."""
+    edge_id, start, start_side, goal, goal_side, blocks, bounds, bend_penalty = task
+    return edge_id, route_path(start, start_side, goal, goal_side, blocks, bounds, bend_penalty)
+
+
+# =============================================================================
+# Router service
+# =============================================================================
+
+@dataclass
+class Route:
+    d: str
+    corridor: Rect
+    fallback: bool = False
+
+
+@dataclass
+class RouterStats:
+    routed: int = 0
+    cache_hits: int = 0
+    invalidated: int = 0
+    fallbacks: int = 0
+    parallel_batches: int = 0
+    last_batch_ms: float = 0.0
+    route_ms_total: float = 0.0
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+@dataclass
+class OrthogonalRouter:
+    """
+    Cached, incrementally invalidated edge routing for a whole schematic.
+
+    Nodes and edges use the same dicts as schematic.js:
+        node = {"id", "x", "y", "w", "h", "ports": [{"id", "relx", "rely", "side"}]}
+        edge = {"id", "a": {"node", "port"}, "b": {"node", "port"}}
+    (edge endpoints by id).
+    """
+
+    clearance: float = 10.0
+    padding: float = 80.0
+    bend_penalty: float = 40.0
+    workers: int = field(default_factory=lambda: max(1, (os.cpu_count() or 2) - 1))
+    parallel_threshold: int = 64
+
+    def __post_init__(self):
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.reset()
+
+    def reset(self):
+        """Drop the graph, its routes and the stats. The worker pool is kept:
+        its processes hold no graph state, so the next big batch re-uses them."""
+        self.nodes: Dict[str, dict] = {}
+        self.edges: Dict[str, dict] = {}
+        self.adjacency: Dict[str, set] = {}
+        self.routes: Dict[str, Route] = {}
+        self.node_index = SpatialGrid()
+        self.corridor_index = SpatialGrid()
+        self.stats = RouterStats()
+
+    # --- model ---------------------------------------------------------------
+
+    def _inflated(self, n) -> Rect:
+        c = self.clearance
+        return (n["x"] - c, n["y"] - c, n["x"] + n["w"] + c, n["y"] + n["h"] + c)
+
+    def set_graph(self, nodes, edges):
+        self.reset()
+        for n in nodes:
+            n = dict(n)
+            n["ports_by_id"] = {p["id"]: p for p in n.get("ports", [])}
+            self.nodes[n["id"]] = n
+            self.adjacency[n["id"]] = set()
+            self.node_index.insert(n["id"], self._inflated(n))
+        for e in edges:
+            self.edges[e["id"]] = e
+            self.adjacency[e["a"]["node"]].add(e["id"])
+            self.adjacency[e["b"]["node"]].add(e["id"])
+
+    def move_nodes(self, moves: Dict[str, dict]) -> set:
+        """
+        Apply {node_id: {"x", "y"}} and invalidate the affected routes.
+
+        Returns:
+            set: ids of the invalidated edges.
+        """
+        invalid = set()
+        for node_id, pos in moves.items():
+            n = self.nodes[node_id]
+            old = self._inflated(n)
+            n["x"], n["y"] = pos["x"], pos["y"]
+            new = self._inflated(n)
+            self.node_index.insert(node_id, new)
+            invalid |= self.adjacency[node_id]
+            invalid |= self.corridor_index.query(old)
+            invalid |= self.corridor_index.query(new)
+        for edge_id in invalid:
+            self.routes.pop(edge_id, None)
+            self.corridor_index.remove(edge_id)
+        self.stats.invalidated += len(invalid)
+        return invalid
+
+    # --- routing -------------------------------------------------------------
+
+    def _stub(self, end):
+        n = self.nodes[end["node"]]
+        p = n["ports_by_id"][end["port"]]
+        dx, dy = SIDES[p["side"]]
+        x = n["x"] + p["relx"] * n["w"] + dx * self.clearance
+        y = n["y"] + p["rely"] * n["h"] + dy * self.clearance
+        return (x, y), p["side"], (n["x"] + p["relx"] * n["w"], n["y"] + p["rely"] * n["h"])
+
+    def _task(self, edge_id, pad):
+        e = self.edges[edge_id]
+        start, start_side, start_port = self._stub(e["a"])
+        goal, goal_side, goal_port = self._stub(e["b"])
+        bounds = (min(start[0], goal[0]) - pad, min(start[1], goal[1]) - pad,
+                  max(start[0], goal[0]) + pad, max(start[1], goal[1]) + pad)
+        blocks = [self.node_index.rects[k] for k in self.node_index.query(bounds)]
+        task = (edge_id, start, start_side, goal, goal_side, blocks, bounds, self.bend_penalty)
+        return task, (start_port, goal_port)
+
+    def _store(self, edge_id, points, ports, bounds):
+        fallback = points is None
+        if fallback:
+            (ax, ay), (bx, by) = ports
+            points = [(ax, ay), (bx, ay), (bx, by)]        # the old L route
+            self.stats.fallbacks += 1
+        else:
+            points = [ports[0]] + points + [ports[1]]
+        route = Route(to_svg_path(_simplify(points)), bounds, fallback)
+        self.routes[edge_id] = route
+        self.corridor_index.insert(edge_id, bounds)
+        self.stats.routed += 1
+        return route.d
+
+    def _pool_map(self, tasks):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.stats.parallel_batches += 1
+        chunk = max(1, len(tasks) // (4 * self.workers))
+        return self._pool.map(_route_task, tasks, chunksize=chunk)
+
+    def route(self, edge_ids=None) -> Dict[str, str]:
+        """
+        Route `edge_ids` (default: all), re-using cached routes.
+
+        Returns:
+            dict: edge id -> SVG path string, for every requested edge.
+        """
+        t0 = time.perf_counter()
+        edge_ids = list(self.edges) if edge_ids is None else list(edge_ids)
+        out = {}
+        todo = []
+        for edge_id in edge_ids:
+            route = self.routes.get(edge_id)
+            if route is not None:
+                out[edge_id] = route.d
+                self.stats.cache_hits += 1
+            else:
+                todo.append(edge_id)
+
+        pad = self.padding
+        for attempt in range(4):
+            if not todo:
+                break
+            prepared = {edge_id: self._task(edge_id, pad) for edge_id in todo}
+            tasks = [task for task, _ in prepared.values()]
+            if self.workers > 1 and len(tasks) >= self.parallel_threshold:
+                results = self._pool_map(tasks)
+            else:
+                results = map(_route_task, tasks)
+
+            failed = []
+            for edge_id, points in results:
+                task, ports = prepared[edge_id]
+                if points is None and attempt < 3:
+                    failed.append(edge_id)
+                    continue
+                out[edge_id] = self._store(edge_id, points, ports, task[6])
+            todo, pad = failed, 2 * pad
+
+        elapsed = 1e3 * (time.perf_counter() - t0)
+        self.stats.last_batch_ms = elapsed
+        self.stats.route_ms_total += elapsed
+        return out
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+# =============================================================================
+# Benchmark (python router.py --nodes 10000 --edges 10000)
+# =============================================================================
+
+def synthetic_graph(n_nodes, n_edges, seed=1):
+    """Same layout as syntheticGraph() in schematic.js."""
+    import random
+    rng = random.Random(seed)
+    cols = math.ceil(math.sqrt(n_nodes))
+    ports = [{"id": "pE", "relx": 1, "rely": 0.5, "side": "E"},
+             {"id": "pW", "relx": 0, "rely": 0.5, "side": "W"}]
+    nodes = [{"id": f"N{i}", "x": 20 + (i % cols) * 110, "y": 20 + (i // cols) * 80,
+              "w": 60, "h": 40, "ports": ports} for i in range(n_nodes)]
+    edges = []
+    for k in range(n_edges):
+        i = rng.randrange(n_nodes)
+        j = min(n_nodes - 1, max(0, i + 1 + rng.randrange(2 * cols) - cols))
+        edges.append({"id": f"E{k}", "a": {"node": f"N{i}", "port": "pE"},
+                      "b": {"node": f"N{j}", "port": "pW"}})
+    return nodes, edges
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Orthogonal router benchmark.")
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--edges", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--drags", type=int, default=50)
+    args = parser.parse_args()
+
+    nodes, edges = synthetic_graph(args.nodes, args.edges)
+    for workers in ([args.workers] if args.workers else [1, max(1, (os.cpu_count() or 2) - 1)]):
+        router = OrthogonalRouter(workers=workers)
+        router.set_graph(nodes, edges)
+        t0 = time.perf_counter()
+        router.route()
+        full = time.perf_counter() - t0
+        print(f"workers={workers}: routed {len(edges)} edges in {full:.2f} s "
+              f"({router.stats.fallbacks} fell back to L)")
+
+        import random
+        rng = random.Random(0)
+        t0 = time.perf_counter()
+        rerouted = 0
+        for _ in range(args.drags):
+            n = router.nodes[f"N{rng.randrange(len(nodes))}"]
+            invalid = router.move_nodes({n["id"]: {"x": n["x"] + 15, "y": n["y"] + 10}})
+            rerouted += len(router.route(invalid))
+        per_drag = 1e3 * (time.perf_counter() - t0) / args.drags
+        print(f"    drag step: {per_drag:.1f} ms, {rerouted / args.drags:.1f} edges "
+              f"re-routed (of {len(edges)})")
+        router.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+// Schematic layer: draggable SVG nodes + orthogonal edges, sized for 10^4.
+//
+// What index.html used to do, generalized:
+//   - nodes and edges are looked up by id in Maps (no `id === "A" ? A : B`)
+//   - an adjacency index (node id -> Set of edge ids) means a drag re-routes
+//     only the edges attached to the moved node
+//   - mousemove only records the pointer; DOM writes (node transforms, edge
+//     paths) are collected in dirty sets and flushed once per
+//     requestAnimationFrame
+//   - hit testing goes through a uniform spatial grid (cell -> node ids),
+//     so a click looks at a handful of nodes instead of all of them
+//
+// Usage:
+//     const s = new Schematic(document.getElementById("schematic"));
+//     s.addNode({ id: "A", x: 100, y: 120, w: 80, h: 60,
+//                 ports: [{ id: "pE", relx: 1, rely: 0.5, side: "E" }] });
+//     s.addEdge({ id: "E1", a: { node: "A", port: "pE" }, b: { node: "B", port: "pW" } });
+//
+// Obstacle-avoiding routes come from an optional router backend (main.py /
+// router.py through Eel). Until its answer arrives a moved edge is drawn as
+// the plain L route; at most one request is in flight, later moves are
+// merged and sent when it returns:
+//     const s = new Schematic(svg, { router: Schematic.eelRouter() });
+//     s.load(nodes, edges);
+//     s.syncRouter();
+
+(function () {
+    "use strict";
+
+    const svgNS = "http://www.w3.org/2000/svg";
+    const svgEl = (tag) => document.createElementNS(svgNS, tag);
+
+    // Uniform grid over node bounding boxes. A node is registered in every
+    // cell its box overlaps; queries only look at one cell's candidates.
+    class SpatialGrid {
+        constructor(cellSize = 128) {
+            this.cellSize = cellSize;
+            this.cells = new Map(); // "cx,cy" -> Set of node ids
+            this.keys = new Map(); // node id -> array of cell keys it's in
+        }
+
+        _cellRange(n) {
+            const c = this.cellSize;
+            return [
+                Math.floor(n.x / c),
+                Math.floor(n.y / c),
+                Math.floor((n.x + n.w) / c),
+                Math.floor((n.y + n.h) / c),
+            ];
+        }
+
+        insert(n) {
+            const [x0, y0, x1, y1] = this._cellRange(n);
+            const keys = [];
+            for (let cx = x0; cx <= x1; cx++) {
+                for (let cy = y0; cy <= y1; cy++) {
+                    const key = `${cx},${cy}`;
+                    let cell = this.cells.get(key);
+                    if (!cell) this.cells.set(key, (cell = new Set()));
+                    cell.add(n.id);
+                    keys.push(key);
+                }
+            }
+            this.keys.set(n.id, keys);
+        }
+
+        remove(id) {
+            for (const key of this.keys.get(id) || []) {
+                const cell = this.cells.get(key);
+                cell.delete(id);
+                if (cell.size === 0) this.cells.delete(key);
+            }
+            this.keys.delete(id);
+        }
+
+        update(n) {
+            this.remove(n.id);
+            this.insert(n);
+        }
+
+        // Node ids whose box may contain (x, y).
+        candidates(x, y) {
+            const key = `${Math.floor(x / this.cellSize)},${Math.floor(y / this.cellSize)}`;
+            return this.cells.get(key) || [];
+        }
+    }
+
+    class Schematic {
+        constructor(svg, options = {}) {
+            this.svg = svg;
+            this.layerEdges = svg.querySelector("#layer-connectors") || svg.appendChild(svgEl("g"));
+            this.layerShapes = svg.querySelector("#layer-shapes") || svg.appendChild(svgEl("g"));
+
+            this.nodes = new Map(); // id -> node
+            this.edges = new Map(); // id -> edge
+            this.adjacency = new Map(); // node id -> Set of edge ids
+            this.grid = new SpatialGrid(options.cellSize || 128);
+            this.rerouteAll = !!options.rerouteAll; // benchmark baseline only
+
+            this.router = options.router || null;
+            this.pendingMoves = new Map(); // node id -> { x, y } not yet sent
+            this._routing = false;
+
+            this.dirtyNodes = new Set();
+            this.dirtyEdges = new Set();
+            this._raf = null;
+            this._flush = this._flush.bind(this);
+
+            this.stats = { flushes: 0, nodeWrites: 0, edgeWrites: 0, flushMs: 0 };
+
+            this.drag = null;
+            this._onDown = this._onDown.bind(this);
+            this._onMove = this._onMove.bind(this);
+            this._onUp = this._onUp.bind(this);
+            svg.addEventListener("mousedown", this._onDown);
+        }
+
+        // --- model -----------------------------------------------------------
+
+        addNode(n) {
+            n.portsById = new Map((n.ports || []).map((p) => [p.id, p]));
+            n.el = this._nodeElement(n);
+            this.nodes.set(n.id, n);
+            this.adjacency.set(n.id, new Set());
+            this.grid.insert(n);
+            this.layerShapes.appendChild(n.el);
+            return n;
+        }
+
+        addEdge(e) {
+            // Endpoints may be given as ids; resolve them once, here.
+            for (const end of [e.a, e.b]) {
+                if (typeof end.node === "string") end.node = this.nodes.get(end.node);
+                if (typeof end.port === "string") end.port = end.node.portsById.get(end.port);
+            }
+            e.el = svgEl("path");
+            e.el.classList.add("edge");
+            this.edges.set(e.id, e);
+            this.adjacency.get(e.a.node.id).add(e.id);
+            this.adjacency.get(e.b.node.id).add(e.id);
+            this.layerEdges.appendChild(e.el);
+            this.markEdge(e.id);
+            return e;
+        }
+
+        // Bulk insert without a layout pass per element.
+        load(nodes, edges) {
+            const shapes = document.createDocumentFragment();
+            const paths = document.createDocumentFragment();
+            const shapesLayer = this.layerShapes;
+            const edgesLayer = this.layerEdges;
+            this.layerShapes = shapes;
+            this.layerEdges = paths;
+            try {
+                nodes.forEach((n) => this.addNode(n));
+                edges.forEach((e) => this.addEdge(e));
+            } finally {
+                this.layerShapes = shapesLayer;
+                this.layerEdges = edgesLayer;
+            }
+            shapesLayer.appendChild(shapes);
+            edgesLayer.appendChild(paths);
+        }
+
+        moveNode(id, x, y) {
+            const n = this.nodes.get(id);
+            n.x = x;
+            n.y = y;
+            this.grid.update(n);
+            this.dirtyNodes.add(id);
+            const edges = this.rerouteAll ? this.edges.keys() : this.adjacency.get(id);
+            for (const edgeId of edges) {
+                this.edges.get(edgeId).d = null; // L route until the router answers
+                this.dirtyEdges.add(edgeId);
+            }
+            if (this.router) {
+                this.pendingMoves.set(id, { x, y });
+                this._sendMoves();
+            }
+            this._schedule();
+        }
+
+        // Routed paths ({ edge id: svg path }) from the router backend.
+        setRoutes(paths) {
+            for (const [id, d] of Object.entries(paths)) {
+                const e = this.edges.get(id);
+                if (!e) continue;
+                e.d = d;
+                this.dirtyEdges.add(id);
+            }
+            this._schedule();
+        }
+
+        markEdge(id) {
+            this.dirtyEdges.add(id);
+            this._schedule();
+        }
+
+        // --- router backend --------------------------------------------------
+
+        // Plain-data copy of the graph (endpoints by id) for the backend.
+        serialize() {
+            const nodes = [...this.nodes.values()].map((n) => ({
+                id: n.id,
+                x: n.x,
+                y: n.y,
+                w: n.w,
+                h: n.h,
+                ports: n.ports || [],
+            }));
+            const edges = [...this.edges.values()].map((e) => ({
+                id: e.id,
+                a: { node: e.a.node.id, port: e.a.port.id },
+                b: { node: e.b.node.id, port: e.b.port.id },
+            }));
+            return { nodes, edges };
+        }
+
+        // Send the whole graph and apply the routes for every edge.
+        async syncRouter() {
+            if (!this.router) return;
+            const { nodes, edges } = this.serialize();
+            this.pendingMoves.clear();
+            this._routing = true;
+            try {
+                this._applyReply(await this.router.setGraph(nodes, edges));
+            } finally {
+                this._routing = false;
+            }
+            this._sendMoves();
+        }
+
+        async _sendMoves() {
+            if (this._routing || this.pendingMoves.size === 0) return;
+            const moves = Object.fromEntries(this.pendingMoves);
+            this.pendingMoves.clear();
+            this._routing = true;
+            try {
+                const reply = await this.router.moveNodes(moves);
+                // Edges whose node moved again meanwhile keep their L route;
+                // the next reply brings their proper path.
+                const stale = new Set();
+                for (const id of this.pendingMoves.keys()) {
+                    for (const edgeId of this.adjacency.get(id)) stale.add(edgeId);
+                }
+                if (reply && reply.paths) {
+                    for (const edgeId of stale) delete reply.paths[edgeId];
+                }
+                this._applyReply(reply);
+            } finally {
+                this._routing = false;
+            }
+            this._sendMoves();
+        }
+
+        _applyReply(reply) {
+            if (reply && reply.success) this.setRoutes(reply.paths);
+            else if (reply) console.warn("router:", reply.error);
+        }
+
+        // Router backed by main.py's exposed functions.
+        static eelRouter() {
+            return {
+                setGraph: (nodes, edges) => eel.set_graph(nodes, edges)(),
+                moveNodes: (moves) => eel.move_nodes(moves)(),
+            };
+        }
+
+        // Topmost node under (x, y) in schematic coordinates, or null.
+        hitTest(x, y) {
+            let hit = null;
+            let hitOrder = -1;
+            for (const id of this.grid.candidates(x, y)) {
+                const n = this.nodes.get(id);
+                const inside = x >= n.x && x <= n.x + n.w && y >= n.y && y <= n.y + n.h;
+                if (inside && n.order > hitOrder) {
+                    hit = n;
+                    hitOrder = n.order;
+                }
+            }
+            return hit;
+        }
+
+        // --- rendering -------------------------------------------------------
+
+        _nodeElement(n) {
+            n.order = this.nodes.size;
+            const g = svgEl("g");
+            g.classList.add("node");
+            g.dataset.id = n.id;
+            g.setAttribute("transform", `translate(${n.x},${n.y})`);
+            const r = svgEl("rect");
+            r.setAttribute("width", n.w);
+            r.setAttribute("height", n.h);
+            r.setAttribute("rx", 8);
+            r.setAttribute("ry", 8);
+            r.setAttribute("fill", "#eef");
+            const t = svgEl("text");
+            t.textContent = n.label !== undefined ? n.label : n.id;
+            t.setAttribute("x", n.w / 2);
+            t.setAttribute("y", n.h / 2);
+            t.setAttribute("text-anchor", "middle");
+            t.setAttribute("dominant-baseline", "middle");
+            g.append(r, t);
+            return g;
+        }
+
+        static portAbs(n, p) {
+            return { x: n.x + p.relx * n.w, y: n.y + p.rely * n.h };
+        }
+
+        static routeOrthogonal(e) {
+            const a = Schematic.portAbs(e.a.node, e.a.port);
+            const b = Schematic.portAbs(e.b.node, e.b.port);
+            // simple L route: go horizontal then vertical
+            return `M ${a.x} ${a.y} L ${b.x} ${a.y} L ${b.x} ${b.y}`;
+        }
+
+        _schedule() {
+            if (this._raf === null) this._raf = requestAnimationFrame(this._flush);
+        }
+
+        // All DOM writes happen here, at most once per frame.
+        _flush() {
+            const t0 = performance.now();
+            this._raf = null;
+            for (const id of this.dirtyNodes) {
+                const n = this.nodes.get(id);
+                n.el.setAttribute("transform", `translate(${n.x},${n.y})`);
+            }
+            for (const id of this.dirtyEdges) {
+                const e = this.edges.get(id);
+                e.el.setAttribute("d", e.d || Schematic.routeOrthogonal(e));
+            }
+            this.stats.flushes++;
+            this.stats.nodeWrites += this.dirtyNodes.size;
+            this.stats.edgeWrites += this.dirtyEdges.size;
+            this.dirtyNodes.clear();
+            this.dirtyEdges.clear();
+            this.stats.flushMs += performance.now() - t0;
+        }
+
+        // Synchronous flush (e.g. before measuring the DOM).
+        flushNow() {
+            if (this._raf !== null) cancelAnimationFrame(this._raf);
+            this._flush();
+        }
+
+        // --- dragging --------------------------------------------------------
+
+        _toSchematic(evt) {
+            const rect = this.svg.getBoundingClientRect();
+            return { x: evt.clientX - rect.left, y: evt.clientY - rect.top };
+        }
+
+        _onDown(evt) {
+            const p = this._toSchematic(evt);
+            const n = this.hitTest(p.x, p.y);
+            if (!n) return;
+            evt.preventDefault();
+            this.drag = { n, startX: evt.clientX, startY: evt.clientY, ox: n.x, oy: n.y };
+            window.addEventListener("mousemove", this._onMove);
+            window.addEventListener("mouseup", this._onUp);
+        }
+
+        _onMove(evt) {
+            if (!this.drag) return;
+            const d = this.drag;
+            this.moveNode(d.n.id, d.ox + evt.clientX - d.startX, d.oy + evt.clientY - d.startY);
+        }
+
+        _onUp() {
+            this.drag = null;
+            window.removeEventListener("mousemove", this._onMove);
+            window.removeEventListener("mouseup", this._onUp);
+        }
+    }
+
+    // Synthetic layered graph for benchmarks: `n` nodes on a grid, each with
+    // one east and one west port, and `m` edges between nearby nodes.
+    function syntheticGraph(n, m, seed = 1) {
+        let s = seed;
+        const rand = () => ((s = (s * 1103515245 + 12345) & 0x7fffffff) / 0x7fffffff);
+        const cols = Math.ceil(Math.sqrt(n));
+        const nodes = [];
+        for (let i = 0; i < n; i++) {
+            nodes.push({
+                id: `N${i}`,
+                x: 20 + (i % cols) * 110,
+                y: 20 + Math.floor(i / cols) * 80,
+                w: 60,
+                h: 40,
+                ports: [
+                    { id: "pE", relx: 1, rely: 0.5, side: "E" },
+                    { id: "pW", relx: 0, rely: 0.5, side: "W" },
+                ],
+            });
+        }
+        const edges = [];
+        for (let k = 0; k < m; k++) {
+            const i = Math.floor(rand() * n);
+            const j = Math.min(n - 1, Math.max(0, i + 1 + Math.floor(rand() * 2 * cols) - cols));
+            edges.push({
+                id: `E${k}`,
+                a: { node: `N${i}`, port: "pE" },
+                b: { node: `N${j}`, port: "pW" },
+            });
+        }
+        return { nodes, edges };
+    }
+
+    window.Schematic = Schematic;
+    window.SpatialGrid = SpatialGrid;
+    window.syntheticGraph = syntheticGraph;
+})();
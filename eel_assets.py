@@ -0,0 +1,799 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Mon Oct 19 09:12:40 2026
+
+@Description: Static asset pipeline for the Eel apps.
+
+    Out of the box Eel serves every file straight from web/ with
+    "Cache-Control: no-store", so each window open re-downloads (and
+    re-parses) every uncompressed script and stylesheet, and a page that
+    pulls a library from a CDN simply breaks on an air-gapped machine.
+
+    This module:
+
+        1. VENDORS     -- third-party scripts listed in <app>/vendor/vendor.json
+                          are downloaded once (on a networked machine), checked
+                          against their sha256 and committed, so pages load
+                          them locally
+        2. BUNDLES     -- runs of consecutive local <script src> tags (and
+                          <link rel=stylesheet> tags) in each page become one
+                          file, so a page makes one request instead of several
+        3. MINIFIES    -- comments and indentation are stripped from JS, CSS
+                          and HTML (conservative: no renaming, line breaks
+                          kept so automatic semicolon insertion still works)
+        4. HASHES      -- bundles and other referenced assets get content-hashed
+                          names (app.3f9c2a1b7e.js), so they can be cached
+                          "forever": a change produces a new name
+        5. PRECOMPRESSES -- .gz (always) and .br (if the `brotli` package is
+                          installed) next to every compressible file, so
+                          nothing is compressed per request
+
+    and serves the result: hashed files with a one-year immutable
+    Cache-Control, pages (and unhashed copies) with no-cache + Last-Modified
+    revalidation, the smallest encoding the browser accepts.
+
+    USAGE
+
+        python eel_assets.py vendor fabric_js_layer_management
+        python eel_assets.py build starryBackground/web
+        python eel_assets.py measure starryBackground/web --runs 5
+
+    In an app's main.py:
+
+        web_root, app = use_built_assets("web")   # dist/ if it's up to date
+        eel.init(web_root)
+        eel.start("index.html", app=app)
+"""
+#%%
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+MANIFEST = 'asset-manifest.json'
+VENDOR_MANIFEST = os.path.join('vendor', 'vendor.json')
+
+SKIP_DIRS = {'dist', '__pycache__', '.git'}
+SKIP_EXTS = {'.py', '.pyc', '.pyw', '.jsonl'}
+COMPRESSIBLE = {'.html', '.htm', '.js', '.css', '.svg', '.json', '.txt', '.map', '.xml', '.ttf', '.otf'}
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+
+
+def default_out_dir(web_dir):
+    """web/ -> <app>/dist; an app folder that serves itself -> <app>/dist."""
+    web_dir = os.path.abspath(web_dir)
+    if os.path.basename(web_dir) == 'web':
+        return os.path.join(os.path.dirname(web_dir), 'dist')
+    return os.path.join(web_dir, 'dist')
+
+
+def _source_files(web_dir):
+    """Relative paths of everything under web_dir that belongs in the build."""
+    for root, dirs, files in os.walk(web_dir):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+        for name in sorted(files):
+            if os.path.splitext(name)[1] in SKIP_EXTS or name == 'vendor.json' or name.startswith('.'):
+                continue
+            yield os.path.relpath(os.path.join(root, name), web_dir).replace(os.sep, '/')
+
+
+#%% Vendoring
+# =============================================================================
+
+def vendor(app_dir, force=False):
+    """
+    Download the scripts listed in <app_dir>/vendor/vendor.json.
+
+    vendor.json maps a local file name to {"url": ..., "sha256": ...}. A
+    missing sha256 is filled in from the first download (and then enforced).
+
+    Returns:
+        list: names of the files that were downloaded.
+    """
+    manifest_path = os.path.join(app_dir, VENDOR_MANIFEST)
+    with open(manifest_path, encoding='utf-8') as f:
+        entries = json.load(f)
+
+    fetched = []
+    for name, entry in entries.items():
+        path = os.path.join(os.path.dirname(manifest_path), name)
+        if os.path.exists(path) and not force:
+            data = open(path, 'rb').read()
+        else:
+            with urllib.request.urlopen(entry['url'], timeout=60) as response:
+                data = response.read()
+            fetched.append(name)
+        digest = hashlib.sha256(data).hexdigest()
+        if entry.get('sha256') and entry['sha256'] != digest:
+            raise ValueError(f"{name}: sha256 {digest} does not match vendor.json ({entry['sha256']})")
+        entry['sha256'] = digest
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, indent=4)
+        f.write('\n')
+    return fetched
+
+
+#%% Minifiers
+# =============================================================================
+# Deliberately conservative: they only drop comments and redundant
+# whitespace, so the output behaves exactly like the input. Line breaks in
+# JS are kept (one per statement line) because dropping them can change
+# meaning through automatic semicolon insertion.
+
+_REGEX_AFTER_WORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+                      'throw', 'case', 'do', 'else', 'yield', 'await'}
+_REGEX_AFTER_CHARS = set('(,=:[!&|?{};+-*%<>~^')
+
+
+def minify_js(src):
+    """Strip comments, indentation and blank lines from JavaScript source."""
+    out = []
+    i, n = 0, len(src)
+    prev = ''               # last significant character emitted
+    word = ''               # last identifier emitted
+    templates = []          # brace depth inside each open `${ ... }`
+
+    def emit(s):
+        out.append(s)
+
+    def scan_template(i):
+        # Copies src[i] (a backtick or the `}` ending a substitution) and the
+        # template text after it, up to the closing backtick or next `${`
+        j = i + 1
+        while j < n:
+            c = src[j]
+            if c == '\\':
+                j += 2
+            elif c == '`':
+                emit(src[i:j + 1])
+                return j + 1
+            elif c == '$' and src.startswith('${', j):
+                emit(src[i:j + 2])
+                templates.append(0)
+                return j + 2
+            else:
+                j += 1
+        emit(src[i:])
+        return n
+
+    while i < n:
+        c = src[i]
+
+        # --- whitespace ---
+        if c in ' \t\r\n':
+            j = i
+            newline = False
+            while j < n and src[j] in ' \t\r\n':
+                newline |= src[j] == '\n'
+                j += 1
+            if out and out[-1] == ' ' and newline:
+                out[-1] = '\n'
+            elif out and out[-1] != '\n':
+                if newline:
+                    emit('\n')
+                elif out[-1][-1] not in '{}();,=:[':
+                    emit(' ')
+            i = j
+            continue
+
+        # --- comments ---
+        if src.startswith('//', i):
+            j = src.find('\n', i)
+            i = n if j < 0 else j
+            continue
+        if src.startswith('/*', i):
+            j = src.find('*/', i + 2)
+            j = n if j < 0 else j + 2
+            if src.startswith('/*!', i):        # keep license comments
+                emit(src[i:j])
+            i = j
+            continue
+
+        # --- strings ---
+        if c in '"\'':
+            j = i + 1
+            while j < n and src[j] != c:
+                j += 2 if src[j] == '\\' else 1
+            emit(src[i:j + 1])
+            i, prev, word = j + 1, 'a', ''
+            continue
+        if c == '`':
+            i = scan_template(i)
+            prev, word = 'a', ''
+            continue
+
+        # --- braces closing a template substitution ---
+        if templates and c == '{':
+            templates[-1] += 1
+        elif templates and c == '}':
+            if templates[-1] == 0:
+                templates.pop()
+                i = scan_template(i)
+                prev, word = 'a', ''
+                continue
+            templates[-1] -= 1
+
+        # --- regex literals ---
+        if c == '/' and (prev == '' or prev in _REGEX_AFTER_CHARS or word in _REGEX_AFTER_WORDS):
+            j = i + 1
+            in_class = False
+            while j < n and src[j] != '\n':
+                if src[j] == '\\':
+                    j += 2
+                    continue
+                if src[j] == '[':
+                    in_class = True
+                elif src[j] == ']':
+                    in_class = False
+                elif src[j] == '/' and not in_class:
+                    break
+                j += 1
+            emit(src[i:j + 1])
+            i, prev, word = j + 1, 'a', ''
+            continue
+
+        # --- identifiers / numbers ---
+        if c.isalnum() or c in '_$':
+            j = i
+            while j < n and (src[j].isalnum() or src[j] in '_$'):
+                j += 1
+            word = src[i:j]
+            emit(word)
+            i, prev = j, 'a'
+            continue
+
+        # --- punctuation ---
+        if out and out[-1] == ' ' and c in '{}();,=:':
+            out.pop()
+        emit(c)
+        i, prev, word = i + 1, c, ''
+
+    return ''.join(out).strip() + '\n'
+
+
+def minify_css(src):
+    """Strip comments and redundant whitespace from CSS."""
+    out = []
+    i, n = 0, len(src)
+    while i < n:
+        c = src[i]
+        if src.startswith('/*', i):
+            j = src.find('*/', i + 2)
+            i = n if j < 0 else j + 2
+            continue
+        if c in '"\'':
+            j = i + 1
+            while j < n and src[j] != c:
+                j += 2 if src[j] == '\\' else 1
+            out.append(src[i:j + 1])
+            i = j + 1
+            continue
+        if c.isspace():
+            while i < n and src[i].isspace():
+                i += 1
+            if out and out[-1] not in '{};,> ':
+                out.append(' ')
+            continue
+        if c in '{};,>' and out and out[-1] == ' ':
+            out.pop()
+        if c == '}' and out and out[-1] == ';':
+            out.pop()
+        out.append(c)
+        i += 1
+    return ''.join(out).strip() + '\n'
+
+
+_RAW_BLOCK_RE = re.compile(r'(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2\s*>)', re.S | re.I)
+
+
+def minify_html(src):
+    """
+    Drop comments and collapse whitespace in HTML; inline <script> and
+    <style> contents go through minify_js / minify_css, <pre> and
+    <textarea> contents are left alone.
+    """
+    def markup(text):
+        text = re.sub(r'<!--(?!\[if).*?-->', '', text, flags=re.S)
+        text = re.sub(r'[ \t\r]*\n\s*', '\n', text)
+        return re.sub(r'[ \t]{2,}', ' ', text)
+
+    out = []
+    pos = 0
+    for m in _RAW_BLOCK_RE.finditer(src):
+        out.append(markup(src[pos:m.start()]))
+        open_tag, tag, body, close_tag = m.group(1), m.group(2).lower(), m.group(3), m.group(4)
+        if tag == 'script' and body.strip() and _attrs(open_tag).get('type', 'text/javascript') == 'text/javascript':
+            body = minify_js(body)
+        elif tag == 'style':
+            body = minify_css(body)
+        out.append(open_tag + body + close_tag)
+        pos = m.end()
+    out.append(markup(src[pos:]))
+    return ''.join(out).strip() + '\n'
+
+
+#%% Build
+# =============================================================================
+
+_TAG_RE = re.compile(r'<script\b([^>]*)>(.*?)</script\s*>|<link\b([^>]*)>', re.S | re.I)
+_ATTR_RE = re.compile(r'([\w-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_CSS_URL_RE = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+
+def _attrs(text):
+    return {k.lower(): a if a is not None else b for k, a, b in _ATTR_RE.findall(text or '')}
+
+
+def _is_local(url):
+    return bool(url) and not re.match(r'^(?:[a-z]+:|//|/|#)', url, re.I)
+
+
+def _hashed_name(rel, data):
+    stem, ext = os.path.splitext(rel)
+    return f'{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}'
+
+
+class _Builder:
+
+    def __init__(self, web_dir, out_dir):
+        self.web_dir = os.path.abspath(web_dir)
+        self.out_dir = os.path.abspath(out_dir)
+        self.hashed = {}            # source rel path (or bundle key) -> hashed rel path
+        self.sizes = {}             # output rel path -> {'source', 'min', 'gz', 'br'}
+        self.warnings = []
+
+    def read(self, rel):
+        with open(os.path.join(self.web_dir, rel), 'rb') as f:
+            return f.read()
+
+    def write(self, rel, data, source_size):
+        path = os.path.join(self.out_dir, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        sizes = {'source': source_size, 'min': len(data)}
+        if os.path.splitext(rel)[1].lower() in COMPRESSIBLE and len(data) > 256:
+            variants = [('gz', gzip.compress(data, 9, mtime=0))]
+            if brotli is not None:
+                variants.append(('br', brotli.compress(data, quality=11)))
+            for ext, packed in variants:
+                if len(packed) < 0.95 * len(data):
+                    with open(f'{path}.{ext}', 'wb') as f:
+                        f.write(packed)
+                    sizes[ext] = len(packed)
+        self.sizes[rel] = sizes
+
+    def minified(self, rel, text):
+        ext = os.path.splitext(rel)[1].lower()
+        if rel.endswith('.min.js') or rel.endswith('.min.css'):
+            return text
+        if ext == '.js':
+            return minify_js(text)
+        if ext == '.css':
+            return self.rewrite_css_urls(rel, minify_css(text))
+        return text
+
+    def rewrite_css_urls(self, rel, text):
+        # Relative url()s point next to the original stylesheet; after
+        # bundling they're rewritten to root-relative hashed paths.
+        base = os.path.dirname(rel)
+
+        def sub(m):
+            url = m.group(2)
+            if not _is_local(url):
+                return m.group(0)
+            target = os.path.normpath(os.path.join(base, url)).replace(os.sep, '/')
+            hashed = self.asset(target)
+            return f'url({m.group(1)}/{hashed}{m.group(1)})' if hashed else m.group(0)
+
+        return _CSS_URL_RE.sub(sub, text)
+
+    def asset(self, rel):
+        """Hashed copy of one referenced file; None if it doesn't exist."""
+        if rel in self.hashed:
+            return self.hashed[rel]
+        if not os.path.isfile(os.path.join(self.web_dir, rel)):
+            self.warnings.append(f'missing: {rel}')
+            self.hashed[rel] = None
+            return None
+        raw = self.read(rel)
+        data = self.minified(rel, raw.decode('utf-8')).encode('utf-8') \
+            if os.path.splitext(rel)[1].lower() in ('.js', '.css') else raw
+        name = _hashed_name(rel, data)
+        self.write(name, data, len(raw))
+        self.hashed[rel] = name
+        return name
+
+    def bundle(self, rels, kind):
+        """Hashed bundle of several local scripts or stylesheets."""
+        if len(rels) == 1:
+            return self.asset(rels[0])
+        key = (kind,) + tuple(rels)
+        if key in self.hashed:
+            return self.hashed[key]
+        parts, source = [], 0
+        for rel in rels:
+            if not os.path.isfile(os.path.join(self.web_dir, rel)):
+                self.warnings.append(f'missing: {rel}')
+                return None
+            raw = self.read(rel)
+            source += len(raw)
+            parts.append(self.minified(rel, raw.decode('utf-8')))
+        data = (';\n' if kind == 'js' else '\n').join(parts).encode('utf-8')
+        stem = os.path.splitext(rels[0])[0]
+        name = _hashed_name(f'{stem}.bundle.{kind}', data)
+        self.write(name, data, source)
+        self.hashed[key] = name
+        return name
+
+    def page(self, rel):
+        """Rewrite one HTML page: bundle runs of local tags, hash everything."""
+        raw = self.read(rel)
+        html = raw.decode('utf-8')
+        base = os.path.dirname(rel)
+
+        def resolve(url):
+            return os.path.normpath(os.path.join(base, url)).replace(os.sep, '/')
+
+        def relative(target):
+            return os.path.relpath(target, base or '.').replace(os.sep, '/')
+
+        # Group consecutive bundleable tags (only whitespace in between,
+        # same kind, same attributes apart from the URL).
+        runs, run = [], None
+        for m in _TAG_RE.finditer(html):
+            if m.group(3) is not None:
+                attrs = _attrs(m.group(3))
+                ok = 'stylesheet' in attrs.get('rel', '').lower() and _is_local(attrs.get('href'))
+                kind, url = 'css', attrs.get('href')
+                sig = tuple(sorted((k, v) for k, v in attrs.items() if k != 'href'))
+            else:
+                attrs = _attrs(m.group(1))
+                ok = _is_local(attrs.get('src')) and not m.group(2).strip() \
+                    and attrs.get('type', 'text/javascript') == 'text/javascript'
+                kind, url = 'js', attrs.get('src')
+                sig = tuple(sorted((k, v) for k, v in attrs.items() if k != 'src'))
+            if not ok:
+                run = None
+                continue
+            if run and run['kind'] == kind and run['sig'] == sig and not html[run['end']:m.start()].strip():
+                run['tags'].append(m)
+                run['urls'].append(url)
+                run['end'] = m.end()
+            else:
+                run = {'kind': kind, 'sig': sig, 'tags': [m], 'urls': [url], 'end': m.end()}
+                runs.append(run)
+
+        out, pos = [], 0
+        for run in runs:
+            first, last, urls = run['tags'][0], run['tags'][-1], run['urls']
+            name = self.bundle([resolve(u) for u in urls], run['kind'])
+            out.append(html[pos:first.start()])
+            if name is None:
+                out.append(html[first.start():last.end()])
+            else:
+                tag = first.group(0)
+                out.append(tag.replace(urls[0], relative(name), 1))
+            pos = last.end()
+        out.append(html[pos:])
+        html = ''.join(out)
+
+        # Other local references (images, icons, ...)
+        def sub(m):
+            url = m.group(3)
+            if not _is_local(url) or url.endswith(('.html', '.htm')) or '?' in url:
+                return m.group(0)
+            target = resolve(url)
+            if target in self.hashed.values():
+                return m.group(0)
+            hashed = self.asset(target)
+            return m.group(1) + m.group(2) + (relative(hashed) if hashed else url) + m.group(2)
+        html = re.sub(r'(\s(?:src|href)\s*=\s*)(["\'])([^"\']+)\2', sub, html)
+
+        self.write(rel, minify_html(html).encode('utf-8'), len(raw))
+
+    def run(self):
+        if os.path.isdir(self.out_dir):
+            shutil.rmtree(self.out_dir)
+        os.makedirs(self.out_dir)
+        sources = list(_source_files(self.web_dir))
+        for rel in sources:
+            if rel.endswith(('.html', '.htm')):
+                self.page(rel)
+        # Unhashed copies of everything (minified where it applies), for
+        # anything loaded by name at run time. These are revalidated.
+        for rel in sources:
+            if rel.endswith(('.html', '.htm')):
+                continue
+            raw = self.read(rel)
+            ext = os.path.splitext(rel)[1].lower()
+            data = self.minified(rel, raw.decode('utf-8')).encode('utf-8') if ext in ('.js', '.css') else raw
+            self.write(rel, data, len(raw))
+
+        manifest = {
+            'built': time.time(),
+            'sources': {rel: os.path.getmtime(os.path.join(self.web_dir, rel)) for rel in sources},
+            'hashed': sorted(set(self.hashed.values()) - {None}),
+            'files': self.sizes,
+            'brotli': brotli is not None,
+            'warnings': self.warnings,
+        }
+        with open(os.path.join(self.out_dir, MANIFEST), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+        return manifest
+
+
+def build(web_dir, out_dir=None):
+    """
+    Bundle, minify, hash and precompress web_dir into out_dir.
+
+    Args:
+        web_dir (str): Folder Eel would serve (e.g. 'starryBackground/web').
+        out_dir (str): Output folder; default_out_dir(web_dir) if None.
+
+    Returns:
+        dict: The asset manifest (also written to out_dir/asset-manifest.json).
+    """
+    app_dir = web_dir if os.path.basename(os.path.abspath(web_dir)) != 'web' else os.path.dirname(web_dir)
+    vendor_json = os.path.join(app_dir, VENDOR_MANIFEST)
+    if os.path.exists(vendor_json):
+        with open(vendor_json, encoding='utf-8') as f:
+            for name in json.load(f):
+                if not os.path.exists(os.path.join(os.path.dirname(vendor_json), name)):
+                    print(f'  ! vendor/{name} not downloaded yet (python eel_assets.py vendor {app_dir})')
+    return _Builder(web_dir, out_dir or default_out_dir(web_dir)).run()
+
+
+def is_up_to_date(web_dir, out_dir=None):
+    """True if out_dir holds a build of exactly the current web_dir files."""
+    path = os.path.join(out_dir or default_out_dir(web_dir), MANIFEST)
+    try:
+        with open(path, encoding='utf-8') as f:
+            recorded = json.load(f)['sources']
+    except (OSError, ValueError, KeyError):
+        return False
+    current = list(_source_files(web_dir))
+    return set(current) == set(recorded) and all(
+        os.path.getmtime(os.path.join(web_dir, rel)) <= recorded[rel] for rel in current)
+
+
+#%% Serving
+# =============================================================================
+
+def add_asset_routes(app, dist_dir):
+    """
+    Serve dist_dir on a bottle app with precompressed variants and cache
+    headers. Register before eel.start() so this route wins over Eel's own
+    static route (Eel's /eel.js and /eel websocket are exact routes and are
+    still matched first).
+    """
+    import bottle
+
+    dist_dir = os.path.abspath(dist_dir)
+    with open(os.path.join(dist_dir, MANIFEST), encoding='utf-8') as f:
+        hashed = set(json.load(f)['hashed'])
+
+    def serve(path):
+        mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        accept = bottle.request.headers.get('Accept-Encoding', '')
+        response = None
+        for encoding, ext in (('br', '.br'), ('gzip', '.gz')):
+            if encoding in accept and os.path.isfile(os.path.join(dist_dir, path + ext)):
+                response = bottle.static_file(path + ext, root=dist_dir, mimetype=mimetype)
+                response.set_header('Content-Encoding', encoding)
+                break
+        if response is None:
+            response = bottle.static_file(path, root=dist_dir, mimetype=mimetype)
+        response.set_header('Vary', 'Accept-Encoding')
+        response.set_header('Cache-Control', IMMUTABLE if path in hashed else REVALIDATE)
+        return response
+
+    app.route('/<path:path>', callback=serve)
+    return app
+
+
+def use_built_assets(web_dir, out_dir=None):
+    """
+    Pick what an Eel app should serve.
+
+    Returns:
+        tuple: (root for eel.init, bottle app for eel.start(app=...)). The
+        built folder with asset routes if it's up to date, else web_dir and
+        bottle's default app (plain Eel behaviour).
+    """
+    import bottle
+
+    out_dir = out_dir or default_out_dir(web_dir)
+    if not is_up_to_date(web_dir, out_dir):
+        if os.path.isdir(out_dir):
+            print(f'   {out_dir} is stale; serving {web_dir} (python eel_assets.py build {web_dir})')
+        return web_dir, bottle.default_app()
+    return out_dir, add_asset_routes(bottle.Bottle(), out_dir)
+
+
+#%% First-paint measurement
+# =============================================================================
+# Opens each page in a headless Chrome/Edge, once with a fresh profile
+# ("cold") and then again with the same profile ("warm" -- a second window
+# open), and reports the time from launching the browser process to the
+# page's first contentful paint. The page is loaded in an iframe of a tiny
+# probe page that posts the iframe's paint timing back.
+
+_PROBE = """<!DOCTYPE html><html><body style="margin:0">
+<iframe id="f" src="/%s" style="border:0;width:100vw;height:100vh"></iframe>
+<script>
+const f = document.getElementById('f');
+(function poll() {
+    try {
+        const p = f.contentWindow.performance;
+        const e = p.getEntriesByName('first-contentful-paint')[0] || p.getEntriesByName('first-paint')[0];
+        if (e) {
+            navigator.sendBeacon('/__first_paint', JSON.stringify({ at: p.timeOrigin + e.startTime }));
+            return;
+        }
+    } catch (err) {}
+    setTimeout(poll, 20);
+})();
+</script></body></html>"""
+
+
+def _find_browser():
+    for name in ('chrome', 'google-chrome', 'chromium', 'chromium-browser', 'msedge', 'microsoft-edge'):
+        path = shutil.which(name)
+        if path:
+            return path
+    for path in (r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+                 r'C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe',
+                 r'C:\Program Files\Microsoft\Edge\Application\msedge.exe'):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _serve_for_measurement(web_dir, dist_dir, page):
+    """Start a background server; returns (port, queue of paint timestamps)."""
+    import bottle
+    from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+    app = bottle.Bottle()
+    paints = []
+    done = threading.Event()
+
+    @app.route('/__probe.html')
+    def probe():
+        bottle.response.set_header('Cache-Control', 'no-store')
+        return _PROBE % page
+
+    @app.route('/__first_paint', method='POST')
+    def first_paint():
+        paints.append(json.loads(bottle.request.body.read())['at'] / 1000.0)
+        done.set()
+        return ''
+
+    if dist_dir is None:
+        @app.route('/<path:path>')
+        def plain(path):
+            # What Eel does: the file as-is, never cached
+            response = bottle.static_file(path, root=os.path.abspath(web_dir))
+            response.set_header('Cache-Control', 'no-store')
+            return response
+    else:
+        add_asset_routes(app, dist_dir)
+
+    class Quiet(WSGIRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    server = make_server('127.0.0.1', 0, app, handler_class=Quiet)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, paints, done
+
+
+def measure(web_dir, out_dir=None, page='index.html', runs=5, browser=None):
+    """
+    Launch-to-first-paint for web_dir as served by plain Eel vs. the build.
+
+    Returns:
+        dict: {'source' | 'built': {'cold': [s, ...], 'warm': [s, ...]}}
+    """
+    browser = browser or _find_browser()
+    if browser is None:
+        raise RuntimeError('No Chrome/Edge found for the first-paint measurement (use --browser).')
+    out_dir = out_dir or default_out_dir(web_dir)
+    results = {}
+    for label, dist in (('source', None), ('built', out_dir)):
+        server, paints, done = _serve_for_measurement(web_dir, dist, page)
+        url = f'http://127.0.0.1:{server.server_port}/__probe.html'
+        cold, warm = [], []
+        try:
+            for _ in range(runs):
+                with tempfile.TemporaryDirectory() as profile:
+                    for bucket in (cold, warm):
+                        done.clear()
+                        t0 = time.time()
+                        proc = subprocess.Popen(
+                            [browser, '--headless=new', f'--user-data-dir={profile}',
+                             '--no-first-run', '--disable-extensions', url],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                        try:
+                            if done.wait(30):
+                                bucket.append(paints[-1] - t0)
+                        finally:
+                            proc.terminate()
+                            proc.wait()
+        finally:
+            server.shutdown()
+        results[label] = {'cold': cold, 'warm': warm}
+    return results
+
+
+#%% CLI
+# =============================================================================
+
+def print_build_report(manifest):
+    files = manifest['files']
+    print(f"{'file':<44} {'source':>9} {'min':>9} {'gzip':>9} {'brotli':>9}")
+    for rel, s in sorted(files.items()):
+        print(f"{rel:<44} {s['source']:>9,} {s['min']:>9,} {s.get('gz', s['min']):>9,} "
+              f"{s.get('br', s.get('gz', s['min'])):>9,}")
+    for warning in manifest['warnings']:
+        print(f'  ! {warning}')
+    if not manifest['brotli']:
+        print('  (pip install brotli for .br variants)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Static asset pipeline for the Eel apps.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('vendor', help='download vendored third-party scripts')
+    p.add_argument('app_dir')
+    p.add_argument('--force', action='store_true', help='re-download even if present')
+    p = sub.add_parser('build', help='bundle, minify, hash and precompress a web folder')
+    p.add_argument('web_dir')
+    p.add_argument('-o', '--out', default=None)
+    p = sub.add_parser('measure', help='browser launch to first paint, source vs. built')
+    p.add_argument('web_dir')
+    p.add_argument('-o', '--out', default=None)
+    p.add_argument('--page', default='index.html')
+    p.add_argument('--runs', type=int, default=5)
+    p.add_argument('--browser', default=None)
+    args = parser.parse_args()
+
+    if args.command == 'vendor':
+        fetched = vendor(args.app_dir, args.force)
+        print(f"downloaded: {', '.join(fetched) or 'nothing (all present)'}")
+    elif args.command == 'build':
+        print_build_report(build(args.web_dir, args.out))
+    else:
+        if not is_up_to_date(args.web_dir, args.out):
+            build(args.web_dir, args.out)
+        results = measure(args.web_dir, args.out, args.page, args.runs, args.browser)
+        print(f"{'':<8} {'cold ms (median)':>18} {'warm ms (median)':>18}")
+        for label, r in results.items():
+            med = {k: 1e3 * sorted(v)[len(v) // 2] if v else float('nan') for k, v in r.items()}
+            print(f"{label:<8} {med['cold']:>18.0f} {med['warm']:>18.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+main.py — Eel backend that streams live run values into the schematic's data boxes.
+
+WORKFLOW:
+    1. Eel starts and serves index.html (this folder is the web root)
+    2. A background greenlet samples the run (here: a simulated engine start
+       and steady state) as fast as the model produces values
+    3. Samples go into a TelemetryThrottle; at most `--hz` times a second
+       (30-60 Hz is plenty for numbers a person reads) it hands back one
+       batch with only the channels that moved past their deadband
+    4. The batch is pushed to the page: eel.telemetry_batch({seq, t, values})
+    5. index.html merges batches and updates the changed boxes once per
+       animation frame
+
+WHY THROTTLE AND BATCH ON THIS SIDE?
+    A model running at hundreds of Hz would otherwise mean hundreds of
+    websocket messages a second, each waking the page. One message per
+    display frame, carrying only what changed, keeps both the socket and the
+    browser's main thread quiet -- and a steady-state run sends almost
+    nothing at all.
+"""
+
+import argparse
+import math
+import os
+import sys
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict
+
+import eel
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from eel_assets import use_built_assets  # noqa: E402  (repo root)
+
+
+# =============================================================================
+# Telemetry source
+# =============================================================================
+# In your real app this would read the running ROCETS model's outputs.
+
+# channel -> (steady-state value, start value, time constant s, noise sigma)
+CHANNELS = {
+    "P1":      (150.0,    14.7, 0.8,  0.6),
+    "Pc":      (2500.0,   14.7, 1.2,  6.0),
+    "T1":      (-320.0, -300.0, 2.0,  0.3),
+    "Tc":      (6000.0,   70.0, 1.0, 12.0),
+    "mdot_f":  (45.2,      0.0, 0.9,  0.08),
+    "mdot_ox": (156.8,     0.0, 0.9,  0.25),
+}
+
+
+class SimulatedRun:
+    """First-order start transient to steady state, plus sensor noise."""
+
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.t0 = time.perf_counter()
+
+    def sample(self) -> Dict[str, float]:
+        t = time.perf_counter() - self.t0
+        values = {}
+        for name, (steady, start, tau, sigma) in CHANNELS.items():
+            values[name] = steady + (start - steady) * math.exp(-t / tau) + self.rng.gauss(0.0, sigma)
+        return values
+
+
+# =============================================================================
+# Throttling / batching
+# =============================================================================
+
+@dataclass
+class TelemetryThrottle:
+    """
+    Coalesces samples into at most `hz` batches per second.
+
+    offer() keeps only the latest value per channel; take() returns the
+    channels whose latest value differs from the last one *sent* by more
+    than their deadband (or None if nothing is due yet).
+    """
+
+    hz: float = 30.0
+    deadband: Dict[str, float] = field(default_factory=dict)
+    default_deadband: float = 0.0
+
+    def __post_init__(self):
+        self.latest: Dict[str, float] = {}
+        self.sent: Dict[str, float] = {}
+        self.next_due = 0.0
+        self.seq = 0
+        self.samples = 0
+        self.batches = 0
+        self.values_sent = 0
+
+    def offer(self, values: Dict[str, float]):
+        self.latest.update(values)
+        self.samples += 1
+
+    def take(self, now: float):
+        if now < self.next_due:
+            return None
+        self.next_due = max(self.next_due + 1.0 / self.hz, now)
+        changed = {}
+        for name, value in self.latest.items():
+            last = self.sent.get(name)
+            if last is None or abs(value - last) > self.deadband.get(name, self.default_deadband):
+                changed[name] = value
+        if not changed:
+            return None
+        self.sent.update(changed)
+        self.seq += 1
+        self.batches += 1
+        self.values_sent += len(changed)
+        return {"seq": self.seq, "t": now, "values": changed}
+
+
+# Deadbands: half of the last displayed digit, so the page only hears about
+# changes it would actually show.
+throttle = TelemetryThrottle(deadband={"P1": 0.5, "Pc": 0.5, "T1": 0.5, "Tc": 0.5,
+                                       "mdot_f": 0.05, "mdot_ox": 0.05})
+
+
+def stream_telemetry(source, sample_hz: float):
+    """Greenlet: sample `source` at `sample_hz`, push throttled batches."""
+    period = 1.0 / sample_hz
+    while True:
+        throttle.offer(source.sample())
+        batch = throttle.take(time.perf_counter())
+        if batch is not None:
+            eel.telemetry_batch(batch)
+        eel.sleep(period)
+
+
+@eel.expose
+def set_telemetry_rate(hz):
+    """Let the page lower (or raise) the batch rate, clamped to 1-60 Hz."""
+    throttle.hz = min(60.0, max(1.0, float(hz)))
+    return {"success": True, "hz": throttle.hz}
+
+
+@eel.expose
+def telemetry_stats():
+    return {
+        "hz": throttle.hz,
+        "samples": throttle.samples,
+        "batches": throttle.batches,
+        "values_sent": throttle.values_sent,
+    }
+
+
+def start_app():
+    """Initialize and launch the Eel application."""
+    parser = argparse.ArgumentParser(description="Engine schematic with live telemetry.")
+    parser.add_argument("--hz", type=float, default=30.0,
+                        help="telemetry batches per second sent to the page (1-60)")
+    parser.add_argument("--sample-hz", type=float, default=500.0,
+                        help="rate the (simulated) model produces values at")
+    args = parser.parse_args()
+    set_telemetry_rate(args.hz)
+
+    web_root, app = use_built_assets(os.path.dirname(os.path.abspath(__file__)))
+    eel.init(web_root)
+    eel.spawn(stream_telemetry, SimulatedRun(), args.sample_hz)
+    eel.start("index.html", size=(1240, 900), port=0, app=app)
+
+
+if __name__ == "__main__":
+    start_app()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import socket
+import sys
 import threading
 import time
 from dataclasses import dataclass
@@ -9,6 +10,10 @@ from typing import Optional
 
 import eel
 
+# Shared asset pipeline (repo root): minified, precompressed dist/ build
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from eel_assets import use_built_assets  # noqa: E402  (repo root)
+
 # Only import pywebview if we need it (keeps dependencies optional in the future)
 try:
     import webview  # pywebview
@@ -86,7 +91,8 @@ def start_with_external_edge(config: AppConfig) -> None:
     """
     Normal Eel flow: start server + open Edge in app-mode.
     """
-    eel.init(config.web_dir)
+    web_root, app = use_built_assets(config.web_dir)
+    eel.init(web_root)
 
     # Tell Eel where Edge is (best-effort; some Eel versions may still use `start msedge`)
     try:
@@ -100,6 +106,7 @@ def start_with_external_edge(config: AppConfig) -> None:
         host=config.host,
         port=config.port or 0,  # 0 lets Eel auto-pick
         mode="edge",
+        app=app,
         cmdline_args=[
             "--app={url}",
             f"--window-size={config.width},{config.height}",
@@ -117,7 +124,8 @@ def start_with_embedded_webview(config: AppConfig) -> None:
     if webview is None:
         raise RuntimeError("pywebview is not installed or failed to import.")
 
-    eel.init(config.web_dir)
+    web_root, app = use_built_assets(config.web_dir)
+    eel.init(web_root)
 
     # Choose a deterministic port (pywebview needs a URL to load)
     port = config.port or pick_free_port(config.host)
@@ -131,6 +139,7 @@ def start_with_embedded_webview(config: AppConfig) -> None:
             port=port,
             block=True,     # keep server running in this thread
             mode=None,      # IMPORTANT: don't open an external browser
+            app=app,
         )
 
     t = threading.Thread(target=run_eel, daemon=True)
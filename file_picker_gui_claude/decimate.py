@@ -0,0 +1,274 @@
+"""
+decimate.py — Min/max pyramids for plotting huge .OUT channels.
+
+THE PROBLEM:
+    A multi-million-sample channel sent as JSON over Eel's websocket is tens
+    of MB; the browser then has to draw a line through every point. But a
+    plot 1200 pixels wide can only show 1200 columns -- all that matters per
+    column is the lowest and highest value that falls in it.
+
+THE PYRAMID (built once per .OUT file, cached in the session directory):
+    <model_dir>/.rocets_session/pyramids/run1.OUT-<path hash>.pyramid/
+        meta.json       source stamp, channel names, samples, factor
+        level-0.npy     raw samples, (channels, n)            float64
+        level-1.npy     min/max of every 8 samples,  (channels, 2, n/8)
+        level-2.npy     min/max of every 64 samples, (channels, 2, n/64)
+        ...             until a level has <= MIN_BUCKETS buckets
+
+    Total size is ~1.3x the raw binary. Every level is np.load()ed with
+    mmap_mode='r', so a query only pages in the slice it reads.
+
+    Not next to the .OUT file: writing there would change the output
+    folder's mtime and invalidate the session's output index.
+
+A QUERY (window [t0, t1], width in pixels):
+    1. Binary-search the window in the TIME column   -> samples i0:i1
+    2. Few enough samples (<= 2 per pixel)?           -> return them raw
+    3. Else pick the finest level with at most FACTOR buckets per pixel
+       (level 0 if the file is too short to have any other), merge its
+       buckets down to <= pixels buckets, and return each bucket's min and
+       max at the bucket's start time.
+
+    That reads O(pixels * FACTOR) values and returns <= 2 * pixels points
+    however long the run is -- so pan and zoom stay in the milliseconds.
+
+ASSUMES:
+    The first column is time and is non-decreasing (see outputs.py).
+
+    Benchmark:  python decimate.py --samples 10000000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from outputs import parse_out_file
+from session import source_stamp
+
+
+FORMAT_VERSION = 1
+FACTOR = 8              # samples per bucket, level to level
+MIN_BUCKETS = 256       # stop adding levels below this many buckets
+
+
+def cache_dir(path: Path, root: Path) -> Path:
+    """Where the pyramid for a .OUT file lives under `root` (one per path)."""
+    digest = hashlib.sha1(str(Path(path).resolve()).encode("utf-8")).hexdigest()[:10]
+    return Path(root) / f"{Path(path).name}-{digest}.pyramid"
+
+
+# =============================================================================
+# Building
+# =============================================================================
+
+def build_pyramid(columns: Dict[str, np.ndarray], directory: Path, source=None,
+                  factor: int = FACTOR, min_buckets: int = MIN_BUCKETS) -> Path:
+    """
+    Write the pyramid for {name: samples} columns (time first) to directory.
+
+    The levels are written to a temporary directory that then replaces
+    `directory`, so a reader never sees a half-built pyramid.
+    """
+    names = list(columns)
+    data = np.vstack([np.asarray(columns[name], dtype=np.float64) for name in names])
+    tmp = directory.with_name(f"{directory.name}.tmp-{uuid.uuid4().hex[:8]}")
+    tmp.mkdir(parents=True)
+
+    np.save(tmp / "level-0.npy", data)
+    mins = maxs = data
+    levels = 0
+    while mins.shape[1] > min_buckets:
+        starts = np.arange(0, mins.shape[1], factor)
+        mins = np.minimum.reduceat(mins, starts, axis=1)
+        maxs = np.maximum.reduceat(maxs, starts, axis=1)
+        levels += 1
+        np.save(tmp / f"level-{levels}.npy", np.stack([mins, maxs], axis=1))
+
+    meta = {
+        "format": FORMAT_VERSION,
+        "source": source,
+        "channels": names,
+        "samples": int(data.shape[1]),
+        "factor": factor,
+        "levels": levels,
+    }
+    with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+    # Windows can't rename over a directory (or delete one that's mapped);
+    # an old pyramid we fail to remove is just left behind.
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp, directory)
+    return directory
+
+
+# =============================================================================
+# Querying
+# =============================================================================
+
+class Pyramid:
+    """
+    A built pyramid, opened read-only and memory-mapped.
+
+    Args:
+        directory: The pyramid directory (see cache_dir()).
+    """
+
+    def __init__(self, directory: Path):
+        with open(directory / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{directory}: unsupported pyramid format {meta.get('format')}")
+        self.source = meta["source"]
+        self.channels: List[str] = meta["channels"]
+        self.samples = meta["samples"]
+        self.factor = meta["factor"]
+        self.index = {name: i for i, name in enumerate(self.channels)}
+        self.levels = [np.load(directory / f"level-{k}.npy", mmap_mode="r")
+                       for k in range(meta["levels"] + 1)]
+
+    @property
+    def time(self) -> np.ndarray:
+        return self.levels[0][0]
+
+    def window(self, channel: str, t0: Optional[float] = None, t1: Optional[float] = None,
+               pixels: int = 1000) -> Dict:
+        """
+        At most 2 * pixels points that draw `channel` over [t0, t1] faithfully.
+
+        Returns:
+            dict: {"time", "values" (numpy arrays), "level" (0 = raw),
+                   "bucket" (samples per returned min/max pair),
+                   "samples" (raw samples in the window)}
+        """
+        row = self.index[channel]
+        t = self.time
+        pixels = max(1, int(pixels))
+
+        # One extra sample each side so the line runs off the plot edges
+        i0 = 0 if t0 is None else max(int(np.searchsorted(t, t0, "left")) - 1, 0)
+        i1 = self.samples if t1 is None else min(int(np.searchsorted(t, t1, "right")) + 1, self.samples)
+        samples = max(i1 - i0, 0)
+
+        if samples <= 2 * pixels:
+            return {"time": np.array(t[i0:i1]), "values": np.array(self.levels[0][row, i0:i1]),
+                    "level": 0, "bucket": 1, "samples": samples}
+
+        if len(self.levels) == 1:
+            # Too few samples for a level 1 (<= min_buckets): merge raw samples
+            level, size, k0, k1 = 0, 1, i0, i1
+            mins = maxs = self.levels[0][row, i0:i1]
+        else:
+            # Finest level with <= factor buckets per pixel (or the coarsest there is)
+            level = 1
+            while level < len(self.levels) - 1 and samples / self.factor ** level > pixels * self.factor:
+                level += 1
+            size = self.factor ** level
+            k0, k1 = i0 // size, -(-i1 // size)
+            mins = self.levels[level][row, 0, k0:k1]
+            maxs = self.levels[level][row, 1, k0:k1]
+
+        # Merge groups of buckets down to <= pixels
+        group = -(-(k1 - k0) // pixels)
+        starts = np.arange(0, k1 - k0, group)
+        mins = np.minimum.reduceat(mins, starts)
+        maxs = np.maximum.reduceat(maxs, starts)
+        bucket_time = t[(k0 + starts) * size]
+
+        return {
+            "time": np.repeat(bucket_time, 2),
+            "values": np.column_stack([mins, maxs]).ravel(),
+            "level": level,
+            "bucket": size * group,
+            "samples": samples,
+        }
+
+
+_open_pyramids: Dict[Path, Pyramid] = {}
+
+
+def get_pyramid(path: Path, root: Path) -> Pyramid:
+    """
+    The pyramid for a .OUT file: already open, from its cache directory
+    under `root`, or built now (first use, or the .OUT file changed since it
+    was built).
+    """
+    path = Path(path)
+    stamp = source_stamp(path)
+    pyramid = _open_pyramids.get(path)
+    if pyramid is not None and pyramid.source == stamp:
+        return pyramid
+
+    directory = cache_dir(path, root)
+    try:
+        pyramid = Pyramid(directory)
+    except (OSError, ValueError, KeyError):
+        pyramid = None
+    if pyramid is None or pyramid.source != stamp:
+        _open_pyramids.pop(path, None)
+        pyramid = None                          # drop our mapping before replacing
+        build_pyramid(parse_out_file(path), directory, stamp)
+        pyramid = Pyramid(directory)
+
+    _open_pyramids[path] = pyramid
+    return pyramid
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build a pyramid for a synthetic channel and time zoom/pan queries.")
+    parser.add_argument("--samples", type=int, default=10_000_000)
+    parser.add_argument("--pixels", type=int, default=1200)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    n = args.samples
+    t = np.arange(n) * 1e-3
+    columns = {
+        "TIME": t,
+        "PC": 2e6 + 5e4 * np.sin(t / 7.0) + rng.normal(0.0, 2e3, n),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t_build = time.perf_counter()
+        directory = build_pyramid(columns, Path(tmp) / "bench.OUT.pyramid")
+        t_build = time.perf_counter() - t_build
+        size = sum(f.stat().st_size for f in directory.iterdir())
+        pyramid = Pyramid(directory)
+
+        latencies, points = [], []
+        span = t[-1] - t[0]
+        for _ in range(args.queries):
+            width = span * 10 ** rng.uniform(-6, 0)       # 1e-6 .. full range
+            start = rng.uniform(t[0], t[-1] - width)
+            t0 = time.perf_counter()
+            out = pyramid.window("PC", start, start + width, args.pixels)
+            latencies.append(1e3 * (time.perf_counter() - t0))
+            points.append(len(out["values"]))
+        del pyramid, out
+
+    raw_json_mb = n * 2 * 20 / 1e6                      # ~20 chars per number, time + value
+    print(f"{n:,} samples: pyramid built in {t_build:.2f} s, {size / 1e6:.1f} MB on disk")
+    print(f"{args.queries} random zoom windows at {args.pixels} px:")
+    print(f"   latency  p50 {np.percentile(latencies, 50):.2f} ms, "
+          f"p95 {np.percentile(latencies, 95):.2f} ms, max {max(latencies):.2f} ms")
+    print(f"   points   max {max(points)} (vs {n:,} raw, ~{raw_json_mb:.0f} MB as JSON)")
+
+
+if __name__ == "__main__":
+    main()
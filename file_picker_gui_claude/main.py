@@ -25,13 +25,31 @@ WHY A SEPARATE MODULE IN PRODUCTION?
     seams would be.
 """
 
+import atexit
 import os
+import sys
+import time
 import eel
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
 from typing import Dict, Any
 
+# Shared asset pipeline (repo root): serves web/'s minified, precompressed
+# build from dist/ when it's up to date -- python eel_assets.py build web
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from eel_assets import use_built_assets  # noqa: E402  (repo root)
+
+# Opt-in latency tracing: `python main.py --trace` (see tracing.py)
+import tracing  # noqa: E402
+
+# Working set of the open project + its memory-mapped snapshot (see session.py)
+from outputs import find_out_files, parse_out_file, read_header  # noqa: E402
+from session import SessionState  # noqa: E402
+
+# Min/max pyramids for plotting huge channels (see decimate.py)
+from decimate import get_pyramid  # noqa: E402
+
 
 # =============================================================================
 # ProjectIdentity (same frozen dataclass from our earlier work)
@@ -69,10 +87,23 @@ class ProjectIdentity:
 # =============================================================================
 # Module-level state
 # =============================================================================
-# In your real app, this would live in SessionState or an app controller.
-# For this demo, a simple module-level variable keeps it minimal.
+# current_session holds everything derived from the project (parsed outputs,
+# indexes, UI state) and is snapshotted to <model_dir>/.rocets_session/ on
+# close, so reopening the same model directory resumes instead of rebuilding.
 
 current_project: ProjectIdentity | None = None
+current_session: SessionState | None = None
+
+
+def save_session():
+    """Snapshot the current session (switching projects / interpreter exit)."""
+    if current_session is None:
+        return
+    try:
+        path = current_session.save()
+        print(f"💾 Session saved: {path}")
+    except OSError as e:
+        print(f"❌ Could not save session: {e}")
 
 
 # =============================================================================
@@ -155,7 +186,7 @@ def create_new_project(model_directory: str, project_name: str):
     Returns:
         dict with the created project's data, or an error message
     """
-    global current_project
+    global current_project, current_session
 
     try:
         current_project = ProjectIdentity(
@@ -164,14 +195,22 @@ def create_new_project(model_directory: str, project_name: str):
             created_at=datetime.now(),
         )
 
+        # Switching projects: snapshot the old one before dropping it
+        save_session()
+        current_session = SessionState.resume(current_project)
+
         print(f"✅ Project created: {current_project.project_name}")
         print(f"   Model dir:  {current_project.model_directory}")
         print(f"   CFG dir:    {current_project.cfg_directory}")
         print(f"   Output dir: {current_project.output_directory}")
+        if current_session.stats["resumed"]:
+            print(f"   Resumed session snapshot ({current_session.stats['resume_ms']:.1f} ms)")
 
         return {
             "success": True,
             "project": current_project.to_dict(),
+            "session": current_session.summary(),
+            "ui_state": current_session.ui_state,
         }
 
     except Exception as e:
@@ -182,6 +221,80 @@ def create_new_project(model_directory: str, project_name: str):
         }
 
 
+@eel.expose
+def list_outputs():
+    """
+    Index of the project's .OUT files: name, size and channel names.
+
+    Only each file's header is read; the data is parsed when a channel is
+    actually needed (load_output / plot_window). Cached in the session (and
+    its snapshot) against the .OUT files' mtimes; a new or rewritten file
+    rebuilds the index.
+
+    Returns:
+        dict: {"success": True, "files": [{"file", "bytes", "channels"}, ...]}
+    """
+    if current_session is None:
+        return {"success": False, "error": "No project loaded."}
+    out_dir = current_project.output_directory
+    paths = find_out_files(out_dir)
+
+    def build():
+        return [{"file": str(p.relative_to(out_dir)), "bytes": p.stat().st_size,
+                 "channels": read_header(p)[0]} for p in paths]
+
+    # The directory itself is a source too: adding/removing files changes its mtime
+    files = current_session.get("index:outputs", [out_dir, *paths], build)
+    return {"success": True, "files": files}
+
+
+def load_output(path: Path):
+    """Parsed columns of one .OUT file, via the session (mapped if resumed)."""
+    return current_session.get(f"out:{path}", [path], lambda: parse_out_file(path))
+
+
+@eel.expose
+def plot_window(file: str, channel: str, t0=None, t1=None, pixels: int = 1000):
+    """
+    Plot-ready points for one channel over [t0, t1] (None = run start/end).
+
+    Served from the file's min/max pyramid (see decimate.py): at most
+    2 * pixels points whatever the run length, so panning and zooming a
+    multi-million-sample channel only moves a few KB over the websocket.
+    The pyramid is built on first use and cached in the session directory.
+
+    Returns:
+        dict: {"success": True, "time": [...], "values": [...], "level",
+               "samples" (raw samples in the window), "ms"}
+    """
+    if current_session is None:
+        return {"success": False, "error": "No project loaded."}
+    t_start = time.perf_counter()
+    try:
+        pyramid = get_pyramid(current_project.output_directory / file,
+                              current_session.snapshot_dir / "pyramids")
+        window = pyramid.window(channel, t0, t1, pixels)
+    except (OSError, ValueError, KeyError) as e:
+        return {"success": False, "error": f"{type(e).__name__}: {e}"}
+    return {
+        "success": True,
+        "time": window["time"].tolist(),
+        "values": window["values"].tolist(),
+        "level": window["level"],
+        "samples": window["samples"],
+        "ms": 1e3 * (time.perf_counter() - t_start),
+    }
+
+
+@eel.expose
+def save_ui_state(state: Dict[str, Any]):
+    """Merge the GUI's state (open panels, selections, ...) into the session."""
+    if current_session is None:
+        return {"success": False, "error": "No project loaded."}
+    current_session.ui_state.update(state)
+    return {"success": True}
+
+
 # =============================================================================
 # App entry point
 # =============================================================================
@@ -205,7 +318,20 @@ def start_app():
         2. Reusability — other scripts can call start_app() with different args
         3. Clean __main__ guard — standard Python best practice
     """
-    eel.init("web")  # Point Eel at the web/ folder for frontend files
+    web_root, app = use_built_assets("web")
+    eel.init(web_root)  # Point Eel at the web/ folder (or its dist/ build)
+
+    # --- Opt-in latency tracing ---
+    # ?trace=1 makes web/tracing.js route every eel.* call through
+    # tracing.trace_call(); the Python-side summary prints on exit.
+    trace = "--trace" in sys.argv or tracing.ENABLED
+    if trace:
+        atexit.register(tracing.print_summary)
+        print("   Tracing Eel calls (Ctrl+Shift+L toggles the overlay)")
+
+    # Snapshot the session on exit. Eel's default close handling already
+    # exits once the last window is gone (and survives a page reload).
+    atexit.register(save_session)
 
     edge = find_edge()
 
@@ -229,9 +355,10 @@ def start_app():
     # )
     print("🚀 ROCETS GUI starting...")
     eel.start(
-        "index.html",
+        "index.html?trace=1" if trace else "index.html",
         mode="edge",                 # ✅ must be a known mode name
         port=0,
+        app=app,                     # serves dist/ with cache headers if built
         # ✅ flags go here
         cmdline_args=[
             "--app={url}",           # ✅ kills address bar/tabs/bookmarks
@@ -0,0 +1,55 @@
+"""
+outputs.py — Finding and parsing ROCETS .OUT files.
+
+FORMAT ASSUMED:
+    Plain-text, whitespace-delimited columns. The first non-blank line that
+    isn't a comment ("#", "!" or "*") holds the column names; every line
+    after it is one time step. The first column is usually TIME.
+
+    In your real app the parser would follow the actual ROCETS output spec;
+    everything downstream only needs (names, columns).
+"""
+
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+COMMENT_CHARS = ("#", "!", "*")
+
+
+def find_out_files(output_directory: Path) -> List[Path]:
+    """All .OUT files under output_directory (case-insensitive), sorted."""
+    if not output_directory.is_dir():
+        return []
+    return sorted(p for p in output_directory.rglob("*") if p.is_file() and p.suffix.lower() == ".out")
+
+
+def read_header(path: Path) -> Tuple[List[str], int]:
+    """
+    Returns:
+        (column names, number of lines before the first data line)
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for lineno, line in enumerate(f):
+            stripped = line.strip()
+            if stripped and not stripped.startswith(COMMENT_CHARS):
+                return stripped.split(), lineno + 1
+    return [], 0
+
+
+def parse_out_file(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Parse one .OUT file into {column name: float64 array}.
+
+    Each column is returned as its own contiguous array, so a single
+    channel can be used (or memory-mapped) without touching the others.
+    """
+    names, skip = read_header(path)
+    if not names:
+        return {}
+    data = np.loadtxt(path, skiprows=skip, comments=COMMENT_CHARS, ndmin=2, dtype=np.float64)
+    if data.shape[1] != len(names):
+        raise ValueError(f"{path.name}: header has {len(names)} columns, data has {data.shape[1]}")
+    return {name: np.ascontiguousarray(data[:, i]) for i, name in enumerate(names)}
@@ -0,0 +1,279 @@
+"""
+session.py — The session's working set, and a memory-mapped snapshot of it.
+
+WHAT IS THE WORKING SET?
+    Everything the GUI derives from a project that is expensive to rebuild:
+        - derived arrays   parsed .OUT channels, plot-ready series, ...
+        - indexes          the output scan, channel lists, ...  (JSON-able)
+        - UI state         open panels, selected channels, zoom, ...
+    Each derived entry remembers the source files it was built from, with
+    their mtime and size at build time.
+
+THE SNAPSHOT (<model_dir>/.rocets_session/):
+    manifest.json       project identity, UI state, indexes, and a table of
+                        every array: offset, dtype, shape, sources
+    arrays-<id>.bin     all arrays back to back, 64-byte aligned, raw bytes
+
+WHY THIS FORMAT?
+    Resuming reads manifest.json only -- a few KB -- so the GUI is usable
+    at once. arrays-<id>.bin is mmap'ed on the first array access and each
+    array is a zero-copy numpy view into the mapping: the OS pages data in
+    when (and only if) it's actually touched. A 2 GB working set costs
+    nothing until a plot needs a channel, and then only that channel's pages.
+
+STALENESS:
+    Every get() re-stats the entry's sources (cheap: no reads). If any
+    source's mtime or size changed -- or it's gone -- the snapshot copy is
+    ignored and the entry is rebuilt, then saved with the next snapshot.
+
+WHY A NEW arrays-<id>.bin ON EVERY SAVE?
+    The current one may still be mapped (we may be saving arrays that are
+    views into it). Writing a new file and then atomically replacing
+    manifest.json means a crash mid-save leaves the previous snapshot
+    intact; old array files are removed once nothing maps them.
+"""
+
+import json
+import mmap
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+SNAPSHOT_DIR = ".rocets_session"
+FORMAT_VERSION = 1
+ALIGN = 64
+
+
+def source_stamp(path) -> List:
+    """[path, mtime_ns, size] -- or [path, None, None] if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return [str(path), None, None]
+    return [str(path), st.st_mtime_ns, st.st_size]
+
+
+def is_fresh(stamps: Iterable[List]) -> bool:
+    return all(source_stamp(path) == [path, mtime, size] for path, mtime, size in stamps)
+
+
+class SessionState:
+    """
+    Working set of one open project, resumable from a snapshot.
+
+    Usage:
+        session = SessionState.resume(project)      # instant; nothing loaded
+        columns = session.get(f"out:{name}", [path], lambda: parse_out_file(path))
+        session.ui_state["selected"] = name
+        session.save()                               # on close
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self.snapshot_dir = Path(project.model_directory) / SNAPSHOT_DIR
+        self.ui_state: Dict[str, Any] = {}
+
+        # key -> {"kind": "array" | "arrays" | "json", "sources": [...], "value": ...}
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False              # something new to save besides ui_state
+
+        # Snapshot being resumed from
+        self._manifest: Dict[str, Dict] = {}
+        self._arrays_file: Optional[Path] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self.stats = {"resumed": False, "hits": 0, "restored": 0, "rebuilt": 0,
+                      "stale": 0, "resume_ms": 0.0}
+
+    # --- resume -------------------------------------------------------------
+
+    @classmethod
+    def resume(cls, project) -> "SessionState":
+        """
+        Open the project's snapshot if it has a usable one, else start empty.
+        Only manifest.json is read here.
+        """
+        t0 = time.perf_counter()
+        session = cls(project)
+        path = session.snapshot_dir / "manifest.json"
+        try:
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return session
+        same_project = (manifest.get("format") == FORMAT_VERSION
+                        and manifest.get("model_directory") == str(Path(project.model_directory)))
+        if not same_project:
+            return session
+
+        session.ui_state = manifest.get("ui_state", {})
+        session._manifest = manifest.get("entries", {})
+        if manifest.get("arrays_file"):
+            session._arrays_file = session.snapshot_dir / manifest["arrays_file"]
+        session.stats["resumed"] = True
+        session.stats["resume_ms"] = 1e3 * (time.perf_counter() - t0)
+        return session
+
+    def _map(self) -> mmap.mmap:
+        if self._mmap is None:
+            with open(self._arrays_file, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _view(self, spec) -> np.ndarray:
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        if count == 0:
+            return np.empty(spec["shape"], dtype=dtype)
+        array = np.frombuffer(self._map(), dtype=dtype, count=count, offset=spec["offset"])
+        return array.reshape(spec["shape"])
+
+    def _from_snapshot(self, key) -> Optional[Dict]:
+        """The snapshot's copy of `key` as a live entry (views, not copies)."""
+        entry = self._manifest.get(key)
+        if entry is None:
+            return None
+        if not is_fresh(entry["sources"]):
+            self.stats["stale"] += 1
+            del self._manifest[key]
+            return None
+        kind = entry["kind"]
+        if kind == "json":
+            value = entry["value"]
+        elif kind == "array":
+            value = self._view(entry["array"])
+        else:
+            value = {name: self._view(spec) for name, spec in entry["arrays"].items()}
+        return {"kind": kind, "sources": entry["sources"], "value": value}
+
+    # --- working set --------------------------------------------------------
+
+    def get(self, key: str, sources: Iterable, build: Callable[[], Any]):
+        """
+        The value for `key`, built from `sources` by `build()` if needed.
+
+        Args:
+            key: Name of the derived item (e.g. "out:run1.OUT").
+            sources: Files the item is derived from.
+            build: Returns an ndarray, a {name: ndarray} dict, or anything
+                JSON-serializable.
+
+        Returns:
+            The in-memory value if it's still fresh, else the snapshot's
+            (memory-mapped, read-only) copy if that's fresh, else a new build.
+        """
+        entry = self.entries.get(key)
+        if entry is not None and is_fresh(entry["sources"]):
+            self.stats["hits"] += 1
+            return entry["value"]
+
+        entry = self._from_snapshot(key)
+        if entry is not None:
+            self.stats["restored"] += 1
+        else:
+            stamps = [source_stamp(p) for p in sources]
+            value = build()
+            if isinstance(value, np.ndarray):
+                kind = "array"
+            elif isinstance(value, dict) and value and all(isinstance(v, np.ndarray) for v in value.values()):
+                kind = "arrays"
+            else:
+                kind = "json"
+            entry = {"kind": kind, "sources": stamps, "value": value}
+            self.stats["rebuilt"] += 1
+            self.dirty = True
+        self.entries[key] = entry
+        return entry["value"]
+
+    def invalidate(self, key: str):
+        self.entries.pop(key, None)
+        self._manifest.pop(key, None)
+        self.dirty = True
+
+    # --- save ---------------------------------------------------------------
+
+    def _all_entries(self) -> Dict[str, Dict]:
+        """Live entries plus untouched snapshot entries (still valid later)."""
+        merged = {}
+        for key in self._manifest:
+            if key not in self.entries:
+                entry = self._from_snapshot(key)
+                if entry is not None:
+                    merged[key] = entry
+        merged.update(self.entries)
+        return merged
+
+    def save(self) -> Path:
+        """
+        Write the snapshot. If no derived data changed since resume, only
+        manifest.json (UI state) is rewritten and the array file is reused.
+        """
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        entries = self._all_entries()
+        arrays_file = self._arrays_file
+
+        if self.dirty or arrays_file is None:
+            arrays_file = self.snapshot_dir / f"arrays-{uuid.uuid4().hex[:12]}.bin"
+            table = {}
+            with open(arrays_file, "wb") as f:
+
+                def write(array) -> Dict:
+                    array = np.ascontiguousarray(array)
+                    pad = -f.tell() % ALIGN
+                    f.write(b"\0" * pad)
+                    spec = {"offset": f.tell(), "dtype": array.dtype.str, "shape": list(array.shape)}
+                    f.write(memoryview(array).cast("B") if array.size else b"")
+                    return spec
+
+                for key, entry in entries.items():
+                    record = {"kind": entry["kind"], "sources": entry["sources"]}
+                    if entry["kind"] == "array":
+                        record["array"] = write(entry["value"])
+                    elif entry["kind"] == "arrays":
+                        record["arrays"] = {name: write(a) for name, a in entry["value"].items()}
+                    else:
+                        record["value"] = entry["value"]
+                    table[key] = record
+        else:
+            table = self._manifest
+
+        manifest = {
+            "format": FORMAT_VERSION,
+            "saved_at": time.time(),
+            "model_directory": str(Path(self.project.model_directory)),
+            "project": self.project.to_dict(),
+            "ui_state": self.ui_state,
+            "arrays_file": arrays_file.name,
+            "entries": table,
+        }
+        tmp = self.snapshot_dir / "manifest.json.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, self.snapshot_dir / "manifest.json")
+
+        # The next save starts from what is now on disk. Arrays already handed
+        # out keep the old mapping alive for as long as they're referenced.
+        self._manifest, self._arrays_file, self._mmap = table, arrays_file, None
+        self.dirty = False
+
+        # Old array files: Windows refuses to delete one that's still mapped;
+        # those go on a later save.
+        for old in self.snapshot_dir.glob("arrays-*.bin"):
+            if old.name != arrays_file.name:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+        return self.snapshot_dir
+
+    def close(self):
+        """Drop the mapping (arrays handed out earlier stay valid until freed)."""
+        self.entries.clear()
+        self._mmap = None
+
+    def summary(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._manifest.keys() | self.entries.keys())}
@@ -0,0 +1,188 @@
+"""
+tracing.py — Opt-in latency tracing for Eel calls (JS ⇄ websocket ⇄ Python).
+
+WHAT IT ANSWERS:
+    "New Project feels slow — is it the JS, the websocket hop, or Python?"
+    Every traced call is split into four timestamps:
+
+        t_send    JS is about to call eel.fn(...)()         (JS clock)
+        py_recv   Python's dispatcher received the call     (Python clock)
+        py_end    the exposed Python function returned      (Python clock)
+        t_recv    JS got the result back                    (JS clock)
+
+    giving  js→py = py_recv - t_send,  python = py_end - py_recv,
+            py→js = t_recv - py_end   (after clock correction, see below).
+
+HOW CALLS ARE CORRELATED:
+    web/tracing.js replaces eel.fn with a wrapper that sends
+    eel.trace_call(call_id, "fn", args) instead. trace_call() below looks
+    the real function up in Eel's table of exposed functions, runs it, and
+    returns {result, py_recv, py_start, py_end} -- so the Python timestamps
+    come back on the same message as the result, keyed by the JS call id.
+    The exposed functions themselves are untouched.
+
+WHY A CLOCK SYNC IF IT'S THE SAME MACHINE?
+    performance.timeOrigin + performance.now() and time.time() are both
+    wall-clock, but the browser may coarsen/drift its timer. tracing.js
+    calls trace_clock() a few times at startup and keeps the sample with
+    the smallest round trip (NTP-style): offset = py_now - (t0 + t1) / 2.
+
+OPT-IN:
+    python main.py --trace      (or ROCETS_TRACE=1)
+    opens index.html?trace=1; without it tracing.js leaves eel.* alone and
+    these functions are never called. Ctrl+Shift+L toggles the overlay.
+"""
+
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List
+
+import eel
+
+
+ENABLED = os.environ.get("ROCETS_TRACE") == "1"
+
+
+# =============================================================================
+# Latency histogram
+# =============================================================================
+
+class LatencyHistogram:
+    """
+    Log-spaced latency histogram: 4 buckets per decade from 10 µs to 100 s
+    (same bucket edges as LatencyHistogram in web/tracing.js).
+    """
+
+    PER_DECADE = 4
+    LO_EXP = -2          # 10^-2 ms = 10 µs
+    HI_EXP = 5           # 10^5 ms  = 100 s
+
+    def __init__(self):
+        self.nbuckets = (self.HI_EXP - self.LO_EXP) * self.PER_DECADE + 2  # + under/overflow
+        self.counts = [0] * self.nbuckets
+        self.n = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def bucket(self, ms: float) -> int:
+        if ms <= 0:
+            return 0
+        k = math.floor((math.log10(ms) - self.LO_EXP) * self.PER_DECADE) + 1
+        return min(max(k, 0), self.nbuckets - 1)
+
+    def upper_edge(self, k: int) -> float:
+        return 10 ** (self.LO_EXP + k / self.PER_DECADE)
+
+    def add(self, ms: float):
+        self.counts[self.bucket(ms)] += 1
+        self.n += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bucket holding the q-quantile (an upper bound)."""
+        if not self.n:
+            return float("nan")
+        rank = q * self.n
+        seen = 0
+        for k, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c:
+                return min(self.upper_edge(k), self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict:
+        return {
+            "n": self.n,
+            "mean_ms": self.total_ms / self.n if self.n else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max_ms,
+            "counts": self.counts,
+        }
+
+
+# Python-side view: function name -> histogram of time spent in the function
+python_histograms: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+python_spans: List[Dict] = []
+
+
+def _now_ms() -> float:
+    return time.time() * 1000.0
+
+
+# =============================================================================
+# Eel-exposed tracing endpoints
+# =============================================================================
+
+@eel.expose
+def trace_clock():
+    """Python's wall clock in ms, for tracing.js's offset estimate."""
+    return _now_ms()
+
+
+@eel.expose
+def trace_call(call_id, name, args):
+    """
+    Run exposed function `name` with `args`, timing it.
+
+    Returns:
+        dict: {"result": ..., "py_recv", "py_start", "py_end"} (ms, Python
+        clock), or {"error": ...} with the same timestamps.
+    """
+    py_recv = _now_ms()
+    func = eel._exposed_functions.get(name)
+    reply = {"call_id": call_id, "py_recv": py_recv}
+    if func is None or name.startswith("trace_"):
+        reply.update(error=f"no exposed function {name!r}", py_start=py_recv, py_end=_now_ms())
+        return reply
+
+    reply["py_start"] = _now_ms()
+    try:
+        reply["result"] = func(*args)
+    except Exception as e:
+        reply["error"] = f"{type(e).__name__}: {e}"
+    reply["py_end"] = _now_ms()
+
+    python_histograms[name].add(reply["py_end"] - reply["py_start"])
+    python_spans.append({"call_id": call_id, "name": name, "py_recv": py_recv,
+                         "py_start": reply["py_start"], "py_end": reply["py_end"]})
+    return reply
+
+
+@eel.expose
+def trace_stats():
+    """Python-side histograms (time inside each exposed function)."""
+    return {name: h.to_dict() for name, h in python_histograms.items()}
+
+
+@eel.expose
+def trace_save(trace):
+    """
+    Write a Chrome trace-event JSON object (built by tracing.js) to disk.
+
+    Open it in chrome://tracing or https://ui.perfetto.dev.
+
+    Returns:
+        dict: {"success": True, "path": ...}
+    """
+    path = os.path.abspath(f"eel-trace-{datetime.now():%Y%m%d-%H%M%S}.json")
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+    except OSError as e:
+        return {"success": False, "error": str(e)}
+    return {"success": True, "path": path}
+
+
+def print_summary():
+    """Python-side latency table, printed when the app exits."""
+    if not python_histograms:
+        return
+    print(f"\n{'exposed function':<30} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name, h in sorted(python_histograms.items()):
+        print(f"{name:<30} {h.n:>5} {h.percentile(0.5):>9.2f} {h.percentile(0.95):>9.2f} {h.max_ms:>9.2f}")
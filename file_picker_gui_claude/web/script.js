@@ -8,6 +8,8 @@
  * 3. Python returns {success, path, project_name} → JS receives it
  * 4. JS calls eel.create_new_project(path, name) → Python creates ProjectIdentity
  * 5. Python returns {success, project: {...}}     → JS updates the DOM
+ * 6. JS calls eel.list_outputs()                 → Python scans the outputs
+ *    (instant when the session resumed from its snapshot — see session.py)
  *
  * WHY async/await?
  *   Every eel.python_function()() call crosses a process boundary
@@ -38,6 +40,8 @@ const noProjectMsg     = document.getElementById("no-project");
 const displayName      = document.getElementById("display-project-name");
 const displayModelDir  = document.getElementById("display-model-dir");
 const displayCreatedAt = document.getElementById("display-created-at");
+const displaySession   = document.getElementById("display-session");
+const displayOutputs   = document.getElementById("display-outputs");
 
 
 // =============================================================================
@@ -88,6 +92,20 @@ async function handleNewProject() {
 
         console.log("✅ Project created successfully.");
 
+        // --- Step 5: Session — resumed from the snapshot, or a fresh one ---
+        const session = createResult.session;
+        displaySession.textContent = session.resumed
+            ? `Resumed snapshot (${session.entries} cached items, ${session.resume_ms.toFixed(1)} ms)`
+            : "New session";
+        await eel.save_ui_state({ last_opened: new Date().toISOString() })();
+
+        // --- Step 6: Output index (cached by the session) ---
+        displayOutputs.textContent = "Scanning…";
+        const outputs = await eel.list_outputs()();
+        displayOutputs.textContent = outputs.success
+            ? `${outputs.files.length} .OUT file(s)`
+            : outputs.error;
+
     } else {
         // Something went wrong on the Python side
         alert(`Error creating project: ${createResult.error}`);
@@ -132,4 +150,5 @@ function formatTimestamp(isoString) {
 //   - You can attach multiple listeners to one element if needed
 //   - Modern best practice — inline handlers are considered legacy
 
-btnNewProject.addEventListener("click", handleNewProject);
+// EelTrace.span() times the whole workflow when tracing is on (tracing.js)
+btnNewProject.addEventListener("click", () => EelTrace.span("handleNewProject", handleNewProject));
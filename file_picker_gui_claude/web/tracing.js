@@ -0,0 +1,345 @@
+/**
+ * tracing.js — Opt-in latency tracing overlay for Eel calls.
+ *
+ * WHAT IT DOES (only when the page is opened with ?trace=1,
+ * i.e. `python main.py --trace`):
+ * ==========================================
+ * 1. Every eel.some_function(args)() call goes through a wrapper that
+ *    stamps the JS send time, sends eel.trace_call(id, "some_function",
+ *    args) instead, and stamps the JS receive time
+ * 2. Python (tracing.py) runs the real function and returns its own
+ *    receive/start/end timestamps alongside the result
+ * 3. The wrapper unwraps the result — callers see exactly what they saw
+ *    before — and files the timings under the call id
+ * 4. Per function, four latency histograms are kept:
+ *        total     t_recv - t_send          (what the user waits)
+ *        js→py     websocket + Eel dispatch going in
+ *        python    time inside the exposed Python function
+ *        py→js     websocket + promise resolution coming back
+ * 5. Ctrl+Shift+L toggles an overlay with those numbers; "Export" downloads
+ *    a Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev)
+ *
+ * WHY WRAP eel._import_py_function?
+ *   eel.js re-creates eel.some_function for every Python function when
+ *   its websocket opens, which would throw away wrappers installed any
+ *   earlier. Hooking the import means ours are the ones left standing.
+ *
+ * CLOCKS:
+ *   JS times are performance.timeOrigin + performance.now() (ms since the
+ *   epoch, sub-millisecond); Python times are time.time(). The offset
+ *   between them is estimated from a few trace_clock() round trips,
+ *   keeping the one with the smallest round-trip time.
+ */
+
+(function () {
+    "use strict";
+
+    const ENABLED = new URLSearchParams(window.location.search).get("trace") === "1";
+    const MAX_RECORDS = 5000;           // kept for export; histograms keep everything
+    const SEGMENTS = ["total", "js→py", "python", "py→js"];
+    const SPARK = "▁▂▃▄▅▆▇█";
+
+    const now = () => performance.timeOrigin + performance.now();
+
+
+    // =============================================================================
+    // Latency histogram (same bucket edges as LatencyHistogram in tracing.py)
+    // =============================================================================
+
+    class LatencyHistogram {
+        static PER_DECADE = 4;
+        static LO_EXP = -2;             // 10 µs
+        static HI_EXP = 5;              // 100 s
+
+        constructor() {
+            const H = LatencyHistogram;
+            this.counts = new Array((H.HI_EXP - H.LO_EXP) * H.PER_DECADE + 2).fill(0);
+            this.n = 0;
+            this.max = 0;
+        }
+
+        add(ms) {
+            const H = LatencyHistogram;
+            let k = ms <= 0 ? 0 : Math.floor((Math.log10(ms) - H.LO_EXP) * H.PER_DECADE) + 1;
+            k = Math.min(Math.max(k, 0), this.counts.length - 1);
+            this.counts[k]++;
+            this.n++;
+            this.max = Math.max(this.max, ms);
+        }
+
+        percentile(q) {
+            const H = LatencyHistogram;
+            let seen = 0;
+            for (let k = 0; k < this.counts.length; k++) {
+                seen += this.counts[k];
+                if (this.counts[k] && seen >= q * this.n) {
+                    return Math.min(10 ** (H.LO_EXP + k / H.PER_DECADE), this.max);
+                }
+            }
+            return this.max;
+        }
+
+        sparkline() {
+            const first = this.counts.findIndex((c) => c > 0);
+            if (first < 0) return "";
+            let last = this.counts.length - 1;
+            while (this.counts[last] === 0) last--;
+            const top = Math.max(...this.counts);
+            return this.counts
+                .slice(first, last + 1)
+                .map((c) => (c ? SPARK[Math.min(7, Math.floor((c / top) * 7.999))] : " "))
+                .join("");
+        }
+    }
+
+
+    // =============================================================================
+    // State
+    // =============================================================================
+
+    const records = [];                 // one per completed call (newest last)
+    const spans = [];                   // JS-only spans from EelTrace.span()
+    const histograms = new Map();       // function name -> {segment: LatencyHistogram}
+    let clockOffset = 0;                // Python clock - JS clock, ms
+    let nextCallId = 1;
+
+
+    // =============================================================================
+    // Call wrapper
+    // =============================================================================
+
+    function record(r) {
+        r.jsToPy = Math.max(0, r.pyRecv - clockOffset - r.tSend);
+        r.python = r.pyEnd - r.pyStart;
+        r.pyToJs = Math.max(0, r.tRecv - (r.pyEnd - clockOffset));
+        r.total = r.tRecv - r.tSend;
+
+        if (!histograms.has(r.name)) {
+            histograms.set(r.name, Object.fromEntries(SEGMENTS.map((s) => [s, new LatencyHistogram()])));
+        }
+        const h = histograms.get(r.name);
+        h["total"].add(r.total);
+        h["js→py"].add(r.jsToPy);
+        h["python"].add(r.python);
+        h["py→js"].add(r.pyToJs);
+
+        records.push(r);
+        if (records.length > MAX_RECORDS) records.shift();
+        overlay.refresh();
+    }
+
+    async function tracedCall(name, args) {
+        const id = nextCallId++;
+        const tSend = now();
+        const reply = await eel.trace_call(id, name, args)();
+        const tRecv = now();
+        record({
+            id,
+            name,
+            tSend,
+            tRecv,
+            pyRecv: reply.py_recv,
+            pyStart: reply.py_start,
+            pyEnd: reply.py_end,
+            error: reply.error || null,
+        });
+        if (reply.error) throw new Error(reply.error);
+        return reply.result;
+    }
+
+    // Same double-parentheses API as Eel: eel.fn(args)() or eel.fn(args)(callback)
+    function wrap(name) {
+        if (name.startsWith("trace_")) return;
+        eel[name] = function (...args) {
+            return function (callback) {
+                const promise = tracedCall(name, args);
+                if (callback) {
+                    promise.then(callback);
+                    return undefined;
+                }
+                return promise;
+            };
+        };
+    }
+
+    async function syncClock(samples = 5) {
+        let best = Infinity;
+        for (let i = 0; i < samples; i++) {
+            const t0 = now();
+            const py = await eel.trace_clock()();
+            const t1 = now();
+            if (t1 - t0 < best) {
+                best = t1 - t0;
+                clockOffset = py - (t0 + t1) / 2;
+            }
+        }
+    }
+
+
+    // =============================================================================
+    // Chrome trace-event export
+    // =============================================================================
+
+    function chromeTrace() {
+        const us = (ms) => ms * 1000;
+        const events = [
+            { ph: "M", pid: 1, name: "process_name", args: { name: "JS (browser)" } },
+            { ph: "M", pid: 2, name: "process_name", args: { name: "Python (Eel)" } },
+            { ph: "M", pid: 1, tid: 1, name: "thread_name", args: { name: "eel calls" } },
+            { ph: "M", pid: 1, tid: 2, name: "thread_name", args: { name: "JS spans" } },
+            { ph: "M", pid: 2, tid: 1, name: "thread_name", args: { name: "exposed functions" } },
+        ];
+        for (const r of records) {
+            const pyRecv = r.pyRecv - clockOffset;
+            const pyEnd = r.pyEnd - clockOffset;
+            events.push(
+                {
+                    ph: "X", cat: "eel", name: r.name, pid: 1, tid: 1,
+                    ts: us(r.tSend), dur: us(r.total),
+                    args: { call_id: r.id, js_to_py_ms: r.jsToPy, python_ms: r.python, py_to_js_ms: r.pyToJs, error: r.error },
+                },
+                {
+                    ph: "X", cat: "eel", name: r.name, pid: 2, tid: 1,
+                    ts: us(pyRecv), dur: us(pyEnd - pyRecv),
+                    args: { call_id: r.id, dispatch_ms: r.pyStart - r.pyRecv },
+                },
+                // Flow arrows: JS send -> Python, Python return -> JS
+                { ph: "s", cat: "eel", name: "call", id: `${r.id}>`, pid: 1, tid: 1, ts: us(r.tSend) },
+                { ph: "f", bp: "e", cat: "eel", name: "call", id: `${r.id}>`, pid: 2, tid: 1, ts: us(pyRecv) },
+                { ph: "s", cat: "eel", name: "return", id: `${r.id}<`, pid: 2, tid: 1, ts: us(pyEnd) - 1 },
+                { ph: "f", bp: "e", cat: "eel", name: "return", id: `${r.id}<`, pid: 1, tid: 1, ts: us(r.tRecv) - 1 }
+            );
+        }
+        for (const s of spans) {
+            events.push({ ph: "X", cat: "js", name: s.name, pid: 1, tid: 2, ts: us(s.start), dur: us(s.end - s.start) });
+        }
+        return { traceEvents: events, displayTimeUnit: "ms", otherData: { clock_offset_ms: clockOffset } };
+    }
+
+    function downloadTrace() {
+        const blob = new Blob([JSON.stringify(chromeTrace())], { type: "application/json" });
+        const a = document.createElement("a");
+        a.href = URL.createObjectURL(blob);
+        a.download = `eel-trace-${new Date().toISOString().replace(/[:.]/g, "-")}.json`;
+        a.click();
+        URL.revokeObjectURL(a.href);
+    }
+
+
+    // =============================================================================
+    // Overlay panel
+    // =============================================================================
+
+    const overlay = {
+        el: null,
+        body: null,
+        pending: false,
+
+        build() {
+            this.el = document.createElement("div");
+            this.el.id = "trace-overlay";
+            this.el.innerHTML =
+                '<div class="trace-header">Eel call latency (ms)' +
+                '<span><button data-act="export">Export</button><button data-act="save">Save</button>' +
+                '<button data-act="clear">Clear</button><button data-act="close">×</button></span></div>' +
+                '<table><thead><tr><th>function</th><th>n</th><th>total p50 / p95</th>' +
+                "<th>js→py p50</th><th>python p50</th><th>py→js p50</th><th>total histogram</th></tr></thead>" +
+                "<tbody></tbody></table>" +
+                '<div class="trace-footer"></div>';
+            this.body = this.el.querySelector("tbody");
+            this.el.addEventListener("click", (e) => {
+                const act = e.target.dataset && e.target.dataset.act;
+                if (act === "export") downloadTrace();
+                if (act === "save") {
+                    eel.trace_save(chromeTrace())().then((r) => {
+                        this.el.querySelector(".trace-footer").textContent = r.success ? `saved ${r.path}` : r.error;
+                    });
+                }
+                if (act === "clear") {
+                    records.length = 0;
+                    spans.length = 0;
+                    histograms.clear();
+                    this.refresh();
+                }
+                if (act === "close") this.toggle(false);
+            });
+            document.body.appendChild(this.el);
+        },
+
+        toggle(show) {
+            if (!this.el) this.build();
+            const visible = show !== undefined ? show : this.el.classList.contains("hidden");
+            this.el.classList.toggle("hidden", !visible);
+            if (visible) this.refresh();
+        },
+
+        // Re-render at most once per frame, and only while visible
+        refresh() {
+            if (!this.el || this.el.classList.contains("hidden") || this.pending) return;
+            this.pending = true;
+            requestAnimationFrame(() => {
+                this.pending = false;
+                const f = (x) => x.toFixed(x < 10 ? 2 : 0);
+                this.body.innerHTML = "";
+                for (const [name, h] of histograms) {
+                    const row = document.createElement("tr");
+                    const cells = [
+                        name,
+                        h.total.n,
+                        `${f(h.total.percentile(0.5))} / ${f(h.total.percentile(0.95))}`,
+                        f(h["js→py"].percentile(0.5)),
+                        f(h.python.percentile(0.5)),
+                        f(h["py→js"].percentile(0.5)),
+                        h.total.sparkline(),
+                    ];
+                    for (const c of cells) {
+                        const td = document.createElement("td");
+                        td.textContent = c;
+                        row.appendChild(td);
+                    }
+                    this.body.appendChild(row);
+                }
+                this.el.querySelector(".trace-footer").textContent =
+                    `${records.length} calls traced · clock offset ${clockOffset.toFixed(2)} ms`;
+            });
+        },
+    };
+
+
+    // =============================================================================
+    // Wire up
+    // =============================================================================
+
+    // A JS-side span (e.g. a whole workflow), exported on its own track.
+    // With tracing off this is just fn().
+    async function span(name, fn) {
+        if (!ENABLED) return fn();
+        const start = now();
+        try {
+            return await fn();
+        } finally {
+            spans.push({ name, start, end: now() });
+            if (spans.length > MAX_RECORDS) spans.shift();
+        }
+    }
+
+    window.EelTrace = { enabled: ENABLED, span, records, histograms, chromeTrace, LatencyHistogram };
+
+    if (!ENABLED || !window.eel) return;
+
+    const importPyFunction = eel._import_py_function;
+    eel._import_py_function = function (name) {
+        importPyFunction.call(eel, name);
+        wrap(name);
+    };
+    eel._py_functions.forEach(wrap);    // the placeholders used until the socket opens
+
+    window.EelTrace.toggle = (show) => overlay.toggle(show);
+    document.addEventListener("DOMContentLoaded", () => {
+        overlay.toggle(true);
+        syncClock();
+    });
+    document.addEventListener("keydown", (e) => {
+        if (e.ctrlKey && e.shiftKey && e.key.toLowerCase() === "l") overlay.toggle();
+    });
+})();
@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""
+@author: dpriley1                               [ Dan Riley, NASA MSFC, ER12 ]
+Created on Wed Oct 21 09:12:40 2026
+
+@Description: Reusable, virtualized icon picker (PyQt6).
+
+    GUI.py / GUI.PyQt6_icons.py build one QPushButton per SP_* name and call
+    standardIcon() for every one of them before the window is first painted.
+    Fine for 70 icons, hopeless for the thousands of theme and resource
+    icons. Here:
+
+        MODEL/VIEW    one IconListModel row per icon (just a name + a key);
+                      a QListView in icon mode with uniform item sizes only
+                      asks for the rows that are actually on screen.
+        LAZY RENDER   the DecorationRole pixmap is rendered the first time a
+                      row is painted, then kept in a bounded LRU pixmap
+                      cache (byte budget) -- scrolling back is a dict lookup,
+                      and memory doesn't grow with the icon count.
+        SEARCH        a QSortFilterProxyModel, re-filtered 120 ms after the
+                      last keystroke (typing "arr" doesn't filter 3 times).
+        FIRST PAINT   time from constructor to the first viewport paint is
+                      recorded in IconPicker.first_paint_ms.
+
+    SOURCES
+        'standard'  QStyle.StandardPixmap (SP_*)
+        'theme'     names found under QIcon.themeSearchPaths() for the
+                    current (or fallback) theme -> QIcon.fromTheme(name)
+        'resource'  every image under the Qt resource system ":/"
+
+    Usage:
+
+        from icon_picker import IconPicker
+
+        picker = IconPicker(sources=('standard', 'theme', 'resource'))
+        picker.iconSelected.connect(lambda name, icon: ...)
+
+    Time-to-first-paint, virtualized vs the old eager button grid:
+
+        python icon_picker.py --exit-after-paint
+        python icon_picker.py --eager --exit-after-paint
+"""
+#%%
+import argparse
+import os
+import sys
+import time
+from collections import OrderedDict, namedtuple
+
+from PyQt6.QtCore import (QAbstractListModel, QDirIterator, QEvent, QModelIndex,
+                          QObject, QSize, QSortFilterProxyModel, Qt, QTimer,
+                          pyqtSignal)
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import (QApplication, QGridLayout, QLabel, QLineEdit,
+                             QListView, QPushButton, QScrollArea, QStyle,
+                             QVBoxLayout, QWidget)
+
+IMAGE_EXTENSIONS = ('.png', '.svg', '.svgz', '.xpm', '.ico', '.jpg', '.bmp')
+
+IconEntry = namedtuple('IconEntry', ['name', 'source', 'key'])
+
+
+# =============================================================================
+# Icon sources (names only -- nothing is rendered here)
+# =============================================================================
+
+def standard_icons():
+    return [IconEntry(sp.name, 'standard', sp) for sp in QStyle.StandardPixmap
+            if sp.name != 'SP_CustomBase']
+
+
+def theme_icons():
+    """Icon names of the current theme (and its fallback), from the theme directories."""
+    themes = [t for t in (QIcon.themeName(), QIcon.fallbackThemeName()) if t]
+    names = set()
+    for root in QIcon.themeSearchPaths():
+        for theme in themes:
+            theme_dir = os.path.join(root, theme)
+            for _, _, files in os.walk(theme_dir):
+                names.update(os.path.splitext(f)[0] for f in files
+                             if f.lower().endswith(IMAGE_EXTENSIONS))
+    return [IconEntry(name, 'theme', name) for name in sorted(names)]
+
+
+def resource_icons(root=':/'):
+    entries = []
+    it = QDirIterator(root, QDirIterator.IteratorFlag.Subdirectories)
+    while it.hasNext():
+        path = it.next()
+        if path.lower().endswith(IMAGE_EXTENSIONS):
+            entries.append(IconEntry(path.rsplit('/', 1)[-1], 'resource', path))
+    return sorted(entries)
+
+
+SOURCES = {
+    'standard': standard_icons,
+    'theme': theme_icons,
+    'resource': resource_icons,
+}
+
+
+# =============================================================================
+# Model
+# =============================================================================
+
+class IconListModel(QAbstractListModel):
+    """
+    Flat list of icons, rendered on demand into a bounded LRU pixmap cache.
+
+    Args:
+        entries (list[IconEntry]): Icons to show.
+        style (QStyle): Style used for 'standard' icons.
+        icon_size (int, optional): Pixmap edge in pixels. Default is 32.
+        cache_bytes (int, optional): Pixmap cache budget. Default is 16 MB.
+
+    Attributes:
+        renders (int): Pixmaps rendered so far (cache misses).
+        hits (int): DecorationRole requests served from the cache.
+    """
+    EntryRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, entries, style, icon_size=32, cache_bytes=16 * 2**20,
+                 parent=None):
+        super().__init__(parent)
+        self._entries = list(entries)
+        self._style = style
+        self._icon_size = icon_size
+        self._cache = OrderedDict()
+        self._cache_bytes = cache_bytes
+        self._bytes = 0
+        self.renders = 0
+        self.hits = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry.name
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.pixmap(index.row())
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"{entry.source}: {entry.key if entry.source == 'resource' else entry.name}"
+        if role == self.EntryRole:
+            return entry
+        return None
+
+    def icon(self, row):
+        """The full QIcon for a row (all sizes/modes; not cached)."""
+        entry = self._entries[row]
+        if entry.source == 'standard':
+            return self._style.standardIcon(entry.key)
+        if entry.source == 'theme':
+            return QIcon.fromTheme(entry.key)
+        return QIcon(entry.key)
+
+    def pixmap(self, row):
+        pm = self._cache.get(row)
+        if pm is not None:
+            self.hits += 1
+            self._cache.move_to_end(row)
+            return pm
+
+        pm = self.icon(row).pixmap(self._icon_size, self._icon_size)
+        self.renders += 1
+        size = pm.width() * pm.height() * max(pm.depth(), 8) // 8
+        self._cache[row] = pm
+        self._bytes += size
+        while self._bytes > self._cache_bytes and len(self._cache) > 1:
+            _, old = self._cache.popitem(last=False)
+            self._bytes -= old.width() * old.height() * max(old.depth(), 8) // 8
+        return pm
+
+    @property
+    def cache_bytes(self):
+        return self._bytes
+
+
+# =============================================================================
+# Widget
+# =============================================================================
+
+class _FirstPaintFilter(QObject):
+    """Calls `callback` on the first Paint event of the watched widget."""
+
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and self._callback is not None:
+            callback, self._callback = self._callback, None
+            QTimer.singleShot(0, callback)      # after this paint has finished
+        return False
+
+
+class IconPicker(QWidget):
+    """
+    Searchable, virtualized icon grid.
+
+    Args:
+        sources (tuple[str], optional): Any of 'standard', 'theme',
+            'resource'. Default is all three.
+        icon_size (int, optional): Icon edge in pixels. Default is 32.
+        cache_bytes (int, optional): Pixmap cache budget. Default is 16 MB.
+
+    Signals:
+        iconSelected(str, QIcon): emitted when an icon is clicked.
+        firstPainted(float): ms from construction to the first paint.
+    """
+    iconSelected = pyqtSignal(str, QIcon)
+    firstPainted = pyqtSignal(float)
+
+    SEARCH_DELAY_MS = 120
+
+    def __init__(self, sources=tuple(SOURCES), icon_size=32, cache_bytes=16 * 2**20,
+                 parent=None):
+        self._t0 = time.perf_counter()
+        super().__init__(parent)
+        self.first_paint_ms = None
+
+        entries = [e for source in sources for e in SOURCES[source]()]
+        self.model = IconListModel(entries, self.style(), icon_size, cache_bytes, self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+        self.search = QLineEdit(placeholderText=f"Search {len(entries)} icons...")
+        self.search.setClearButtonEnabled(True)
+        self._search_timer = QTimer(self, singleShot=True, interval=self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._apply_filter)
+        self.search.textChanged.connect(self._search_timer.start)
+
+        self.view = QListView()
+        self.view.setModel(self.proxy)
+        self.view.setViewMode(QListView.ViewMode.IconMode)
+        self.view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.view.setMovement(QListView.Movement.Static)
+        self.view.setUniformItemSizes(True)        # O(1) layout per row
+        self.view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.view.setBatchSize(256)
+        self.view.setIconSize(QSize(icon_size, icon_size))
+        self.view.setGridSize(QSize(icon_size * 5, icon_size * 2 + 16))
+        self.view.setWordWrap(True)
+        self.view.clicked.connect(self._on_clicked)
+
+        self.status = QLabel()
+        self._update_status()
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.search)
+        layout.addWidget(self.view)
+        layout.addWidget(self.status)
+
+        self._paint_filter = _FirstPaintFilter(self._on_first_paint, self)
+        self.view.viewport().installEventFilter(self._paint_filter)
+
+    def _apply_filter(self):
+        self.proxy.setFilterFixedString(self.search.text())
+        self._update_status()
+
+    def _update_status(self):
+        self.status.setText(f"{self.proxy.rowCount()} / {self.model.rowCount()} icons")
+
+    def _on_clicked(self, index):
+        row = self.proxy.mapToSource(index).row()
+        entry = self.model.data(self.model.index(row), IconListModel.EntryRole)
+        self.iconSelected.emit(entry.key if entry.source == 'resource' else entry.name,
+                               self.model.icon(row))
+
+    def _on_first_paint(self):
+        self.first_paint_ms = 1e3 * (time.perf_counter() - self._t0)
+        self.firstPainted.emit(self.first_paint_ms)
+
+    def selected_icon(self):
+        """(name, QIcon) of the current selection, or None."""
+        index = self.view.currentIndex()
+        if not index.isValid():
+            return None
+        row = self.proxy.mapToSource(index).row()
+        return self.model.data(self.model.index(row)), self.model.icon(row)
+
+
+# =============================================================================
+# The old way, for the time-to-first-paint comparison
+# =============================================================================
+
+class EagerIconGrid(QScrollArea):
+    """One QPushButton + icon per entry, all built up front (GUI.py's approach)."""
+
+    def __init__(self, sources=tuple(SOURCES), parent=None):
+        self._t0 = time.perf_counter()
+        super().__init__(parent)
+        self.first_paint_ms = None
+        model = IconListModel([e for s in sources for e in SOURCES[s]()], self.style())
+        self.count = model.rowCount()
+
+        inner = QWidget()
+        layout = QGridLayout(inner)
+        for n in range(self.count):
+            btn = QPushButton(model.data(model.index(n)))
+            btn.setIcon(model.icon(n))
+            layout.addWidget(btn, n // 4, n % 4)
+        self.setWidget(inner)
+        self.setWidgetResizable(True)
+
+        self._paint_filter = _FirstPaintFilter(self._on_first_paint, self)
+        inner.installEventFilter(self._paint_filter)
+
+    def _on_first_paint(self):
+        self.first_paint_ms = 1e3 * (time.perf_counter() - self._t0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Virtualized icon picker.')
+    parser.add_argument('--sources', nargs='+', choices=tuple(SOURCES),
+                        default=list(SOURCES))
+    parser.add_argument('--eager', action='store_true',
+                        help='old one-button-per-icon grid, for comparison')
+    parser.add_argument('--exit-after-paint', action='store_true',
+                        help='print time-to-first-paint and quit')
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    t0 = time.perf_counter()
+    w = EagerIconGrid(args.sources) if args.eager else IconPicker(args.sources)
+    w.setWindowTitle('Icons')
+    w.resize(900, 600)
+    w.show()
+
+    def report():
+        if w.first_paint_ms is None:            # not painted yet
+            QTimer.singleShot(10, report)
+            return
+        if isinstance(w, IconPicker):
+            total, rendered = w.model.rowCount(), w.model.renders
+        else:
+            total = rendered = w.count
+        print(f"{type(w).__name__}: first paint after {w.first_paint_ms:.1f} ms "
+              f"({1e3 * (time.perf_counter() - t0):.1f} ms to report), "
+              f"icons rendered: {rendered} of {total}")
+        if args.exit_after_paint:
+            app.quit()
+
+    if isinstance(w, IconPicker):
+        w.iconSelected.connect(lambda name, icon: print(name))
+    QTimer.singleShot(0, report)
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
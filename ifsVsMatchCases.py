@@ -3,13 +3,27 @@ I was curious about how the computational costs of using if-elif-else logic vs.
 match + case logic compare for when you want a single function that can execute
 several different approaches based on an input flag.
 
-BLUF: For small numbers of conditions, the difference is negligible. For larger
-numbers of conditions, match/case logic will be faster bc it can jump straight
-to the right approach, whereas if-elif-else logic has to evaluate each and every
-conditional until it finds one that it meets.
+ORIGINAL GUESS: match/case would be faster for many conditions bc it can jump
+straight to the right approach, whereas if-elif-else logic has to evaluate each
+and every conditional until it finds one that it meets.
+
+BLUF (measured -- run `python ifsVsMatchCases.py`, scaling suite at the bottom):
+match/case does NOT jump straight to the right case. CPython compiles literal
+patterns into the same compare-and-branch sequence as if-elif-else, so both
+cost O(position of the matching case) and stay within noise of each other at
+every N from 2 to 1000, for int, str and Enum keys. Only the first case is
+cheap. Past ~5 cases (worst or random position) a dict of callables -- or list
+indexing for dense int keys -- wins and stays flat out to 1000 cases. Enum keys
+roughly double the per-case cost of both chains (every `Flag.X` is an
+attribute lookup).
 """
 
-import timeit
+import argparse
+import json
+import random
+from enum import Enum
+
+from bench import benchmark, run
 
 def if_elif_test(x):
     if x == 1:
@@ -41,10 +55,236 @@ def match_case_test(x):
             return "Invalid"
 
 # Timing the functions
-x_value = 5  # Change this to test different cases
+X_VALUES = [1, 3, 5, 6]  # first case, middle case, last case, fall-through
+
+@benchmark(params={'x': X_VALUES})
+def bench_if_elif(x):
+    if_elif_test(x)
+
+@benchmark(params={'x': X_VALUES})
+def bench_match_case(x):
+    match_case_test(x)
+
+
+#%% SCALING SUITE: N generated cases, 4 dispatch strategies, 3 key types
+"""
+The 5-case test above can't tell us how things SCALE, and flag-driven
+dispatch sits in our hot loops. So below, dispatchers with N cases are
+generated as source code and exec()'d -- exactly what you'd get writing
+them out by hand:
+
+    if_elif      if x == k0: return _h0()  elif x == k1: return _h1() ...
+    match_case   match x:  case k0: return _h0()  case k1: ...
+    dict         return _table[x]()          (dict of callables)
+    list_index   return _handlers[x]()       (int keys / enum .value only)
+
+Every branch calls its own handler, so all four do the same useful work.
+
+Keys are int (0..N-1), str ('flag_0'...) or Enum members, and each timed
+call dispatches OPS keys that hit the FIRST case (best), the LAST case
+(worst) or uniformly RANDOM cases.
+
+    python ifsVsMatchCases.py -o dispatch.json       # run + crossover table
+    python ifsVsMatchCases.py --report dispatch.json # table from saved run
+"""
+
+N_VALUES = [2, 5, 10, 20, 50, 100, 200, 500, 1000]
+KEY_KINDS = ['int', 'str', 'enum']
+POSITIONS = ['best', 'worst', 'random']
+STRATEGIES = ['if_elif', 'match_case', 'dict', 'list_index']
+OPS = 100   # dispatches per timed call
+
+
+def make_keys(kind, n):
+    """N distinct keys of the given kind, plus any names the source needs."""
+    if kind == 'int':
+        return list(range(n)), [repr(i) for i in range(n)], {}
+    if kind == 'str':
+        keys = [f'flag_{i}' for i in range(n)]
+        return keys, [repr(k) for k in keys], {}
+    if kind == 'enum':
+        Flag = Enum('Flag', [(f'F{i}', i) for i in range(n)])
+        return list(Flag), [f'Flag.F{i}' for i in range(n)], {'Flag': Flag}
+    raise ValueError(f"Unknown key kind '{kind}'")
+
+
+def make_dispatcher(strategy, kind, n):
+    """
+    Generate and compile one N-case dispatcher.
+
+    Returns:
+        tuple: (dispatch function, list of its keys in case order)
+    """
+    keys, literals, namespace = make_keys(kind, n)
+    handlers = [(lambda i=i: i) for i in range(n)]
+    namespace.update({f'_h{i}': h for i, h in enumerate(handlers)})
+
+    if strategy == 'if_elif':
+        lines = ['def dispatch(x):']
+        for i, lit in enumerate(literals):
+            lines.append(f"    {'if' if i == 0 else 'elif'} x == {lit}:")
+            lines.append(f'        return _h{i}()')
+        lines.append('    return None')
+    elif strategy == 'match_case':
+        lines = ['def dispatch(x):', '    match x:']
+        for i, lit in enumerate(literals):
+            lines.append(f'        case {lit}:')
+            lines.append(f'            return _h{i}()')
+        lines.append('        case _:')
+        lines.append('            return None')
+    elif strategy == 'dict':
+        namespace['_table'] = dict(zip(keys, handlers))
+        lines = ['def dispatch(x, _table=_table):', '    return _table[x]()']
+    elif strategy == 'list_index':
+        if kind == 'str':
+            raise ValueError("list_index needs int or enum keys")
+        index = 'x.value' if kind == 'enum' else 'x'
+        namespace['_handlers'] = handlers
+        lines = ['def dispatch(x, _handlers=_handlers):',
+                 f'    return _handlers[{index}]()']
+    else:
+        raise ValueError(f"Unknown strategy '{strategy}'")
+
+    exec('\n'.join(lines), namespace)
+    return namespace['dispatch'], keys
+
 
-if_time = timeit.timeit(lambda: if_elif_test(x_value), number=1000000)
-match_time = timeit.timeit(lambda: match_case_test(x_value), number=1000000)
+def _setup_dispatch(strategy, key, n, position):
+    dispatch, keys = make_dispatcher(strategy, key, n)
+    if position == 'best':
+        batch = [keys[0]] * OPS
+    elif position == 'worst':
+        batch = [keys[-1]] * OPS
+    else:
+        batch = random.Random(n).choices(keys, k=OPS)
+    return dispatch, batch
+
+
+@benchmark(params={'strategy': STRATEGIES[:3], 'key': KEY_KINDS,
+                   'n': N_VALUES, 'position': POSITIONS},
+           setup=_setup_dispatch, ops=OPS)
+def bench_dispatch(dispatch, batch):
+    for x in batch:
+        dispatch(x)
+
+
+@benchmark(name='bench_dispatch',
+           params={'strategy': ['list_index'], 'key': ['int', 'enum'],
+                   'n': N_VALUES, 'position': POSITIONS},
+           setup=_setup_dispatch, ops=OPS)
+def bench_dispatch_list_index(dispatch, batch):
+    for x in batch:
+        dispatch(x)
+
+
+def _medians(report):
+    """{(key, position, strategy, n): result} for the scaling-suite results."""
+    out = {}
+    for r in report['results'].values():
+        p = r['params']
+        if 'strategy' in p:
+            out[(p['key'], p['position'], p['strategy'], p['n'])] = r
+    return out
+
+
+def _faster(a, b):
+    """-1 if a is faster than b, +1 if slower, 0 if their 95% CIs overlap."""
+    if a['ci_high'] < b['ci_low']:
+        return -1
+    if a['ci_low'] > b['ci_high']:
+        return 1
+    return 0
+
+
+def crossovers(report):
+    """
+    Find the N where one strategy overtakes another.
 
-print(f"if-elif-else time: {if_time:.6f} seconds")
-print(f"match-case time: {match_time:.6f} seconds")
\ No newline at end of file
+    For every (key kind, position) and every pair of strategies, the sizes
+    are walked in order. Differences whose confidence intervals overlap
+    count as ties. The crossover is the smallest N from which the strategy
+    that was faster at small N is slower at every larger size.
+
+    Args:
+        report (dict): Output of bench.run() / a saved JSON result file.
+
+    Returns:
+        list[dict]: rows with "key", "position", "faster", "slower" and
+            "n" (the crossover size; None if it never crosses, 'tie' if the
+            two are never distinguishable).
+    """
+    results = _medians(report)
+    rows = []
+    for key in KEY_KINDS:
+        for position in POSITIONS:
+            for i, a in enumerate(STRATEGIES):
+                for b in STRATEGIES[i + 1:]:
+                    sizes = [n for n in N_VALUES
+                             if (key, position, a, n) in results
+                             and (key, position, b, n) in results]
+                    if not sizes:
+                        continue
+                    status = [_faster(results[key, position, a, n],
+                                      results[key, position, b, n]) for n in sizes]
+                    initial = next((s for s in status if s), 0)
+                    if initial == 0:
+                        rows.append({'key': key, 'position': position,
+                                     'faster': a, 'slower': b, 'n': 'tie'})
+                        continue
+
+                    first, second = (a, b) if initial < 0 else (b, a)
+                    flip = None
+                    for j in range(len(sizes) - 1, -1, -1):
+                        if status[j] != -initial:
+                            break
+                        flip = sizes[j]
+                    rows.append({'key': key, 'position': position,
+                                 'faster': first, 'slower': second, 'n': flip})
+    return rows
+
+
+def print_tables(report):
+    """ns per dispatch vs N, one table per (key kind, position)."""
+    results = _medians(report)
+    for key in KEY_KINDS:
+        for position in POSITIONS:
+            print(f"\n{key} keys, {position} case [ns per dispatch]")
+            print(f"{'N':>6}" + ''.join(f'{s:>12}' for s in STRATEGIES))
+            for n in N_VALUES:
+                cells = [results.get((key, position, s, n)) for s in STRATEGIES]
+                if not any(cells):
+                    continue
+                print(f'{n:>6}' + ''.join(
+                    f"{1e9 * c['median']:>12.1f}" if c else f"{'-':>12}"
+                    for c in cells))
+
+
+def print_crossovers(report):
+    print(f"\n{'key':<5} {'position':<8} {'faster at small N':<18} "
+          f"{'overtaken by':<14} {'from N':>7}")
+    for row in crossovers(report):
+        n = 'never' if row['n'] is None else str(row['n'])
+        print(f"{row['key']:<5} {row['position']:<8} {row['faster']:<18} "
+              f"{row['slower']:<14} {n:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='if/elif vs match vs dict/list dispatch.')
+    parser.add_argument('-o', '--output', help='save results to this JSON file')
+    parser.add_argument('-k', '--keyword', default='bench_dispatch',
+                        help="benchmark name filter (default: the scaling suite)")
+    parser.add_argument('--report', help='only print crossovers from a saved JSON file')
+    parser.add_argument('--quick', action='store_true',
+                        help='fewer repeats, shorter runs (rougher numbers)')
+    args = parser.parse_args()
+
+    if args.report:
+        with open(args.report) as f:
+            report = json.load(f)
+    elif args.quick:
+        report = run([__file__], args.keyword, repeats=7, target=0.01,
+                     warmup=0.01, output=args.output)
+    else:
+        report = run([__file__], args.keyword, output=args.output)
+    print_tables(report)
+    print_crossovers(report)
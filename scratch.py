@@ -5,8 +5,19 @@ Created on Tue May 27 12:10:26 2025
 
 @Description: Example class implementation
 
+    RocketEngine         -- the original example class (one __dict__ each)
+    SlottedRocketEngine  -- same interface, __slots__ instead of __dict__
+    EngineFleet          -- struct-of-arrays container for millions of engines
+
 """
 #%%
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+
 class RocketEngine:
     def __init__(self, thrust=100, propellant="RP-1", stages=1, **kwargs):
         self.thrust = thrust
@@ -19,4 +30,423 @@ class RocketEngine:
 """
 Use the following syntax to use:
 
-    from scra
\ No newline at end of file
+    from scratch import RocketEngine
+
+    engine = RocketEngine(thrust=1860, propellant="LOX/LH2", stages=2, isp=452)
+    engine.extra['isp']     # 452
+"""
+
+
+#%% SLOTTED VARIANT
+class SlottedRocketEngine:
+    """
+    RocketEngine without a per-instance __dict__.
+
+    Same constructor and attributes. `extra` is only a dict when extra
+    keyword arguments were given -- otherwise it's None, so the common case
+    doesn't pay for an empty dict per engine.
+    """
+    __slots__ = ('thrust', 'propellant', 'stages', 'extra')
+
+    def __init__(self, thrust=100, propellant="RP-1", stages=1, **kwargs):
+        self.thrust = thrust
+        self.propellant = propellant
+        self.stages = stages
+        self.extra = kwargs or None
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(thrust={self.thrust!r}, "
+                f"propellant={self.propellant!r}, stages={self.stages!r})")
+
+
+#%% STRUCT-OF-ARRAYS FLEET
+"""
+    fleet = EngineFleet.from_engines(engines)       # or EngineFleet(); .append()
+    fleet = EngineFleet.from_arrays(thrust, propellant, stages)
+
+    fleet.thrust                        # float64 column (a view, no copy)
+    fleet.propellant                    # decoded np.ndarray of str
+    hot = fleet[(fleet.thrust > 1000) & fleet.is_propellant('LOX/LH2')]
+    hot.thrust.sum(), fleet.aggregate('thrust', by='propellant', how='mean')
+
+    fleet[42]                           # EngineView: .thrust, .propellant, ...
+
+LAYOUT
+    thrust      float64 column
+    stages      int16 column
+    propellant  int32 codes into `categories` (dictionary encoding): a fleet
+                has a handful of distinct propellants, so each row stores a
+                4-byte code instead of a pointer to a string object, and
+                filtering on propellant is an integer comparison.
+    extra       side table {key: {row: value}} -- only rows that actually
+                have extra attributes cost anything.
+
+    Columns grow by doubling, so append() is amortized O(1).
+"""
+
+
+class EngineView:
+    """
+    A RocketEngine-like view of one EngineFleet row.
+
+    Reads and writes go straight to the fleet's columns; nothing is copied.
+    """
+    __slots__ = ('_fleet', '_row')
+
+    def __init__(self, fleet, row):
+        self._fleet = fleet
+        self._row = row
+
+    @property
+    def thrust(self):
+        return float(self._fleet._thrust[self._row])
+
+    @thrust.setter
+    def thrust(self, value):
+        self._fleet._thrust[self._row] = value
+
+    @property
+    def stages(self):
+        return int(self._fleet._stages[self._row])
+
+    @stages.setter
+    def stages(self, value):
+        self._fleet._stages[self._row] = value
+
+    @property
+    def propellant(self):
+        return self._fleet.categories[self._fleet._codes[self._row]]
+
+    @propellant.setter
+    def propellant(self, value):
+        self._fleet._codes[self._row] = self._fleet._encode(value)
+
+    @property
+    def extra(self):
+        return self._fleet.extra_for(self._row)
+
+    def to_engine(self, cls=RocketEngine):
+        return cls(self.thrust, self.propellant, self.stages, **self.extra)
+
+    def __repr__(self):
+        return (f"EngineView(row={self._row}, thrust={self.thrust!r}, "
+                f"propellant={self.propellant!r}, stages={self.stages!r})")
+
+
+class EngineFleet:
+    """
+    Columnar (struct-of-arrays) storage for many RocketEngine cases.
+
+    Args:
+        capacity (int, optional): Rows to preallocate. Default is 1024.
+
+    Attributes:
+        categories (list[str]): Distinct propellants; codes index into it.
+    """
+
+    def __init__(self, capacity=1024):
+        capacity = max(int(capacity), 1)
+        self._thrust = np.empty(capacity, dtype=np.float64)
+        self._stages = np.empty(capacity, dtype=np.int16)
+        self._codes = np.empty(capacity, dtype=np.int32)
+        self._n = 0
+        self.categories = []
+        self._category_index = {}
+        self._extra = {}
+
+    # --- construction --------------------------------------------------------
+
+    @classmethod
+    def from_arrays(cls, thrust, propellant, stages, extra=None):
+        """
+        Build a fleet from whole columns.
+
+        Args:
+            thrust (array_like): Thrust per engine.
+            propellant (array_like): Propellant name per engine.
+            stages (array_like): Stage count per engine.
+            extra (dict, optional): {key: {row: value}} side table.
+        """
+        thrust = np.asarray(thrust, dtype=np.float64)
+        fleet = cls(capacity=len(thrust))
+        n = len(thrust)
+        fleet._thrust[:n] = thrust
+        fleet._stages[:n] = stages
+        names, codes = np.unique(np.asarray(propellant, dtype=str), return_inverse=True)
+        remap = np.array([fleet._encode(str(name)) for name in names], dtype=np.int32)
+        fleet._codes[:n] = remap[codes.reshape(-1)]
+        fleet._n = n
+        for key, rows in (extra or {}).items():
+            fleet._extra[key] = dict(rows)
+        return fleet
+
+    @classmethod
+    def from_engines(cls, engines):
+        """Build a fleet from RocketEngine-like objects (anything with the same attributes)."""
+        engines = list(engines)
+        fleet = cls.from_arrays([e.thrust for e in engines],
+                                [e.propellant for e in engines],
+                                [e.stages for e in engines])
+        for row, engine in enumerate(engines):
+            for key, value in (engine.extra or {}).items():
+                fleet._extra.setdefault(key, {})[row] = value
+        return fleet
+
+    def append(self, thrust=100, propellant="RP-1", stages=1, **kwargs):
+        """Add one engine (same signature as RocketEngine). Returns its row."""
+        if self._n == len(self._thrust):
+            self._grow(2 * len(self._thrust))
+        row = self._n
+        self._thrust[row] = thrust
+        self._stages[row] = stages
+        self._codes[row] = self._encode(propellant)
+        for key, value in kwargs.items():
+            self._extra.setdefault(key, {})[row] = value
+        self._n += 1
+        return row
+
+    def _grow(self, capacity):
+        for name in ('_thrust', '_stages', '_codes'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+
+    def _encode(self, propellant):
+        code = self._category_index.get(propellant)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(propellant)
+            self._category_index[propellant] = code
+        return code
+
+    # --- columns -------------------------------------------------------------
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def thrust(self):
+        return self._thrust[:self._n]
+
+    @property
+    def stages(self):
+        return self._stages[:self._n]
+
+    @property
+    def propellant_codes(self):
+        return self._codes[:self._n]
+
+    @property
+    def propellant(self):
+        """Decoded propellant column (allocates; prefer is_propellant() for filters)."""
+        return np.asarray(self.categories, dtype=object)[self.propellant_codes]
+
+    def extra_for(self, row):
+        """Extra attributes of one row, as a dict."""
+        return {key: rows[row] for key, rows in self._extra.items() if row in rows}
+
+    def extra_column(self, key, default=np.nan):
+        """One extra attribute as a dense float column (`default` where missing)."""
+        col = np.full(self._n, default, dtype=np.float64)
+        rows = self._extra.get(key, {})
+        if rows:
+            col[np.fromiter(rows.keys(), dtype=np.int64, count=len(rows))] = \
+                np.fromiter(rows.values(), dtype=np.float64, count=len(rows))
+        return col
+
+    # --- filters and aggregates ----------------------------------------------
+
+    def is_propellant(self, *names):
+        """Boolean mask of rows using any of `names` (an integer compare per row)."""
+        codes = [self._category_index[n] for n in names if n in self._category_index]
+        if len(codes) == 1:
+            return self.propellant_codes == codes[0]
+        return np.isin(self.propellant_codes, codes)
+
+    def __getitem__(self, index):
+        """
+        fleet[i] -> EngineView; fleet[mask | slice | index array] -> new fleet.
+        """
+        if isinstance(index, (int, np.integer)):
+            row = int(index) + self._n if index < 0 else int(index)
+            if not 0 <= row < self._n:
+                raise IndexError(f"row {index} out of range for {self._n} engines")
+            return EngineView(self, row)
+        return self.take(np.arange(self._n)[index])
+
+    def __iter__(self):
+        return (EngineView(self, row) for row in range(self._n))
+
+    def take(self, rows):
+        """New fleet holding `rows` (same category codes, extras re-indexed)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        out = EngineFleet(capacity=len(rows))
+        n = len(rows)
+        out._thrust[:n] = self._thrust[rows]
+        out._stages[:n] = self._stages[rows]
+        out._codes[:n] = self._codes[rows]
+        out._n = n
+        out.categories = list(self.categories)
+        out._category_index = dict(self._category_index)
+        if self._extra:
+            new_row = {int(old): new for new, old in enumerate(rows)}
+            for key, values in self._extra.items():
+                kept = {new_row[r]: v for r, v in values.items() if r in new_row}
+                if kept:
+                    out._extra[key] = kept
+        return out
+
+    def aggregate(self, column, by='propellant', how='sum'):
+        """
+        Group-by aggregate of `column` ('thrust' or 'stages').
+
+        Args:
+            column (str): Column to aggregate.
+            by (str, optional): 'propellant' or 'stages'. Default is 'propellant'.
+            how (str, optional): 'sum', 'mean', 'count', 'min' or 'max'.
+
+        Returns:
+            dict: group -> aggregate (groups with no rows are left out).
+        """
+        values = getattr(self, column).astype(np.float64)
+        if by == 'propellant':
+            keys, labels = self.propellant_codes, self.categories
+            n_groups = len(labels)
+        elif by == 'stages':
+            labels, keys = np.unique(self.stages, return_inverse=True)
+            labels = [int(s) for s in labels]
+            n_groups = len(labels)
+        else:
+            raise ValueError(f"Can't group by '{by}' (expected 'propellant' or 'stages')")
+
+        count = np.bincount(keys, minlength=n_groups)
+        if how == 'count':
+            result = count
+        elif how in ('sum', 'mean'):
+            result = np.bincount(keys, weights=values, minlength=n_groups)
+            if how == 'mean':
+                result = result / np.maximum(count, 1)
+        elif how in ('min', 'max'):
+            fill = np.inf if how == 'min' else -np.inf
+            result = np.full(n_groups, fill)
+            (np.minimum if how == 'min' else np.maximum).at(result, keys, values)
+        else:
+            raise ValueError(f"Unknown aggregate '{how}'")
+        return {labels[g]: result[g].item() for g in range(n_groups) if count[g]}
+
+    def to_engines(self, cls=RocketEngine):
+        """Materialize the fleet back into a list of objects."""
+        return [view.to_engine(cls) for view in self]
+
+    @property
+    def nbytes(self):
+        """Bytes held by the used part of the columns (extras not included)."""
+        return self.thrust.nbytes + self.stages.nbytes + self.propellant_codes.nbytes
+
+
+#%% MEMORY / THROUGHPUT BENCHMARK  (python scratch.py --n 1000000)
+PROPELLANTS = ("RP-1", "LOX/LH2", "LOX/CH4", "NTO/MMH", "APCP")
+
+
+def _random_columns(n, seed=0, extra_fraction=0.01):
+    rng = np.random.default_rng(seed)
+    thrust = rng.uniform(10.0, 2000.0, n)
+    propellant = rng.choice(PROPELLANTS, n)
+    stages = rng.integers(1, 4, n)
+    extra_rows = np.flatnonzero(rng.random(n) < extra_fraction)
+    isp = {int(r): float(v) for r, v in zip(extra_rows, rng.uniform(250, 460, len(extra_rows)))}
+    return thrust, propellant, stages, isp
+
+
+def _build_objects(cls, thrust, propellant, stages, isp):
+    return [cls(t, p, s, isp=isp[i]) if i in isp else cls(t, p, s)
+            for i, (t, p, s) in enumerate(zip(thrust.tolist(), propellant.tolist(),
+                                               stages.tolist()))]
+
+
+def _traced(build):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    obj = build()
+    elapsed = time.perf_counter() - t0
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size, elapsed
+
+
+def _query_objects(engines):
+    """Filter + aggregate, one object at a time."""
+    total = count = 0
+    for e in engines:
+        if e.propellant == "LOX/LH2" and e.thrust > 1000.0 and e.stages >= 2:
+            total += e.thrust
+            count += 1
+    return total / max(count, 1)
+
+
+def _query_fleet(fleet):
+    """The same query, vectorized."""
+    mask = fleet.is_propellant("LOX/LH2") & (fleet.thrust > 1000.0) & (fleet.stages >= 2)
+    hits = fleet.thrust[mask]
+    return hits.sum() / max(len(hits), 1)
+
+
+def benchmark(n=1_000_000, repeats=5, seed=0):
+    """
+    Memory and query throughput: list[RocketEngine] vs list[SlottedRocketEngine]
+    vs EngineFleet, for n engines (1% of them carrying an extra 'isp').
+
+    Returns:
+        dict: per layout, "bytes", "build" [s], "query" [s] (best of
+            `repeats`) and "result" (the query answer, for cross-checking).
+    """
+    thrust, propellant, stages, isp = _random_columns(n, seed)
+    layouts = {
+        'RocketEngine': (lambda: _build_objects(RocketEngine, thrust, propellant, stages, isp),
+                         _query_objects),
+        'SlottedRocketEngine': (lambda: _build_objects(SlottedRocketEngine, thrust,
+                                                       propellant, stages, isp),
+                                _query_objects),
+        'EngineFleet': (lambda: EngineFleet.from_arrays(thrust, propellant, stages,
+                                                        extra={'isp': isp}),
+                        _query_fleet),
+    }
+
+    out = {}
+    for label, (build, query) in layouts.items():
+        data, size, build_time = _traced(build)
+        times = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            result = query(data)
+            times.append(time.perf_counter() - t0)
+        out[label] = {'bytes': size, 'build': build_time, 'query': min(times),
+                      'result': float(result)}
+        del data
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Memory and query throughput of RocketEngine storage layouts.')
+    parser.add_argument('--n', type=int, default=1_000_000, help='number of engines')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    out = benchmark(args.n, args.repeats, args.seed)
+    base = out['RocketEngine']
+    print(f"\n{args.n:,d} engines\n")
+    print(f"{'layout':<20} {'memory [MB]':>12} {'B/engine':>9} {'build [s]':>10} "
+          f"{'query [ms]':>11} {'speedup':>8}")
+    for label, r in out.items():
+        print(f"{label:<20} {r['bytes'] / 2**20:>12.1f} {r['bytes'] / args.n:>9.1f} "
+              f"{r['build']:>10.3f} {1e3 * r['query']:>11.2f} "
+              f"{base['query'] / r['query']:>7.1f}x")
+    if not np.isclose(base['result'], out['EngineFleet']['result']):
+        print("WARNING: object and fleet queries disagree")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,10 +14,46 @@ Created on:                                        Tue Jul 22 09:08:24 2025
 
 """
 
-import eel
+import argparse
+import os
+import sys
 
-# Initialize Eel with the 'web' folder containing frontend files
-eel.init('web')
+import eel
 
-# Start the Eel app, opening index.html in a browser window
-eel.start('index.html', size=(800, 600))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from eel_assets import use_built_assets  # noqa: E402  (repo root)
+
+parser = argparse.ArgumentParser(description='Starfield background Eel app.')
+parser.add_argument('--stars', type=int, default=None,
+                    help='number of stars (up to 100000)')
+parser.add_argument('--fps', action='store_true', help='show the FPS overlay')
+parser.add_argument('--bench', action='store_true',
+                    help='run web/bench.html in headless Chrome and print results')
+args = parser.parse_args()
+
+# Initialize Eel with the 'web' folder containing frontend files (or its
+# minified/precompressed build in dist/, if that's up to date)
+web_root, app = use_built_assets('web')
+eel.init(web_root)
+
+
+@eel.expose
+def report_benchmark(results):
+    """Called by bench.html with one dict per benchmark case."""
+    print(f"\n{'case':<18} {'renderer':<8} {'fps':>5} {'mean ms':>9} {'p95 ms':>8} "
+          f"{'max ms':>8} {'mouse ms/s':>12}")
+    for r in results:
+        print(f"{r['case']:<18} {r['renderer']:<8} {r['fps']:>5.0f} "
+              f"{r['frame_mean_ms']:>9.2f} {r['frame_p95_ms']:>8.2f} "
+              f"{r['frame_max_ms']:>8.1f} {r['mouse_handler_ms_per_s']:>12.1f}")
+
+
+if args.bench:
+    # The page closes itself after reporting; Eel exits once it's gone.
+    eel.start('bench.html', size=(1280, 800), mode='chrome', app=app,
+              cmdline_args=['--headless=new', '--enable-unsafe-swiftshader'])
+else:
+    query = '&'.join(f'{k}={v}' for k, v in (('stars', args.stars), ('fps', int(args.fps)))
+                     if v)
+    # Start the Eel app, opening index.html in a browser window
+    eel.start(f'index.html?{query}' if query else 'index.html', size=(800, 600), app=app)
@@ -1,11 +1,372 @@
-document.addEventListener('mousemove', (e) => {
-    const stars = document.querySelectorAll('#stars, #stars2, #stars3');
-    const moveX = (e.clientX - window.innerWidth / 2) * 0.02;
-    const moveY = (e.clientY - window.innerHeight / 2) * 0.02;
-
-    // TODO: some thing
-    
-    stars.forEach((star, index) => {
-        star.style.transform = `translate(${moveX * (index + 1)}px, ${moveY * (index + 1)}px)`;
+// Starfield background: WebGL (Canvas 2D fallback), up to 10^5 stars.
+//
+// The old version restyled three box-shadow <div>s from every mousemove
+// event, re-querying the DOM each time. Here:
+//   - mousemove only records the pointer position; parallax is applied
+//     once per requestAnimationFrame, however fast the mouse reports.
+//   - every DOM node is looked up once, at startup.
+//   - WebGL: star positions live in one static vertex buffer per layer;
+//     a frame is one draw call per layer and TILE-sized tile of the window
+//     (3 on screens up to TILE px) with the drift + parallax offset as a
+//     uniform, so the cost doesn't grow with the star count on the CPU.
+//   - Canvas 2D fallback: each layer is pre-rendered into a tile once and
+//     a frame is a few drawImage() calls.
+//
+// Options come from the page URL (index.html?stars=50000&fps=1) or
+// window.STARFIELD_OPTIONS; press "F" to toggle the FPS overlay.
+
+(function () {
+    'use strict';
+
+    const MAX_STARS = 100000;
+    const TILE = 2000;                  // px; the pattern repeats every TILE
+
+    // The three CSS layers: star size, drift period (s per TILE) and
+    // parallax strength (px per px of pointer offset from the centre).
+    const LAYERS = [
+        { size: 1, period: 450, parallax: 0.02, share: 0.70 },
+        { size: 2, period: 600, parallax: 0.04, share: 0.20 },
+        { size: 3, period: 750, parallax: 0.06, share: 0.10 },
+    ];
+
+    const DEFAULTS = {
+        stars: 1400,                    // ~ the old stylesheet (700 + 200 + 100, x2)
+        renderer: 'auto',               // 'webgl' | '2d' | 'auto'
+        fps: false,                     // show the FPS / frame-time overlay
+        seed: 1,
+    };
+
+    function readOptions() {
+        const opts = Object.assign({}, DEFAULTS, window.STARFIELD_OPTIONS || {});
+        const params = new URLSearchParams(window.location.search);
+        if (params.has('stars')) opts.stars = parseInt(params.get('stars'), 10);
+        if (params.has('renderer')) opts.renderer = params.get('renderer');
+        if (params.has('fps')) opts.fps = params.get('fps') !== '0';
+        opts.stars = Math.max(0, Math.min(MAX_STARS, opts.stars | 0));
+        return opts;
+    }
+
+    // Small deterministic PRNG so a given seed always draws the same sky.
+    function mulberry32(seed) {
+        return function () {
+            seed |= 0;
+            seed = (seed + 0x6D2B79F5) | 0;
+            let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+            t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+            return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+        };
+    }
+
+    function makeLayers(count, seed) {
+        const rand = mulberry32(seed);
+        return LAYERS.map((layer) => {
+            const n = Math.round(count * layer.share);
+            const xy = new Float32Array(2 * n);
+            for (let i = 0; i < xy.length; i++) xy[i] = rand() * TILE;
+            return Object.assign({ n, xy }, layer);
+        });
+    }
+
+    // -------------------------------------------------------------------------
+    // Renderers
+    // -------------------------------------------------------------------------
+
+    const VERTEX_SHADER = `
+        attribute vec2 a_pos;
+        uniform vec2 u_offset;
+        uniform vec2 u_tile;
+        uniform vec2 u_viewport;
+        uniform float u_size;
+        void main() {
+            vec2 p = mod(a_pos + u_offset, ${TILE}.0) + u_tile;
+            gl_Position = vec4(p / u_viewport * vec2(2.0, -2.0) + vec2(-1.0, 1.0), 0.0, 1.0);
+            gl_PointSize = u_size;
+        }`;
+
+    const FRAGMENT_SHADER = `
+        precision mediump float;
+        void main() { gl_FragColor = vec4(1.0); }`;
+
+    function compile(gl, type, source) {
+        const shader = gl.createShader(type);
+        gl.shaderSource(shader, source);
+        gl.compileShader(shader);
+        if (!gl.getShaderParameter(shader, gl.COMPILE_STATUS)) {
+            throw new Error(gl.getShaderInfoLog(shader));
+        }
+        return shader;
+    }
+
+    class WebGLRenderer {
+        constructor(canvas, layers) {
+            const gl = canvas.getContext('webgl', { alpha: true, antialias: false });
+            if (!gl) throw new Error('WebGL not available');
+            this.name = 'webgl';
+            this.gl = gl;
+            this.canvas = canvas;
+
+            const program = gl.createProgram();
+            gl.attachShader(program, compile(gl, gl.VERTEX_SHADER, VERTEX_SHADER));
+            gl.attachShader(program, compile(gl, gl.FRAGMENT_SHADER, FRAGMENT_SHADER));
+            gl.linkProgram(program);
+            gl.useProgram(program);
+
+            this.loc = {
+                pos: gl.getAttribLocation(program, 'a_pos'),
+                offset: gl.getUniformLocation(program, 'u_offset'),
+                tile: gl.getUniformLocation(program, 'u_tile'),
+                viewport: gl.getUniformLocation(program, 'u_viewport'),
+                size: gl.getUniformLocation(program, 'u_size'),
+            };
+            gl.enableVertexAttribArray(this.loc.pos);
+
+            // Uploaded once; nothing per star crosses to the GPU per frame.
+            this.layers = layers.map((layer) => {
+                const buffer = gl.createBuffer();
+                gl.bindBuffer(gl.ARRAY_BUFFER, buffer);
+                gl.bufferData(gl.ARRAY_BUFFER, layer.xy, gl.STATIC_DRAW);
+                return { buffer, n: layer.n, size: layer.size };
+            });
+            gl.clearColor(0, 0, 0, 0);
+        }
+
+        resize(width, height, dpr) {
+            this.gl.viewport(0, 0, width * dpr, height * dpr);
+            this.gl.uniform2f(this.loc.viewport, width, height);
+            this.dpr = dpr;
+            this.tilesX = Math.ceil(width / TILE);
+            this.tilesY = Math.ceil(height / TILE);
+        }
+
+        release() {
+            // Browsers cap live WebGL contexts; give this one back now.
+            const ext = this.gl.getExtension('WEBGL_lose_context');
+            if (ext) ext.loseContext();
+        }
+
+        draw(offsets) {
+            const gl = this.gl;
+            gl.clear(gl.COLOR_BUFFER_BIT);
+            this.layers.forEach((layer, i) => {
+                gl.bindBuffer(gl.ARRAY_BUFFER, layer.buffer);
+                gl.vertexAttribPointer(this.loc.pos, 2, gl.FLOAT, false, 0, 0);
+                gl.uniform2f(this.loc.offset, offsets[i].x, offsets[i].y);
+                gl.uniform1f(this.loc.size, layer.size * this.dpr);
+                // The wrapped pattern covers one TILE square; repeat it like
+                // the 2D renderer does for windows larger than that.
+                for (let tx = 0; tx < this.tilesX; tx++) {
+                    for (let ty = 0; ty < this.tilesY; ty++) {
+                        gl.uniform2f(this.loc.tile, tx * TILE, ty * TILE);
+                        gl.drawArrays(gl.POINTS, 0, layer.n);
+                    }
+                }
+            });
+        }
+    }
+
+    class Canvas2DRenderer {
+        constructor(canvas, layers) {
+            this.name = '2d';
+            this.ctx = canvas.getContext('2d');
+            // One pre-rendered TILE x TILE sprite sheet per layer.
+            this.tiles = layers.map((layer) => {
+                const tile = document.createElement('canvas');
+                tile.width = tile.height = TILE;
+                const ctx = tile.getContext('2d');
+                ctx.fillStyle = '#FFF';
+                for (let i = 0; i < layer.n; i++) {
+                    ctx.fillRect(layer.xy[2 * i], layer.xy[2 * i + 1], layer.size, layer.size);
+                }
+                return tile;
+            });
+        }
+
+        resize(width, height, dpr) {
+            this.width = width;
+            this.height = height;
+            this.ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+        }
+
+        draw(offsets) {
+            const ctx = this.ctx;
+            ctx.clearRect(0, 0, this.width, this.height);
+            this.tiles.forEach((tile, i) => {
+                const ox = ((offsets[i].x % TILE) + TILE) % TILE;
+                const oy = ((offsets[i].y % TILE) + TILE) % TILE;
+                // The tile wraps: up to 4 copies cover a window <= TILE.
+                for (let x = ox - TILE; x < this.width; x += TILE) {
+                    for (let y = oy - TILE; y < this.height; y += TILE) {
+                        ctx.drawImage(tile, x, y);
+                    }
+                }
+            });
+        }
+    }
+
+    // -------------------------------------------------------------------------
+    // FPS / frame-time overlay
+    // -------------------------------------------------------------------------
+
+    class FrameStats {
+        constructor(size = 240) {
+            this.times = new Float64Array(size);
+            this.count = 0;
+            this.last = null;
+        }
+
+        // Record the interval since the previous frame...
+        frame(now) {
+            if (this.last !== null) this.add(now - this.last);
+            this.last = now;
+        }
+
+        // ...or any other per-frame duration [ms].
+        add(ms) {
+            this.times[this.count % this.times.length] = ms;
+            this.count++;
+        }
+
+        summary() {
+            const n = Math.min(this.count, this.times.length);
+            if (n === 0) return { fps: 0, mean: 0, p95: 0, max: 0, frames: 0 };
+            const sorted = Array.from(this.times.subarray(0, n)).sort((a, b) => a - b);
+            const mean = sorted.reduce((a, b) => a + b, 0) / n;
+            return {
+                fps: 1000 / mean,
+                mean,
+                p95: sorted[Math.min(n - 1, Math.floor(0.95 * n))],
+                max: sorted[n - 1],
+                frames: this.count,
+            };
+        }
+    }
+
+    // -------------------------------------------------------------------------
+    // Starfield
+    // -------------------------------------------------------------------------
+
+    class Starfield {
+        constructor(canvas, options = {}) {
+            this.options = Object.assign({}, DEFAULTS, options);
+            this.canvas = canvas;
+            this.layers = makeLayers(this.options.stars, this.options.seed);
+            this.renderer = this._makeRenderer();
+            this.stats = new FrameStats();
+            this.overlay = null;
+            this.pointer = { x: 0, y: 0 };          // offset from the centre
+            this.offsets = LAYERS.map(() => ({ x: 0, y: 0 }));
+            this.work = new FrameStats();           // CPU time spent per frame
+            this._frame = this._frame.bind(this);
+            this._raf = null;
+            this._t0 = null;
+            this._lastOverlay = 0;
+
+            this._onResize = () => this.resize();
+            this._onMove = (e) => {
+                // No DOM access here: just remember where the pointer is.
+                this.pointer.x = e.clientX - this.width / 2;
+                this.pointer.y = e.clientY - this.height / 2;
+            };
+            window.addEventListener('resize', this._onResize);
+            window.addEventListener('mousemove', this._onMove, { passive: true });
+            this.resize();
+            if (this.options.fps) this.showOverlay(true);
+        }
+
+        _makeRenderer() {
+            const kind = this.options.renderer;
+            if (kind !== '2d') {
+                try {
+                    return new WebGLRenderer(this.canvas, this.layers);
+                } catch (err) {
+                    if (kind === 'webgl') throw err;
+                }
+            }
+            return new Canvas2DRenderer(this.canvas, this.layers);
+        }
+
+        resize() {
+            const dpr = window.devicePixelRatio || 1;
+            this.width = this.canvas.clientWidth || window.innerWidth;
+            this.height = this.canvas.clientHeight || window.innerHeight;
+            this.canvas.width = Math.round(this.width * dpr);
+            this.canvas.height = Math.round(this.height * dpr);
+            this.renderer.resize(this.width, this.height, dpr);
+        }
+
+        start() {
+            if (this._raf === null) this._raf = requestAnimationFrame(this._frame);
+        }
+
+        stop() {
+            if (this._raf !== null) cancelAnimationFrame(this._raf);
+            this._raf = null;
+        }
+
+        destroy() {
+            this.stop();
+            window.removeEventListener('resize', this._onResize);
+            window.removeEventListener('mousemove', this._onMove);
+            this.showOverlay(false);
+            if (this.renderer.release) this.renderer.release();
+        }
+
+        _frame(now) {
+            this._raf = requestAnimationFrame(this._frame);
+            const t0 = performance.now();
+            if (this._t0 === null) this._t0 = now;
+            const elapsed = (now - this._t0) / 1000;
+
+            // Drift upwards like the CSS animation, plus pointer parallax --
+            // computed once per frame from the latest pointer position.
+            LAYERS.forEach((layer, i) => {
+                const drift = (elapsed / layer.period) * TILE;
+                this.offsets[i].x = this.pointer.x * layer.parallax;
+                this.offsets[i].y = this.pointer.y * layer.parallax - drift;
+            });
+            this.renderer.draw(this.offsets);
+
+            this.stats.frame(now);
+            this.work.add(performance.now() - t0);
+            if (this.overlay && now - this._lastOverlay > 250) {
+                this._lastOverlay = now;
+                this._updateOverlay();
+            }
+        }
+
+        showOverlay(show) {
+            if (show && !this.overlay) {
+                this.overlay = document.createElement('div');
+                this.overlay.id = 'fps-overlay';
+                document.body.appendChild(this.overlay);
+            } else if (!show && this.overlay) {
+                this.overlay.remove();
+                this.overlay = null;
+            }
+        }
+
+        _updateOverlay() {
+            const s = this.stats.summary();
+            const w = this.work.summary();
+            this.overlay.textContent =
+                `${s.fps.toFixed(0)} fps  frame ${s.mean.toFixed(1)} ms ` +
+                `(p95 ${s.p95.toFixed(1)})  draw ${w.mean.toFixed(2)} ms\n` +
+                `${this.options.stars.toLocaleString()} stars  ${this.renderer.name}`;
+        }
+    }
+
+    window.Starfield = Starfield;
+    window.StarfieldFrameStats = FrameStats;
+
+    // Auto-start on pages with <canvas id="starfield" data-autostart>
+    document.addEventListener('DOMContentLoaded', () => {
+        const canvas = document.getElementById('starfield');
+        if (!canvas || !('autostart' in canvas.dataset)) return;
+        const field = new Starfield(canvas, readOptions());
+        field.start();
+        window.starfield = field;
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'f' || e.key === 'F') field.showOverlay(!field.overlay);
+        });
     });
-});
+})();